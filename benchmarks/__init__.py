@@ -0,0 +1,15 @@
+"""Fixed-seed benchmarks for the repository's hot paths.
+
+The benchmarked code lives in separate source trees, so put them on
+PYTHONPATH and run from the repository root:
+
+    export PYTHONPATH=projects/gaming_monte_carlo/src:shared/src:tools
+    python -m benchmarks                      # time every workload
+    python -m benchmarks --save base.json     # record a baseline
+    python -m benchmarks --compare base.json  # flag regressions
+
+Workloads live in `benchmarks.workloads`; the runner is
+`benchmarks.__main__`.
+"""
+
+from __future__ import annotations
@@ -0,0 +1,129 @@
+"""Benchmark runner.
+
+Times each workload `repeat` times (after one untimed warm-up call) and
+reports the best and median wall time. `--save` records the results as
+a JSON baseline; `--compare` flags every workload whose best time is
+more than `--threshold` slower than the baseline and exits non-zero.
+
+Baselines are only comparable on the same machine and Python version.
+"""
+
+from __future__ import annotations
+
+import argparse
+import fnmatch
+import json
+import platform
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+from benchmarks.workloads import WORKLOADS, Workload
+
+
+def time_workload(workload: Workload, repeat: int | None = None) -> dict[str, Any]:
+    """Time one workload.
+
+    Args:
+        workload: Workload to run.
+        repeat: Timed calls. None uses the workload's default.
+
+    Returns:
+        {"best": s, "median": s, "repeat": n}
+    """
+    fn = workload.setup()
+    fn()
+    n = workload.repeat if repeat is None else max(1, int(repeat))
+    times = []
+    for _ in range(n):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return {"best": min(times), "median": statistics.median(times), "repeat": n}
+
+
+def compare(
+    results: dict[str, dict[str, Any]],
+    baseline: dict[str, dict[str, Any]],
+    threshold: float,
+) -> list[str]:
+    """Names of workloads whose best time regressed past the threshold."""
+    return [
+        name
+        for name, r in results.items()
+        if name in baseline and r["best"] > baseline[name]["best"] * (1.0 + threshold)
+    ]
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the CLI parser."""
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__)
+    parser.add_argument(
+        "-k",
+        "--filter",
+        default="*",
+        help="Only run workloads whose name matches this glob (default: all).",
+    )
+    parser.add_argument("--repeat", type=int, default=None, help="Timed calls per workload.")
+    parser.add_argument("--save", type=Path, default=None, help="Write results as a baseline.")
+    parser.add_argument(
+        "--compare", type=Path, default=None, help="Baseline JSON to compare against."
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.20,
+        help="Allowed slowdown vs baseline before flagging, e.g. 0.2 = 20%% (default).",
+    )
+    parser.add_argument("--list", action="store_true", help="List workloads and exit.")
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    """CLI entrypoint. Returns the process exit code."""
+    args = build_parser().parse_args(argv)
+    selected = [w for w in WORKLOADS if fnmatch.fnmatch(w.name, args.filter)]
+    if args.list:
+        for w in selected:
+            print(w.name)
+        return 0
+
+    baseline: dict[str, dict[str, Any]] = {}
+    if args.compare is not None:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))["results"]
+
+    results: dict[str, dict[str, Any]] = {}
+    width = max((len(w.name) for w in selected), default=0)
+    for w in selected:
+        r = time_workload(w, args.repeat)
+        results[w.name] = r
+        line = (
+            f"{w.name:<{width}}  best={r['best'] * 1e3:10.2f} ms"
+            f"  median={r['median'] * 1e3:10.2f} ms"
+        )
+        if w.name in baseline:
+            ratio = r["best"] / baseline[w.name]["best"]
+            line += f"  x{ratio:.2f} vs baseline"
+        print(line, flush=True)
+
+    if args.save is not None:
+        payload = {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+            "results": results,
+        }
+        args.save.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+        print(f"saved baseline to {args.save}")
+
+    regressions = compare(results, baseline, float(args.threshold))
+    if regressions:
+        print(f"REGRESSIONS (> {args.threshold:.0%} slower): {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
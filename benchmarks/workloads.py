@@ -0,0 +1,223 @@
+"""Benchmark workloads.
+
+Every workload is a setup function that builds its inputs (untimed) and
+returns the zero-argument callable that is timed. Inputs are built from
+fixed seeds, so every run times exactly the same work.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import random
+import struct
+import tempfile
+import zlib
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+from extract_default_pak import _split_pngs
+from gaming_monte_carlo.simulation.engine import (
+    run_one_trial,
+    run_simulation,
+    run_trials_fast,
+    run_trials_vectorized,
+)
+from gaming_monte_carlo.simulation.metrics import summarize_results
+from gaming_monte_carlo.simulation.rules import ProbabilityTable, Rules
+from gaming_monte_carlo.simulation.state import TrialConfig
+from idleonlib.profiles.parsers.config_json import (
+    load_user_profile_from_config_json,
+    parse_user_profile_dict,
+)
+from idleonlib.worlds.world7.minehead.simulator import generate_grid, sample_grids
+from idleonlib.worlds.world7.minehead.stats import summarize
+from idleonlib.worlds.world7.minehead.upgrade_sets import ProfileUpgradeSet
+
+SEED = 20_240_601
+
+
+@dataclass(frozen=True, slots=True)
+class Workload:
+    """One benchmark.
+
+    Attributes:
+        name: Dotted name, grouped by area (e.g. "gaming.run_simulation").
+        setup: Builds inputs and returns the callable to time.
+        repeat: Default number of timed calls.
+    """
+
+    name: str
+    setup: Callable[[], Callable[[], object]]
+    repeat: int = 5
+
+
+def _sim_config() -> tuple[TrialConfig, Rules]:
+    return TrialConfig(snail_level=31, initial_k=8, hole_bonus=12.5), Rules()
+
+
+def _run_one_trial() -> Callable[[], object]:
+    config, rules = _sim_config()
+    table = ProbabilityTable.build(config)
+
+    def run() -> None:
+        rng = np.random.default_rng(SEED)
+        for _ in range(20_000):
+            run_one_trial(config=config, rules=rules, rng=rng, table=table)
+
+    return run
+
+
+def _run_simulation_reference() -> Callable[[], object]:
+    config, rules = _sim_config()
+    return lambda: run_simulation(config=config, rules=rules, n_trials=20_000, seed=SEED)
+
+
+def _run_simulation_fast() -> Callable[[], object]:
+    config, rules = _sim_config()
+    return lambda: run_simulation(
+        config=config, rules=rules, n_trials=200_000, seed=SEED, runner=run_trials_fast
+    )
+
+
+def _run_simulation_vectorized() -> Callable[[], object]:
+    config, rules = _sim_config()
+    return lambda: run_simulation(
+        config=config, rules=rules, n_trials=1_000_000, seed=SEED, runner=run_trials_vectorized
+    )
+
+
+def _summarize_results_columnar() -> Callable[[], object]:
+    config, rules = _sim_config()
+    results = run_simulation(
+        config=config, rules=rules, n_trials=2_000_000, seed=SEED, runner=run_trials_vectorized
+    )
+    return lambda: summarize_results(results, config, rules)
+
+
+def _summarize_results_rows() -> Callable[[], object]:
+    config, rules = _sim_config()
+    results = run_simulation(
+        config=config, rules=rules, n_trials=200_000, seed=SEED, runner=run_trials_vectorized
+    )
+    rows = list(results)
+    return lambda: summarize_results(rows, config, rules)
+
+
+def _synthetic_export(rng: random.Random) -> dict[str, object]:
+    """A large Idleon export: real Research/Holes plus bulky filler."""
+    core = [23, 4, 0, 0, 0, 0, 0, 0]
+    upgrades = [rng.randint(0, 60) for _ in range(50)]
+    upgrades[2] = 6  # grid expansion
+    research = [[rng.random() for _ in range(40)] for _ in range(7)] + [core, upgrades]
+    research += [[rng.randint(0, 999) for _ in range(200)] for _ in range(30)]
+
+    holes = [[rng.random() * 1e6 for _ in range(400)] for _ in range(20)]
+    holes[13] = [rng.randint(0, 1) for _ in range(120)]
+
+    export: dict[str, object] = {
+        "Research": json.dumps(research),
+        "Holes": json.dumps(holes),
+    }
+    for i in range(3_000):
+        export[f"Filler_{i}"] = json.dumps([rng.random() for _ in range(120)])
+    return export
+
+
+def _load_profile() -> Callable[[], object]:
+    export = _synthetic_export(random.Random(SEED))
+    # The directory is removed once the timed callable is dropped.
+    tmp = tempfile.TemporaryDirectory(prefix="bench_profile_")
+    path = Path(tmp.name) / "config.json"
+    path.write_text(json.dumps(export), encoding="utf-8")
+
+    def run() -> object:
+        return load_user_profile_from_config_json(Path(tmp.name) / "config.json")
+
+    return run
+
+
+def _minehead_upgrades() -> ProfileUpgradeSet:
+    export = _synthetic_export(random.Random(SEED))
+    profile = parse_user_profile_dict(json.loads(json.dumps(export)))
+    return ProfileUpgradeSet(profile.world7.minehead)
+
+
+def _generate_grid() -> Callable[[], object]:
+    upgrades = _minehead_upgrades()
+
+    def run() -> None:
+        rng = random.Random(SEED)
+        for _ in range(2_000):
+            generate_grid(upgrades, opponent_index=23, grid_expansion_level=6, rng=rng)
+
+    return run
+
+
+def _sample_grids() -> Callable[[], object]:
+    upgrades = _minehead_upgrades()
+    return lambda: list(
+        sample_grids(
+            upgrades,
+            opponent_index=23,
+            grid_expansion_level=6,
+            rng=random.Random(SEED),
+            trials=2_000,
+        )
+    )
+
+
+def _minehead_summarize() -> Callable[[], object]:
+    upgrades = _minehead_upgrades()
+    grids = list(
+        sample_grids(
+            upgrades,
+            opponent_index=23,
+            grid_expansion_level=6,
+            rng=random.Random(SEED),
+            trials=20_000,
+        )
+    )
+    return lambda: summarize(grids)
+
+
+def _png(rng: random.Random) -> bytes:
+    """A small, structurally valid PNG with random IDAT content."""
+
+    def chunk(ctype: bytes, data: bytes) -> bytes:
+        crc = zlib.crc32(ctype + data) & 0xFFFFFFFF
+        return struct.pack(">I", len(data)) + ctype + data + struct.pack(">I", crc)
+
+    width, height = rng.choice((16, 32, 64, 128)), rng.choice((16, 32, 64))
+    ihdr = struct.pack(">IIBBBBB", width, height, 8, 6, 0, 0, 0)
+    idat = rng.randbytes(rng.randint(200, 6_000))
+    return b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", ihdr) + chunk(b"IDAT", idat) + chunk(b"IEND", b"")
+
+
+def _split_pngs_workload() -> Callable[[], object]:
+    rng = random.Random(SEED)
+    parts = []
+    for _ in range(3_000):
+        parts.append(rng.randbytes(rng.randint(0, 64)))
+        parts.append(_png(rng))
+    payload = b"".join(parts)
+    # Sanity: the payload must parse into every PNG we packed.
+    assert len(_split_pngs(payload)) == 3_000, hashlib.sha256(payload).hexdigest()
+    return lambda: _split_pngs(payload)
+
+
+WORKLOADS: tuple[Workload, ...] = (
+    Workload("gaming.run_one_trial", _run_one_trial),
+    Workload("gaming.run_simulation.reference", _run_simulation_reference),
+    Workload("gaming.run_simulation.fast", _run_simulation_fast),
+    Workload("gaming.run_simulation.vectorized", _run_simulation_vectorized),
+    Workload("gaming.summarize_results.columnar", _summarize_results_columnar),
+    Workload("gaming.summarize_results.rows", _summarize_results_rows),
+    Workload("minehead.generate_grid", _generate_grid),
+    Workload("minehead.sample_grids", _sample_grids),
+    Workload("minehead.stats.summarize", _minehead_summarize),
+    Workload("profiles.load_user_profile_from_config_json", _load_profile),
+    Workload("tools.extract_default_pak.split_pngs", _split_pngs_workload),
+)
@@ -1,18 +1,71 @@
 from __future__ import annotations
 
 import argparse
+import cProfile
 import json
 import math
+import sys
+from dataclasses import replace
 from pathlib import Path
 from typing import Any
 
 from idleonlib.profiles.user_profile import UserProfile
 from idleonlib.worlds.world5.hole.schematics import get_schematic_bonus_from_profile
 
-from gaming_monte_carlo.simulation.engine import run_simulation
-from gaming_monte_carlo.simulation.metrics import Summary, summarize_results
+from gaming_monte_carlo.simulation.adaptive import run_simulation_adaptive
+from gaming_monte_carlo.simulation.backends import check_equivalence, engine_names, get_engine
+from gaming_monte_carlo.simulation.cache import (
+    DEFAULT_MAX_BYTES,
+    SimulationCache,
+    cached_accumulator,
+)
+from gaming_monte_carlo.simulation.checkpoint import (
+    extend_cached_accumulator,
+    run_simulation_checkpointed,
+)
+from gaming_monte_carlo.simulation.crn import PairedDelta, run_crn_sweep
+from gaming_monte_carlo.simulation.distributions import OutcomeDistributions
+from gaming_monte_carlo.simulation.engine import run_simulation_streaming
+from gaming_monte_carlo.simulation.export import TrialColumnWriter
+from gaming_monte_carlo.simulation.importance import (
+    DEFAULT_TARGET_SUCCESS,
+    run_simulation_importance,
+)
+from gaming_monte_carlo.simulation.ladder import run_ladder_sweep
+from gaming_monte_carlo.simulation.metrics import (
+    DEFAULT_BOOTSTRAP_REPLICATES,
+    Interval,
+    Summary,
+    SummaryAccumulator,
+    bootstrap_intervals,
+)
+from gaming_monte_carlo.simulation.objectives import (
+    DEFAULT_OBJECTIVES,
+    evaluate_objectives,
+    parse_objectives,
+)
+from gaming_monte_carlo.simulation.racing import race_best_k
+from gaming_monte_carlo.simulation.renewal import RenewalSummary, run_renewal
 from gaming_monte_carlo.simulation.rules import Rules
+from gaming_monte_carlo.simulation.scheduler import iter_k_sweep
+from gaming_monte_carlo.simulation.shards import ShardResult, merge_shards, run_shards_locally
 from gaming_monte_carlo.simulation.state import TrialConfig
+from gaming_monte_carlo.simulation.sweep import (
+    SweepGrid,
+    append_sweep_csv,
+    completed_cells,
+    parse_values,
+    read_sweep_table,
+    run_grid_sweep,
+    sweep_format,
+    write_sweep_table,
+)
+from gaming_monte_carlo.simulation.variance import (
+    VARIANCE_REDUCTION_MODES,
+    VarianceReducedResult,
+    run_simulation_variance_reduced,
+)
+from gaming_monte_carlo.timing import DISABLED, PhaseTimer
 
 
 def _existing_file(path_str: str) -> Path:
@@ -44,6 +97,29 @@ def _apply_config_defaults(parser: argparse.ArgumentParser, config: dict[str, An
         "attempt_energy": config.get("attempt_energy"),
         "trials": config.get("trials"),
         "non_strict": config.get("non_strict"),
+        "engine": config.get("engine"),
+        "seed": config.get("seed"),
+        "workers": config.get("workers"),
+        "chunk_size": config.get("chunk_size"),
+        "rel_tol": config.get("rel_tol"),
+        "confidence": config.get("confidence"),
+        "crn": config.get("crn"),
+        "ladder": config.get("ladder"),
+        "race": config.get("race"),
+        "variance_reduction": config.get("variance_reduction"),
+        "importance_sampling": config.get("importance_sampling"),
+        "tilt_target": config.get("tilt_target"),
+        "time_budget": config.get("time_budget"),
+        "cache_dir": config.get("cache_dir"),
+        "no_cache": config.get("no_cache"),
+        "cache_max_mb": config.get("cache_max_mb"),
+        "timings": config.get("timings"),
+        "export_trials": config.get("export_trials"),
+        "checkpoint_dir": config.get("checkpoint_dir"),
+        "resume": config.get("resume"),
+        "extend_from": config.get("extend_from"),
+        "bootstrap": config.get("bootstrap"),
+        "objectives": config.get("objectives"),
     }
     parser.set_defaults(**{k: v for k, v in defaults.items() if v is not None})
 
@@ -55,6 +131,187 @@ def build_parser() -> argparse.ArgumentParser:
         description="Run Monte Carlo simulations using Idleon profile inputs.",
     )
 
+    _add_run_arguments(parser)
+    parser.add_argument("--trials", type=int, default=50_000, help="Number of trials to run.")
+    parser.add_argument(
+        "--rel-tol",
+        type=float,
+        default=None,
+        help=(
+            "Adaptive mode: stop each k once the confidence interval of expected "
+            "energy per success is within this relative half width (e.g. 0.005). "
+            "--trials becomes the per-k cap."
+        ),
+    )
+    parser.add_argument(
+        "--crn",
+        action="store_true",
+        help=(
+            "Sweep k with common random numbers: trial i of every k uses the same "
+            "uniforms, and neighbouring-k deltas are reported with paired errors."
+        ),
+    )
+    parser.add_argument(
+        "--ladder",
+        action="store_true",
+        help=(
+            "Sweep k from one set of coupled trial paths: a trial at k that fails "
+            "its first attempt continues as the trial at k-1, so every k costs "
+            "about as much as the largest one. Deltas are paired as with --crn."
+        ),
+    )
+    parser.add_argument(
+        "--race",
+        action="store_true",
+        help=(
+            "Find best k by statistical racing: start every k with a small batch, "
+            "drop k values confidently worse than the leader, and spend the rest of "
+            "the budget on survivors. --trials caps trials per k."
+        ),
+    )
+    parser.add_argument(
+        "--variance-reduction",
+        choices=("none", *VARIANCE_REDUCTION_MODES),
+        default="none",
+        help=(
+            "Estimate expected energy per success with antithetic trial pairs, "
+            "control variates, or both, and report the variance reduction factor "
+            "per k (default: none)."
+        ),
+    )
+    parser.add_argument(
+        "--importance-sampling",
+        action="store_true",
+        help=(
+            "Draw success rolls from a tilted distribution and weight trials by "
+            "their likelihood ratio; for high snail levels where runs rarely succeed."
+        ),
+    )
+    parser.add_argument(
+        "--tilt-target",
+        type=float,
+        default=DEFAULT_TARGET_SUCCESS,
+        help=(
+            "Run success probability the importance-sampling tilt aims for "
+            f"(default: {DEFAULT_TARGET_SUCCESS})."
+        ),
+    )
+    parser.add_argument(
+        "--confidence",
+        type=float,
+        default=0.95,
+        help="Confidence level for reported intervals (default: 0.95).",
+    )
+    parser.add_argument(
+        "--bootstrap",
+        type=int,
+        default=DEFAULT_BOOTSTRAP_REPLICATES,
+        help=(
+            "Bootstrap replicates for the standard error and interval of every "
+            f"Summary field of best_k; 0 disables (default: {DEFAULT_BOOTSTRAP_REPLICATES})."
+        ),
+    )
+    parser.add_argument(
+        "--objectives",
+        default=",".join(DEFAULT_OBJECTIVES),
+        help=(
+            "Comma-separated objectives for choosing k, each printed with its best k: "
+            "mean, p<percent> (e.g. p90), mean+<lambda>sd, budget:<energy> "
+            f"(default: {','.join(DEFAULT_OBJECTIVES)})."
+        ),
+    )
+    parser.add_argument(
+        "--engine",
+        choices=engine_names(),
+        default="reference",
+        help="Simulation engine (default: reference).",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=None,
+        help="RNG seed. Runs with the same seed are identical (default: random).",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes per simulation; 0 uses every core (default: 1).",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=None,
+        help="Trials per parallel work unit. Does not change results.",
+    )
+    parser.add_argument(
+        "--time-budget",
+        type=float,
+        default=None,
+        help=(
+            "Wall-clock budget in seconds for a parallel sweep (--workers != 1). "
+            "k values not finished in time are reported from partial trials."
+        ),
+    )
+    _add_cache_arguments(parser)
+    parser.add_argument(
+        "--export-trials",
+        type=Path,
+        default=None,
+        help=(
+            "Write every trial's columns as memory-mapped .npy files plus a JSON "
+            "manifest to DIR/k=<k> (fixed-trial k search only; runs in-process "
+            "and bypasses the cache)."
+        ),
+    )
+    parser.add_argument(
+        "--checkpoint-dir",
+        type=Path,
+        default=None,
+        help=(
+            "Checkpoint each k of the fixed-trial k search to DIR/k=<k>.json about "
+            "once a minute (runs in-process)."
+        ),
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help=(
+            "Continue from the checkpoints in --checkpoint-dir; the result is "
+            "identical to an uninterrupted run."
+        ),
+    )
+    parser.add_argument(
+        "--extend-from",
+        type=int,
+        default=None,
+        help=(
+            "Build each k's result by extending the cached result of this many "
+            "trials (same seed) to --trials, instead of rerunning it."
+        ),
+    )
+    parser.add_argument(
+        "--timings",
+        action="store_true",
+        help="Print wall and CPU time per phase and per k, with trials per second.",
+    )
+    parser.add_argument(
+        "--profile",
+        type=Path,
+        default=None,
+        help="Write a cProfile dump of the run (main process only) to this file.",
+    )
+    parser.add_argument(
+        "--trace",
+        type=Path,
+        default=None,
+        help="Write the phase timings as Chrome-trace JSON (chrome://tracing, Perfetto).",
+    )
+    return parser
+
+
+def _add_run_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the config and profile flags shared with the shard parser."""
     parser.add_argument(
         "--mc-config",
         type=_existing_file,
@@ -80,6 +337,11 @@ def build_parser() -> argparse.ArgumentParser:
         default=53,
         help="Hole schematic index used to compute the bonus (default: 53).",
     )
+    parser.add_argument(
+        "--non-strict",
+        action="store_true",
+        help="Allow missing/invalid profile sections to degrade to defaults.",
+    )
 
     parser.add_argument("--snail-level", type=int, required=True, help="Snail level.")
     parser.add_argument(
@@ -96,19 +358,42 @@ def build_parser() -> argparse.ArgumentParser:
         help="Energy cost per attempt.",
     )
 
-    parser.add_argument("--trials", type=int, default=50_000, help="Number of trials to run.")
+
+def _add_cache_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the result cache flags shared by the main and sweep parsers."""
     parser.add_argument(
-        "--non-strict",
+        "--cache-dir",
+        type=Path,
+        default=None,
+        help=(
+            "Result cache directory for seeded runs (default: "
+            "$GAMING_MONTE_CARLO_CACHE_DIR or ~/.cache/gaming_monte_carlo)."
+        ),
+    )
+    parser.add_argument(
+        "--no-cache",
         action="store_true",
-        help="Allow missing/invalid profile sections to degrade to defaults.",
+        help="Always simulate; neither read nor write the result cache.",
+    )
+    parser.add_argument(
+        "--cache-max-mb",
+        type=float,
+        default=DEFAULT_MAX_BYTES / 2**20,
+        help="Evict least recently used cache entries above this size (default: 1024).",
     )
-    return parser
 
 
-def _parse_args_with_config(argv: list[str] | None) -> argparse.Namespace:
-    """Parse CLI args, supporting a JSON config file for defaults."""
-    parser = build_parser()
+def _cache_from_args(args: argparse.Namespace) -> SimulationCache | None:
+    """Result cache for the parsed flags, or None when disabled."""
+    if args.no_cache:
+        return None
+    return SimulationCache(args.cache_dir, max_bytes=int(float(args.cache_max_mb) * 2**20))
+
 
+def _parse_with_mc_config(
+    parser: argparse.ArgumentParser, argv: list[str] | None
+) -> argparse.Namespace:
+    """Parse args with `parser`, with defaults from --mc-config."""
     pre = argparse.ArgumentParser(add_help=False)
     pre.add_argument("--mc-config", type=_existing_file, default=None)
     known, _ = pre.parse_known_args(argv)
@@ -117,15 +402,10 @@ def _parse_args_with_config(argv: list[str] | None) -> argparse.Namespace:
         cfg = _read_json(Path(known.mc_config))
         _apply_config_defaults(parser, cfg)
 
-        if cfg.get("snail_level") is not None:
-            for action in parser._actions:  # noqa: SLF001
-                if getattr(action, "dest", None) == "snail_level":
-                    action.required = False
-                    break
-        if cfg.get("trials") is not None:
-            for action in parser._actions:
-                if getattr(action, "dest", None) == "trials":
-                    action.required = False
+        # Flags the config supplies no longer have to be given.
+        for action in parser._actions:  # noqa: SLF001
+            if action.required and cfg.get(action.dest) is not None:
+                action.required = False
 
     args = parser.parse_args(argv)
     if args.snail_level is None:
@@ -133,6 +413,158 @@ def _parse_args_with_config(argv: list[str] | None) -> argparse.Namespace:
     return args
 
 
+def _parse_args_with_config(argv: list[str] | None) -> argparse.Namespace:
+    """Parse CLI args, supporting a JSON config file for defaults."""
+    parser = build_parser()
+    args = _parse_with_mc_config(parser, argv)
+    if not 0.0 < float(args.confidence) < 1.0:
+        parser.error("--confidence must be between 0 and 1")
+    if args.rel_tol is not None and float(args.rel_tol) <= 0.0:
+        parser.error("--rel-tol must be positive")
+    if int(args.initial_k) >= 20:
+        parser.error("--initial-k must be below 20 (the k search stops at k=19)")
+    if args.race and int(args.trials) < 1:
+        parser.error("--race needs --trials >= 1")
+    if int(args.workers) < 0:
+        parser.error("--workers must be >= 0 (0 uses every core)")
+    if args.time_budget is not None:
+        if float(args.time_budget) <= 0.0:
+            parser.error("--time-budget must be positive")
+        # Only the shared-pool sweep checks the clock; in-process runs
+        # would silently overrun it.
+        _reject_ignored_flags(
+            parser,
+            "--time-budget",
+            {
+                "--workers 1": int(args.workers) == 1,
+                "--export-trials": args.export_trials is not None,
+                "--checkpoint-dir": args.checkpoint_dir is not None,
+                "--extend-from": args.extend_from is not None,
+            },
+        )
+    if args.rel_tol is not None:
+        if int(args.workers) != 1:
+            parser.error("--rel-tol runs each k in-process and cannot be combined with --workers")
+        _reject_ignored_flags(
+            parser,
+            "--rel-tol",
+            {
+                "--checkpoint-dir": args.checkpoint_dir is not None,
+                "--extend-from": args.extend_from is not None,
+            },
+        )
+    if args.resume and args.checkpoint_dir is None:
+        parser.error("--resume needs --checkpoint-dir")
+    if args.extend_from is not None:
+        if args.seed is None or args.no_cache:
+            parser.error("--extend-from needs --seed and the result cache")
+        if not 0 <= int(args.extend_from) <= int(args.trials):
+            parser.error("--extend-from must be between 0 and --trials")
+        _reject_ignored_flags(
+            parser,
+            "--extend-from",
+            {
+                "--export-trials": args.export_trials is not None,
+                "--checkpoint-dir": args.checkpoint_dir is not None,
+            },
+        )
+    if args.export_trials is not None:
+        _reject_ignored_flags(
+            parser,
+            "--export-trials",
+            {
+                "--rel-tol": args.rel_tol is not None,
+                "--checkpoint-dir": args.checkpoint_dir is not None,
+                "--crn": args.crn,
+                "--ladder": args.ladder,
+                "--race": args.race,
+                "--variance-reduction": args.variance_reduction != "none",
+                "--importance-sampling": args.importance_sampling,
+            },
+        )
+    if args.race:
+        _reject_ignored_flags(
+            parser,
+            "--race",
+            {
+                "--importance-sampling": args.importance_sampling,
+                "--variance-reduction": args.variance_reduction != "none",
+                "--crn": args.crn,
+                "--ladder": args.ladder,
+                "--engine": args.engine != "reference",
+                "--workers": int(args.workers) != 1,
+                "--rel-tol": args.rel_tol is not None,
+                "--time-budget": args.time_budget is not None,
+                "--cache-dir": args.cache_dir is not None,
+                "--checkpoint-dir": args.checkpoint_dir is not None,
+                "--extend-from": args.extend_from is not None,
+            },
+        )
+    if args.importance_sampling:
+        if not 0.0 < float(args.tilt_target) < 1.0:
+            parser.error("--tilt-target must be between 0 and 1")
+        _reject_ignored_flags(
+            parser,
+            "--importance-sampling",
+            {
+                "--crn": args.crn,
+                "--ladder": args.ladder,
+                "--variance-reduction": args.variance_reduction != "none",
+                "--engine": args.engine != "reference",
+                "--workers": int(args.workers) != 1,
+                "--rel-tol": args.rel_tol is not None,
+                "--time-budget": args.time_budget is not None,
+                "--cache-dir": args.cache_dir is not None,
+                "--checkpoint-dir": args.checkpoint_dir is not None,
+                "--extend-from": args.extend_from is not None,
+            },
+        )
+    if args.variance_reduction != "none":
+        _reject_ignored_flags(
+            parser,
+            "--variance-reduction",
+            {
+                "--crn": args.crn,
+                "--ladder": args.ladder,
+                "--workers": int(args.workers) != 1,
+                "--engine": args.engine != "reference",
+                "--rel-tol": args.rel_tol is not None,
+                "--cache-dir": args.cache_dir is not None,
+                "--checkpoint-dir": args.checkpoint_dir is not None,
+                "--extend-from": args.extend_from is not None,
+            },
+        )
+    if args.crn or args.ladder:
+        _reject_ignored_flags(
+            parser,
+            "--ladder" if args.ladder else "--crn",
+            {
+                "--crn": args.ladder and args.crn,
+                "--engine": args.engine != "reference",
+                "--workers": int(args.workers) != 1,
+                "--time-budget": args.time_budget is not None,
+                "--rel-tol": args.rel_tol is not None,
+                "--cache-dir": args.cache_dir is not None,
+                "--checkpoint-dir": args.checkpoint_dir is not None,
+                "--extend-from": args.extend_from is not None,
+            },
+        )
+    try:
+        args.objectives = parse_objectives(str(args.objectives))
+    except ValueError as exc:
+        parser.error(str(exc))
+    return args
+
+
+def _reject_ignored_flags(
+    parser: argparse.ArgumentParser, mode: str, ignored: dict[str, bool]
+) -> None:
+    """Exit with a usage error if a flag the mode ignores is set."""
+    given = [flag for flag, is_set in ignored.items() if is_set]
+    if given:
+        parser.error(f"{mode} cannot be combined with {', '.join(given)}")
+
+
 def _hole_bonus_from_args(args: argparse.Namespace) -> float:
     """Compute hole bonus from Idleon config (if provided)."""
     if args.idleon_config is None:
@@ -148,15 +580,114 @@ def _simulate_for_k(
     rules: Rules,
     n_trials: int,
     k: int,
-) -> Summary:
-    """Run one simulation with the given k and return its summary."""
-    config = TrialConfig(
-        snail_level=int(base_config.snail_level),
-        initial_k=int(k),
-        hole_bonus=float(base_config.hole_bonus),
-    )
-    results = run_simulation(config=config, rules=rules, n_trials=int(n_trials))
-    return summarize_results(results, config=config, rules=rules)
+    engine: str = "reference",
+    seed: int | None = None,
+    rel_tol: float | None = None,
+    confidence: float = 0.95,
+    cache: SimulationCache | None = None,
+    export_dir: Path | None = None,
+    checkpoint_dir: Path | None = None,
+    resume: bool = False,
+    extend_from: int | None = None,
+    timer: PhaseTimer = DISABLED,
+) -> tuple[Summary, Interval, OutcomeDistributions]:
+    """Run one simulation with the given k.
+
+    With rel_tol set, trials run until the expected energy per success
+    interval is that tight (n_trials is then a cap). Otherwise:
+
+      - export_dir: every trial is also written to export_dir/k=<k>.
+      - checkpoint_dir: the run checkpoints to checkpoint_dir/k=<k>.json
+        and, with resume, continues from it.
+      - extend_from: the cached extend_from-trial result is extended.
+
+    Returns:
+        (summary, expected_energy_per_success interval, outcome
+        distributions)
+    """
+    config = base_config.with_initial_k(k)
+    if rel_tol is not None:
+        with timer.phase("simulate", k=k) as phase:
+            adaptive = run_simulation_adaptive(
+                config=config,
+                rules=rules,
+                rel_tol=float(rel_tol),
+                confidence=confidence,
+                max_trials=int(n_trials),
+                seed=seed,
+                runner=get_engine(engine).runner,
+            )
+            phase.trials = adaptive.n_trials
+        return adaptive.summary, adaptive.interval, adaptive.distributions
+
+    runner = get_engine(engine).runner
+
+    with timer.phase("simulate", k=k) as phase:
+
+        def compute() -> SummaryAccumulator:
+            phase.trials = int(n_trials)
+            if checkpoint_dir is not None:
+                return run_simulation_checkpointed(
+                    config=config,
+                    rules=rules,
+                    n_trials=int(n_trials),
+                    path=checkpoint_dir / f"k={k}.json",
+                    seed=seed,
+                    runner=runner,
+                    resume=resume,
+                )
+            # In-process runs stream block by block and never hold every trial.
+            if export_dir is None:
+                return SummaryAccumulator().consume(
+                    run_simulation_streaming(
+                        config=config, rules=rules, n_trials=int(n_trials), seed=seed, runner=runner
+                    )
+                )
+            with TrialColumnWriter(
+                export_dir / f"k={k}",
+                config=config,
+                rules=rules,
+                n_trials=int(n_trials),
+                seed=seed,
+                engine=engine,
+            ) as writer:
+                blocks = run_simulation_streaming(
+                    config=config,
+                    rules=rules,
+                    n_trials=int(n_trials),
+                    seed=writer.manifest.entropy,
+                    runner=runner,
+                )
+                return SummaryAccumulator().consume(writer.tee(blocks))
+
+        if extend_from is not None and cache is not None and seed is not None:
+            acc = extend_cached_accumulator(
+                cache,
+                config=config,
+                rules=rules,
+                from_trials=int(extend_from),
+                n_trials=int(n_trials),
+                seed=seed,
+                runner=runner,
+            )
+            phase.trials = int(n_trials) - int(extend_from)
+        else:
+            acc = cached_accumulator(
+                # A cache hit would skip the simulation the export needs.
+                cache if export_dir is None else None,
+                config=config,
+                rules=rules,
+                n_trials=int(n_trials),
+                seed=seed,
+                runner=runner,
+                compute=compute,
+            )
+    with timer.phase("summarize", k=k):
+        return (
+            acc.to_summary(config, rules),
+            acc.energy_per_success_interval(confidence),
+            acc.distributions,
+        )
 
 
 def _auto_find_k_first_decrease(
@@ -165,7 +696,20 @@ def _auto_find_k_first_decrease(
     rules: Rules,
     n_trials: int,
     start_k: int,
-) -> tuple[int, dict[int, Summary]]:
+    engine: str = "reference",
+    seed: int | None = None,
+    workers: int | None = 1,
+    chunk_size: int | None = None,
+    rel_tol: float | None = None,
+    confidence: float = 0.95,
+    time_budget: float | None = None,
+    cache: SimulationCache | None = None,
+    export_dir: Path | None = None,
+    checkpoint_dir: Path | None = None,
+    resume: bool = False,
+    extend_from: int | None = None,
+    timer: PhaseTimer = DISABLED,
+) -> tuple[int, dict[int, Summary], dict[int, Interval], dict[int, OutcomeDistributions]]:
     """Increase k until expected energy per success first decreases.
 
     We evaluate k = start_k, start_k+1, ... until
@@ -175,25 +719,551 @@ def _auto_find_k_first_decrease(
     bracket with the lowest expected_energy_per_success.
 
     Returns:
-        (best_k, summaries_by_k)
+        (best_k, summaries_by_k, energy_per_success_intervals_by_k,
+        distributions_by_k)
     """
     summaries: dict[int, Summary] = {}
+    intervals: dict[int, Interval] = {}
+    distributions: dict[int, OutcomeDistributions] = {}
 
     k0 = max(1, int(start_k))
-    for k in range(k0, 20):  # practical guard; bracket is local anyway
-        s = _simulate_for_k(base_config=base_config, rules=rules, n_trials=n_trials, k=k)
-        summaries[k] = s
-        
+    ks = range(k0, 20)  # practical guard; bracket is local anyway
+    in_process = export_dir is not None or checkpoint_dir is not None or extend_from is not None
+    if workers != 1 and rel_tol is None and not in_process:
+        # One shared pool for the whole sweep; k values stream back as they
+        # finish, so per-k times are not separable and the sweep is one phase.
+        with timer.phase("sweep") as phase:
+            results = list(
+                iter_k_sweep(
+                    base_config=base_config,
+                    rules=rules,
+                    ks=ks,
+                    n_trials=n_trials,
+                    seed=seed,
+                    workers=workers,
+                    chunk_size=chunk_size,
+                    runner=get_engine(engine).runner,
+                    confidence=confidence,
+                    time_budget=time_budget,
+                    cache=cache,
+                )
+            )
+            phase.trials = sum(r.summary.n_trials for r in results)
+        for r in results:
+            summaries[r.k], intervals[r.k] = r.summary, r.interval
+            distributions[r.k] = r.distributions
+        summaries = dict(sorted(summaries.items()))
+        intervals = dict(sorted(intervals.items()))
+    else:
+        for k in ks:
+            summaries[k], intervals[k], distributions[k] = _simulate_for_k(
+                base_config=base_config,
+                rules=rules,
+                n_trials=n_trials,
+                k=k,
+                engine=engine,
+                seed=seed,
+                rel_tol=rel_tol,
+                confidence=confidence,
+                cache=cache,
+                export_dir=export_dir,
+                checkpoint_dir=checkpoint_dir,
+                resume=resume,
+                extend_from=extend_from,
+                timer=timer,
+            )
 
     best_k = min(summaries, key=lambda kk: summaries[kk].expected_energy_per_success)
-    return best_k, summaries
+    return best_k, summaries, intervals, distributions
+
+
+def _variance_reduced_sweep(
+    *,
+    base_config: TrialConfig,
+    rules: Rules,
+    n_trials: int,
+    start_k: int,
+    mode: str,
+    seed: int | None = None,
+    confidence: float = 0.95,
+    timer: PhaseTimer = DISABLED,
+) -> tuple[
+    int,
+    dict[int, Summary],
+    dict[int, Interval],
+    dict[int, OutcomeDistributions],
+    dict[int, VarianceReducedResult],
+]:
+    """Evaluate every k with a variance-reduction mode.
+
+    Each Summary's expected_energy_per_success is replaced by the
+    variance-reduced estimate, so best_k and the printed bracket use it;
+    the other fields are plain trial averages.
+
+    Returns:
+        (best_k, summaries_by_k, energy_per_success_intervals_by_k,
+        distributions_by_k, results_by_k)
+    """
+    summaries: dict[int, Summary] = {}
+    intervals: dict[int, Interval] = {}
+    distributions: dict[int, OutcomeDistributions] = {}
+    results: dict[int, VarianceReducedResult] = {}
+
+    for k in range(max(1, int(start_k)), 20):
+        with timer.phase("simulate", k=k) as phase:
+            result = run_simulation_variance_reduced(
+                config=base_config.with_initial_k(k),
+                rules=rules,
+                n_trials=n_trials,
+                mode=mode,
+                seed=seed,
+                confidence=confidence,
+            )
+            phase.trials = result.n_trials
+        summaries[k] = replace(result.summary, expected_energy_per_success=result.interval.estimate)
+        intervals[k] = result.interval
+        distributions[k] = result.distributions
+        results[k] = result
+
+    best_k = min(summaries, key=lambda kk: summaries[kk].expected_energy_per_success)
+    return best_k, summaries, intervals, distributions, results
+
+
+def build_sweep_parser() -> argparse.ArgumentParser:
+    """Build the parser for the `sweep` subcommand."""
+    parser = argparse.ArgumentParser(
+        prog="gaming-monte-carlo sweep",
+        description=(
+            "Simulate a grid of snail levels, hole bonuses, k values and attempt "
+            "costs and write one row per cell. Values are comma lists and/or "
+            "inclusive start:stop[:step] ranges."
+        ),
+    )
+    parser.add_argument("--snail-levels", required=True, help="Snail levels, e.g. 20:59.")
+    parser.add_argument("--hole-bonuses", default="0", help="Hole bonus percents (default: 0).")
+    parser.add_argument("--initial-ks", default="1:19", help="initial_k values (default: 1:19).")
+    parser.add_argument(
+        "--attempt-energy", default="5", help="Energy costs per attempt (default: 5)."
+    )
+    parser.add_argument("--trials", type=int, default=50_000, help="Trials per cell.")
+    parser.add_argument(
+        "--out",
+        type=Path,
+        required=True,
+        help=(
+            "Output table (.csv, .npz or .parquet). Cells already in it with the "
+            "same seed and trial count are skipped."
+        ),
+    )
+    parser.add_argument(
+        "--engine",
+        choices=engine_names(),
+        default="vectorized",
+        help="Simulation engine (default: vectorized).",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="RNG seed for every cell (default: 0).")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=0,
+        help="Worker processes; 0 uses every core (default: 0).",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=None,
+        help="Trials per parallel work unit. Does not change results.",
+    )
+    parser.add_argument(
+        "--confidence",
+        type=float,
+        default=0.95,
+        help="Confidence level for reported intervals (default: 0.95).",
+    )
+    parser.add_argument(
+        "--time-budget",
+        type=float,
+        default=None,
+        help="Wall-clock budget in seconds; unfinished cells are resumed next run.",
+    )
+    _add_cache_arguments(parser)
+    return parser
+
+
+def sweep_main(argv: list[str] | None = None) -> None:
+    """Entrypoint for the `sweep` subcommand."""
+    parser = build_sweep_parser()
+    args = parser.parse_args(argv)
+    if int(args.workers) < 0:
+        parser.error("--workers must be >= 0 (0 uses every core)")
+    try:
+        grid = SweepGrid(
+            snail_levels=parse_values(args.snail_levels, int),
+            hole_bonuses=parse_values(args.hole_bonuses, float),
+            initial_ks=parse_values(args.initial_ks, int),
+            attempt_energy_costs=parse_values(args.attempt_energy, int),
+        )
+        out = Path(args.out)
+        fmt = sweep_format(out)
+    except ValueError as exc:
+        parser.error(str(exc))
+
+    # Rows are appended to a CSV as cells finish, so an interrupted sweep
+    # keeps its progress. Other formats are written once at the end.
+    journal = out if fmt == "csv" else out.with_name(out.name + ".partial.csv")
+    previous = [] if journal == out else read_sweep_table(out)
+    runner = get_engine(str(args.engine)).runner
+    skip = completed_cells(
+        previous + read_sweep_table(journal),
+        n_trials=int(args.trials),
+        seed=int(args.seed),
+        runner=runner,
+    )
+
+    total = len(grid)
+    todo = sum(1 for cell in grid.cells() if cell not in skip)
+    print(f"{total} cells | {total - todo} already computed | {todo} to run")
+
+    rows = run_grid_sweep(
+        grid=grid,
+        n_trials=int(args.trials),
+        seed=int(args.seed),
+        workers=int(args.workers) or None,
+        chunk_size=args.chunk_size,
+        runner=runner,
+        confidence=float(args.confidence),
+        skip=skip,
+        time_budget=args.time_budget,
+        cache=_cache_from_args(args),
+    )
+    finished = 0
+    for row in rows:
+        append_sweep_csv(journal, [row.record()])
+        finished += int(row.complete)
+        c = row.cell
+        print(
+            f"[{finished}/{todo}] snail_level={c.snail_level} hole_bonus={c.hole_bonus:g} "
+            f"k={c.initial_k} cost={c.attempt_energy_cost} | "
+            f"expected_energy_per_success={row.summary.expected_energy_per_success:.3f}"
+            + ("" if row.complete else " (partial)")
+        )
+
+    # Rewrite the table with one row per cell (later rows win).
+    write_sweep_table(out, previous + read_sweep_table(journal))
+    if journal != out:
+        journal.unlink(missing_ok=True)
+    print(f"wrote {out}")
+
+
+def build_check_engines_parser() -> argparse.ArgumentParser:
+    """Build the parser for the `check-engines` subcommand."""
+    parser = argparse.ArgumentParser(
+        prog="gaming-monte-carlo check-engines",
+        description=(
+            "Run two engines on the same config and seed and test that they agree: "
+            "trial for trial when they share an RNG stream, in distribution otherwise."
+        ),
+    )
+    parser.add_argument(
+        "--engines",
+        default="reference,fast",
+        help="Two comma-separated engine names (default: reference,fast).",
+    )
+    parser.add_argument("--snail-level", type=int, required=True, help="Snail level.")
+    parser.add_argument("--initial-k", type=int, default=8, help="initial_k (default: 8).")
+    parser.add_argument("--hole-bonus", type=float, default=0.0, help="Hole bonus percent.")
+    parser.add_argument(
+        "--attempt-energy", type=int, default=5, help="Energy cost per attempt (default: 5)."
+    )
+    parser.add_argument("--trials", type=int, default=200_000, help="Trials per engine.")
+    parser.add_argument("--seed", type=int, default=0, help="RNG seed (default: 0).")
+    parser.add_argument(
+        "--alpha",
+        type=float,
+        default=0.001,
+        help="Family-wise significance level of the distribution tests (default: 0.001).",
+    )
+    return parser
+
+
+def check_engines_main(argv: list[str] | None = None) -> None:
+    """Entrypoint for the `check-engines` subcommand.
+
+    Exits 1 on a mismatch.
+    """
+    parser = build_check_engines_parser()
+    args = parser.parse_args(argv)
+    names = [n.strip() for n in str(args.engines).split(",") if n.strip()]
+    if len(names) != 2:
+        parser.error(f"--engines needs exactly two names, got {args.engines!r}")
+    try:
+        report = check_equivalence(
+            names[0],
+            names[1],
+            config=TrialConfig(
+                snail_level=int(args.snail_level),
+                initial_k=int(args.initial_k),
+                hole_bonus=float(args.hole_bonus),
+            ),
+            rules=Rules(attempt_energy_cost=int(args.attempt_energy)),
+            n_trials=int(args.trials),
+            seed=int(args.seed),
+            alpha=float(args.alpha),
+        )
+    except ValueError as exc:
+        parser.error(str(exc))
+    print(report)
+    if not report.passed:
+        sys.exit(1)
+
+
+def build_shard_parser() -> argparse.ArgumentParser:
+    """Build the parser for the `shard` subcommand."""
+    parser = argparse.ArgumentParser(
+        prog="gaming-monte-carlo shard",
+        description=(
+            "Run some or all shards of one simulation and write a mergeable file per "
+            "shard. Shards run anywhere with the same flags; combine the files with "
+            "`gaming-monte-carlo merge`."
+        ),
+    )
+    _add_run_arguments(parser)
+    parser.set_defaults(initial_k=8)
+    parser.add_argument("--trials", type=int, default=50_000, help="Trials in the whole run.")
+    parser.add_argument("--seed", type=int, required=True, help="RNG seed shared by every shard.")
+    parser.add_argument("--shards", type=int, required=True, help="Number of shards.")
+    parser.add_argument(
+        "--index",
+        default=None,
+        help="Shards to run here: comma list and/or inclusive start:stop ranges (default: all).",
+    )
+    parser.add_argument(
+        "--engine",
+        choices=engine_names(),
+        default="vectorized",
+        help="Simulation engine (default: vectorized).",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=0,
+        help="Local worker processes; 0 uses every core (default: 0).",
+    )
+    parser.add_argument("--out", type=Path, required=True, help="Directory for shard files.")
+    return parser
+
+
+def shard_main(argv: list[str] | None = None) -> None:
+    """Entrypoint for the `shard` subcommand."""
+    parser = build_shard_parser()
+    args = _parse_with_mc_config(parser, argv)
+    if int(args.shards) <= 0:
+        parser.error(f"--shards must be positive, got {args.shards}")
+    try:
+        indices = None if args.index is None else parse_values(str(args.index), int)
+    except ValueError as exc:
+        parser.error(str(exc))
+    if indices is not None and not all(0 <= i < int(args.shards) for i in indices):
+        parser.error(f"--index values must be in [0, {int(args.shards) - 1}]")
+
+    paths = run_shards_locally(
+        Path(args.out),
+        config=TrialConfig(
+            snail_level=int(args.snail_level),
+            initial_k=int(args.initial_k),
+            hole_bonus=_hole_bonus_from_args(args),
+        ),
+        rules=Rules(attempt_energy_cost=int(args.attempt_energy)),
+        n_trials=int(args.trials),
+        seed=int(args.seed),
+        n_shards=int(args.shards),
+        indices=indices,
+        engine=str(args.engine),
+        workers=int(args.workers) or None,
+    )
+    for path in paths:
+        print(f"wrote {path}")
+
+
+def build_merge_parser() -> argparse.ArgumentParser:
+    """Build the parser for the `merge` subcommand."""
+    parser = argparse.ArgumentParser(
+        prog="gaming-monte-carlo merge",
+        description=(
+            "Combine the files written by `gaming-monte-carlo shard` into the Summary "
+            "of the whole run."
+        ),
+    )
+    parser.add_argument(
+        "paths",
+        nargs="+",
+        type=Path,
+        help="Shard files, or directories whose shard-*.json files are all merged.",
+    )
+    parser.add_argument(
+        "--confidence",
+        type=float,
+        default=0.95,
+        help="Confidence level for reported intervals (default: 0.95).",
+    )
+    parser.add_argument(
+        "--bootstrap",
+        type=int,
+        default=DEFAULT_BOOTSTRAP_REPLICATES,
+        help="Bootstrap replicates for per-field standard errors; 0 disables them.",
+    )
+    return parser
+
+
+def merge_main(argv: list[str] | None = None) -> None:
+    """Entrypoint for the `merge` subcommand."""
+    parser = build_merge_parser()
+    args = parser.parse_args(argv)
+    files: list[Path] = []
+    for path in args.paths:
+        files.extend(sorted(path.glob("shard-*.json")) if path.is_dir() else [path])
+    try:
+        first, acc = merge_shards([ShardResult.load(f) for f in files])
+    except (OSError, ValueError) as exc:
+        parser.error(str(exc))
+
+    print(
+        f"merged {len(files)} shards | trials={acc.n_trials} | seed={first.seed} "
+        f"| engine={first.engine}"
+    )
+    print(f"expected_energy_per_success={acc.energy_per_success_interval(args.confidence)}")
+    print("")
+    print(acc.to_summary(first.config, first.rules))
+    _print_distributions(
+        acc.distributions,
+        first.config,
+        confidence=float(args.confidence),
+        replicates=int(args.bootstrap),
+    )
+
+
+def build_renewal_parser() -> argparse.ArgumentParser:
+    """Build the parser for the `renewal` subcommand."""
+    parser = argparse.ArgumentParser(
+        prog="gaming-monte-carlo renewal",
+        description=(
+            "Simulate days with a fixed energy budget, chaining runs (rebuilding k "
+            "each time) until the budget is used up, and report the distribution of "
+            "successes per day and the leftover energy for every k."
+        ),
+    )
+    parser.add_argument("--snail-level", type=int, required=True, help="Snail level.")
+    parser.add_argument("--budget", type=int, required=True, help="Energy available per day.")
+    parser.add_argument("--initial-ks", default="1:19", help="initial_k values (default: 1:19).")
+    parser.add_argument("--hole-bonus", type=float, default=0.0, help="Hole bonus percent.")
+    parser.add_argument(
+        "--attempt-energy", type=int, default=5, help="Energy cost per attempt (default: 5)."
+    )
+    parser.add_argument(
+        "--days", type=int, default=1_000_000, help="Days to simulate per k (default: 1000000)."
+    )
+    parser.add_argument("--seed", type=int, default=None, help="RNG seed.")
+    return parser
+
+
+def renewal_main(argv: list[str] | None = None) -> None:
+    """Entrypoint for the `renewal` subcommand."""
+    parser = build_renewal_parser()
+    args = parser.parse_args(argv)
+    try:
+        ks = parse_values(str(args.initial_ks), int)
+    except ValueError as exc:
+        parser.error(str(exc))
+    if not ks or min(ks) < 1:
+        parser.error("--initial-ks values must be >= 1")
+    if int(args.attempt_energy) <= 0:
+        parser.error("--attempt-energy must be positive")
+    if int(args.budget) < 0:
+        parser.error("--budget must be >= 0")
+    if int(args.days) <= 0:
+        parser.error("--days must be positive")
+
+    base_config = TrialConfig(
+        snail_level=int(args.snail_level), initial_k=1, hole_bonus=float(args.hole_bonus)
+    )
+    rules = Rules(attempt_energy_cost=int(args.attempt_energy))
+    results: dict[int, RenewalSummary] = {}
+    print(f"=== successes per day (budget={int(args.budget)}, {int(args.days)} days per k) ===")
+    print(
+        f"{'k':>4}{'mean':>10}{'sd':>9}{'P(0)':>9}{'P50':>6}{'P90':>6}{'P99':>6}"
+        f"{'leftover':>10}{'runs':>8}{'cut':>7}"
+    )
+    for k in ks:
+        s = run_renewal(
+            config=base_config.with_initial_k(k),
+            rules=rules,
+            budget=int(args.budget),
+            n_days=int(args.days),
+            seed=args.seed,
+        )
+        results[k] = s
+        p50, p90, p99 = s.successes_quantiles
+        print(
+            f"{k:4d}{s.mean_successes:10.3f}{s.std_successes:9.3f}{s.p_no_success:9.4f}"
+            f"{p50:6g}{p90:6g}{p99:6g}{s.mean_leftover:10.1f}{s.runs_per_day:8.2f}"
+            f"{s.cut_runs_per_day:7.3f}"
+        )
+
+    best_k = max(results, key=lambda kk: results[kk].mean_successes)
+    print("")
+    print("=== most successes per day ===")
+    print(results[best_k])
+    print("")
+    print(results[best_k].distribution_table())
 
 
 def main(argv: list[str] | None = None) -> None:
     """CLI entrypoint."""
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if argv[:1] == ["sweep"]:
+        sweep_main(argv[1:])
+        return
+    if argv[:1] == ["check-engines"]:
+        check_engines_main(argv[1:])
+        return
+    if argv[:1] == ["shard"]:
+        shard_main(argv[1:])
+        return
+    if argv[:1] == ["merge"]:
+        merge_main(argv[1:])
+        return
+    if argv[:1] == ["renewal"]:
+        renewal_main(argv[1:])
+        return
+
     args = _parse_args_with_config(argv)
 
-    hole_bonus = _hole_bonus_from_args(args)
+    # Timings are only recorded when asked for; DISABLED is a no-op.
+    timer = PhaseTimer() if args.timings or args.trace is not None else DISABLED
+    profiler = cProfile.Profile() if args.profile is not None else None
+    if profiler is not None:
+        profiler.enable()
+    try:
+        _run(args, timer)
+    finally:
+        if profiler is not None:
+            profiler.disable()
+            profiler.dump_stats(str(args.profile))
+            print(f"wrote cProfile stats to {args.profile}")
+
+    if args.timings:
+        print("")
+        print("=== timings ===")
+        print(timer.report())
+    if args.trace is not None:
+        timer.write_chrome_trace(args.trace)
+        print(f"wrote Chrome trace to {args.trace}")
+
+
+def _run(args: argparse.Namespace, timer: PhaseTimer) -> None:
+    """Run the k search for parsed flags and print the results."""
+    with timer.phase("profile"):
+        hole_bonus = _hole_bonus_from_args(args)
 
     base_config = TrialConfig(
         snail_level=int(args.snail_level),
@@ -203,12 +1273,96 @@ def main(argv: list[str] | None = None) -> None:
 
     rules = Rules(attempt_energy_cost=int(args.attempt_energy))
 
-    best_k, summaries = _auto_find_k_first_decrease(
-        base_config=base_config,
-        rules=rules,
-        n_trials=int(args.trials),
-        start_k=int(args.initial_k),
-    )
+    if args.race:
+        with timer.phase("race") as phase:
+            race = race_best_k(
+                base_config=base_config,
+                rules=rules,
+                ks=range(max(1, int(args.initial_k)), 20),
+                seed=args.seed,
+                confidence=float(args.confidence),
+                max_trials_per_k=int(args.trials),
+            )
+            phase.trials = race.total_trials
+        print("=== racing (trials per k, elimination) ===")
+        for k, s in race.summaries.items():
+            status = "dropped" if k in race.eliminated else "survived"
+            print(
+                f"k={k:3d} | expected_energy_per_success={s.expected_energy_per_success:.3f} "
+                f"| trials={race.trials_by_k[k]} | {status}"
+            )
+        print("")
+        print("=== racing result ===")
+        print(f"best_k={race.best_k} | expected_energy_per_success={race.interval}")
+        print(f"total_trials={race.total_trials} | resolved={race.resolved}")
+        print("")
+        print(race.summaries[race.best_k])
+        _print_distributions(
+            race.distributions[race.best_k],
+            base_config.with_initial_k(race.best_k),
+            confidence=float(args.confidence),
+            replicates=int(args.bootstrap),
+        )
+        return
+
+    if args.importance_sampling:
+        _run_importance(args, base_config, rules, timer)
+        return
+
+    deltas: list[PairedDelta] = []
+    if args.variance_reduction != "none":
+        best_k, summaries, intervals, distributions, reduced = _variance_reduced_sweep(
+            base_config=base_config,
+            rules=rules,
+            n_trials=int(args.trials),
+            start_k=int(args.initial_k),
+            mode=str(args.variance_reduction),
+            seed=args.seed,
+            confidence=float(args.confidence),
+            timer=timer,
+        )
+        print(f"=== variance reduction ({args.variance_reduction}) ===")
+        for k, r in reduced.items():
+            print(
+                f"k={k:3d} | se={r.interval.std_error:.4g} "
+                f"(plain: {r.plain_std_error:.4g}) | factor={r.variance_reduction:.3g}"
+            )
+        print("")
+    elif args.crn or args.ladder:
+        run_sweep = run_ladder_sweep if args.ladder else run_crn_sweep
+        with timer.phase("ladder_sweep" if args.ladder else "crn_sweep") as phase:
+            sweep = run_sweep(
+                base_config=base_config,
+                rules=rules,
+                ks=range(max(1, int(args.initial_k)), 20),
+                n_trials=int(args.trials),
+                seed=args.seed,
+                confidence=float(args.confidence),
+            )
+            phase.trials = sum(s.n_trials for s in sweep.summaries.values())
+        best_k, summaries, intervals = sweep.best_k, sweep.summaries, sweep.intervals
+        distributions = sweep.distributions
+        deltas = sweep.deltas
+    else:
+        best_k, summaries, intervals, distributions = _auto_find_k_first_decrease(
+            base_config=base_config,
+            rules=rules,
+            n_trials=int(args.trials),
+            start_k=int(args.initial_k),
+            engine=str(args.engine),
+            seed=args.seed,
+            workers=int(args.workers) or None,
+            chunk_size=args.chunk_size,
+            rel_tol=args.rel_tol,
+            confidence=float(args.confidence),
+            time_budget=args.time_budget,
+            cache=_cache_from_args(args),
+            export_dir=args.export_trials,
+            checkpoint_dir=args.checkpoint_dir,
+            resume=bool(args.resume),
+            extend_from=args.extend_from,
+            timer=timer,
+        )
 
     ks = [k for k in (best_k - 1, best_k, best_k + 1) if k >= 1]
 
@@ -216,18 +1370,96 @@ def main(argv: list[str] | None = None) -> None:
     for k in summaries.keys():
         try:
             s = summaries[k]
-            print(
-                f"k={k:3d} | expected_energy_per_success={s.expected_energy_per_success:.3f}"
-            )
+            line = f"k={k:3d} | expected_energy_per_success={s.expected_energy_per_success:.3f}"
+            if (
+                args.rel_tol is not None
+                or args.time_budget is not None
+                or args.variance_reduction != "none"
+            ):
+                line += f" | trials={s.n_trials} | ci={intervals[k]}"
+            print(line)
         except:
             break
 
+    if deltas:
+        print("")
+        print("=== neighbouring k deltas (common random numbers) ===")
+        for d in deltas:
+            print(
+                f"k={d.k_a:3d} -> {d.k_b:3d} | delta={d.interval} | "
+                f"se={d.interval.std_error:.3f} (independent: {d.independent_std_error:.3f})"
+            )
+
     best_summary = summaries[best_k]
     print("")
     print("=== lowest expected energy ===")
     print(f"best_k={best_k} | expected_energy_per_success={best_summary.expected_energy_per_success:.3f}")
     print("")
     print(best_summary)
+    _print_distributions(
+        distributions[best_k],
+        base_config.with_initial_k(best_k),
+        confidence=float(args.confidence),
+        replicates=int(args.bootstrap),
+    )
+
+    print("")
+    print("=== best k per objective (energy until success) ===")
+    print(evaluate_objectives(distributions, args.objectives))
+
+
+def _run_importance(
+    args: argparse.Namespace, base_config: TrialConfig, rules: Rules, timer: PhaseTimer
+) -> None:
+    """Evaluate every k with importance sampling and print the results."""
+    results = {}
+    print("=== importance sampling (weighted estimates) ===")
+    for k in range(max(1, int(args.initial_k)), 20):
+        with timer.phase("simulate", k=k) as phase:
+            result = run_simulation_importance(
+                config=base_config.with_initial_k(k),
+                rules=rules,
+                n_trials=int(args.trials),
+                seed=args.seed,
+                target_success=float(args.tilt_target),
+                confidence=float(args.confidence),
+            )
+            phase.trials = result.n_trials
+        results[k] = result
+        print(
+            f"k={k:3d} | expected_energy_per_success={result.interval} | tilt={result.tilt:.3g} "
+            f"| ess={result.effective_sample_size:.0f} "
+            f"(successes: {result.effective_successes:.0f})"
+        )
+
+    best_k = min(results, key=lambda kk: results[kk].summary.expected_energy_per_success)
+    best = results[best_k]
+    print("")
+    print("=== lowest expected energy ===")
+    print(f"best_k={best_k} | expected_energy_per_success={best.interval}")
+    print("")
+    print(best.summary)
+
+
+def _print_distributions(
+    distributions: OutcomeDistributions,
+    config: TrialConfig,
+    *,
+    confidence: float,
+    replicates: int,
+) -> None:
+    """Print bootstrap intervals and outcome quantiles for one k."""
+    k = config.initial_k
+    if replicates > 0:
+        intervals = bootstrap_intervals(
+            distributions, config, confidence=confidence, replicates=replicates
+        )
+        print("")
+        print(f"=== standard errors (k={k}, {intervals.replicates} bootstrap replicates) ===")
+        print(intervals)
+    print("")
+    print(f"=== outcome quantiles (k={k}) ===")
+    print(distributions.quantile_table())
 
 
 if __name__ == "__main__":
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from gaming_monte_carlo.simulation.distributions import OutcomeDistributions
+from gaming_monte_carlo.simulation.engine import TrialRunner, run_simulation_streaming, run_trials
+from gaming_monte_carlo.simulation.metrics import Interval, Summary, SummaryAccumulator
+from gaming_monte_carlo.simulation.rules import Rules
+from gaming_monte_carlo.simulation.state import TrialConfig
+from gaming_monte_carlo.simulation.streams import STREAM_BLOCK_SIZE
+
+DEFAULT_MIN_TRIALS = 4 * STREAM_BLOCK_SIZE
+
+
+@dataclass(frozen=True, slots=True)
+class AdaptiveResult:
+    """Outcome of an adaptive (confidence-interval stopped) simulation.
+
+    Attributes:
+        summary: Summary over the trials actually run.
+        interval: Final interval for expected_energy_per_success.
+        n_trials: Trials actually run.
+        converged: True if the tolerance was met before max_trials.
+        distributions: Per-run outcome histograms.
+    """
+
+    summary: Summary
+    interval: Interval
+    n_trials: int
+    converged: bool
+    distributions: OutcomeDistributions
+
+
+def run_simulation_adaptive(
+    *,
+    config: TrialConfig,
+    rules: Rules,
+    rel_tol: float,
+    confidence: float = 0.95,
+    max_trials: int = 1_000_000,
+    min_trials: int = DEFAULT_MIN_TRIALS,
+    seed: int | None = None,
+    runner: TrialRunner = run_trials,
+) -> AdaptiveResult:
+    """Run stream blocks until expected_energy_per_success is precise.
+
+    After each block (once min_trials have run) the confidence interval
+    of expected_energy_per_success is checked; the run stops as soon as
+    its half width is within rel_tol of the estimate. Blocks are the
+    same as in `run_simulation`, so stopping after m trials gives
+    exactly the seeded result of a fixed m-trial run.
+
+    Args:
+        config: Trial configuration.
+        rules: Rules.
+        rel_tol: Target relative half width, e.g. 0.005 for +/-0.5%.
+        confidence: Confidence level of the interval.
+        max_trials: Hard cap on trials.
+        min_trials: Trials to run before the first check.
+        seed: RNG seed. None uses fresh OS entropy.
+        runner: Per-block trial runner.
+
+    Returns:
+        AdaptiveResult.
+    """
+    if rel_tol <= 0.0:
+        raise ValueError(f"rel_tol must be positive, got {rel_tol}")
+    if not 0.0 < confidence < 1.0:
+        raise ValueError(f"confidence must be in (0, 1), got {confidence}")
+
+    acc = SummaryAccumulator()
+    converged = False
+    blocks = run_simulation_streaming(
+        config=config,
+        rules=rules,
+        n_trials=int(max_trials),
+        seed=seed,
+        runner=runner,
+    )
+    for block in blocks:
+        acc.update(block)
+        if acc.n_trials < min_trials:
+            continue
+        if acc.energy_per_success_interval(confidence).relative_half_width <= rel_tol:
+            converged = True
+            break
+
+    return AdaptiveResult(
+        summary=acc.to_summary(config, rules),
+        interval=acc.energy_per_success_interval(confidence),
+        n_trials=acc.n_trials,
+        converged=converged,
+        distributions=acc.distributions,
+    )
@@ -1,10 +1,18 @@
 from __future__ import annotations
 
 import math
+from typing import TYPE_CHECKING
 
+import numpy as np
 
-def clamp01(value: float) -> float:
-    """Clamp a float into the range [0.0, 1.0]."""
+if TYPE_CHECKING:
+    from gaming_monte_carlo.simulation.rules import ProbabilityTable
+
+
+def clamp01(value: float | np.ndarray) -> float | np.ndarray:
+    """Clamp a float (or each element of an array) into [0.0, 1.0]."""
+    if isinstance(value, np.ndarray):
+        return np.clip(value, 0.0, 1.0)
     if value < 0.0:
         return 0.0
     if value > 1.0:
@@ -78,6 +86,23 @@ def expected_failed_runs_before_success(p_run_success: float) -> float:
     return q / p_run_success
 
 
+def run_success_probability(success_by_k: np.ndarray, initial_k: int) -> float:
+    """Probability that a run starting at initial_k succeeds.
+
+    A run makes one success roll at each k = initial_k, ..., 1 until
+    one succeeds, so it fails only if every roll fails.
+
+    Args:
+        success_by_k: p_success indexed by k (e.g.
+            ProbabilityTable.success).
+        initial_k: Starting k.
+
+    Returns:
+        1 - prod(1 - p_success(k)) over k = 1..initial_k.
+    """
+    return 1.0 - float(np.prod(1.0 - success_by_k[1 : int(initial_k) + 1]))
+
+
 def encouragement_needed_for_success_chance(
     *,
     snail_level: int,
@@ -86,11 +111,14 @@ def encouragement_needed_for_success_chance(
     p_success_fn: callable[[int, float, float], float],
     low: int = 0,
     high: int = 1000,
+    table: ProbabilityTable | None = None,
 ) -> int:
     """Binary search encouragement to reach a desired success chance.
 
     This mirrors the common JS approach of using whole-number
-    encouragement.
+    encouragement. When a ProbabilityTable for the same snail level and
+    hole bonus is given, the k values it covers are searched in the
+    table and p_success_fn is only called beyond its range.
 
     Args:
         snail_level: Snail level (L).
@@ -100,15 +128,41 @@ def encouragement_needed_for_success_chance(
             (snail_level, encouragement, hole_bonus).
         low: Lower bound for search (inclusive).
         high: Upper bound for search (inclusive).
+        table: Optional precomputed per-k probabilities for the same
+            snail level and hole bonus.
 
     Returns:
         Minimum integer encouragement E such that
         p_success_fn(L, E, H) >= desired_success.
+
+    Raises:
+        ValueError: If `table` was built for a different snail level or
+            hole bonus.
     """
+    if table is not None and (table.snail_level, table.hole_bonus) != (
+        int(snail_level),
+        float(hole_bonus),
+    ):
+        raise ValueError(
+            f"ProbabilityTable is for snail_level={table.snail_level}, "
+            f"hole_bonus={table.hole_bonus}, not {snail_level}, {hole_bonus}"
+        )
     target = clamp01(float(desired_success))
 
     lo = int(low)
     hi = int(high)
+
+    if table is not None and lo <= table.max_k:
+        # Success chance is non-decreasing in k, so the table is sorted.
+        top = min(hi, table.max_k)
+        covered = table.success[lo : top + 1]
+        idx = int(np.searchsorted(covered, target, side="left"))
+        if idx < covered.size:
+            return lo + idx
+        lo = top + 1
+        if lo > hi:
+            return hi
+
     while lo < hi:
         mid = (lo + hi) // 2
         ps = float(p_success_fn(snail_level, float(mid), hole_bonus))
@@ -0,0 +1,363 @@
+"""Named engine backends and a cross-backend equivalence harness.
+
+Every backend is a per-block `TrialRunner` (fills one block of
+TrialResults from an explicit RNG), so any backend runs in-process, in
+the process pool (`workers=`), streaming or cached without changes.
+
+Backends that consume the RNG in the same order share a `stream` name
+and must agree trial for trial. Backends on different streams can only
+agree in distribution, which `check_equivalence` tests with chi-square
+and two-sample Kolmogorov-Smirnov tests.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from statistics import NormalDist
+from typing import Protocol
+
+import numpy as np
+from numpy.random import Generator
+
+from gaming_monte_carlo.simulation.engine import (
+    run_simulation,
+    run_trials,
+    run_trials_fast,
+    run_trials_vectorized,
+)
+from gaming_monte_carlo.simulation.metrics import SummaryAccumulator
+from gaming_monte_carlo.simulation.results import TrialResults
+from gaming_monte_carlo.simulation.rules import Rules
+from gaming_monte_carlo.simulation.state import TrialConfig
+
+
+class Engine(Protocol):
+    """Fills `out` (one stream block of TrialResults) from an RNG."""
+
+    def __call__(
+        self, *, config: TrialConfig, rules: Rules, rng: Generator, out: TrialResults
+    ) -> None: ...
+
+
+@dataclass(frozen=True, slots=True)
+class EngineBackend:
+    """A registered engine.
+
+    Attributes:
+        name: Registry name (the --engine value).
+        runner: Per-block runner. Must be a module-level function so the
+            process pool can pickle it.
+        stream: RNG consumption order. Backends with the same stream
+            produce identical trials for the same seed.
+        description: One line for help output.
+    """
+
+    name: str
+    runner: Engine
+    stream: str
+    description: str = ""
+
+
+_REGISTRY: dict[str, EngineBackend] = {}
+
+
+def register_engine(
+    name: str, runner: Engine, *, stream: str, description: str = ""
+) -> EngineBackend:
+    """Add a backend to the registry.
+
+    Raises:
+        ValueError: If the name is already taken by a different runner.
+    """
+    backend = EngineBackend(name=name, runner=runner, stream=stream, description=description)
+    existing = _REGISTRY.get(name)
+    if existing is not None and existing.runner is not runner:
+        raise ValueError(f"Engine {name!r} is already registered")
+    _REGISTRY[name] = backend
+    return backend
+
+
+def get_engine(name: str) -> EngineBackend:
+    """Look up a backend by name.
+
+    Raises:
+        ValueError: For unknown names.
+    """
+    try:
+        return _REGISTRY[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown engine {name!r}; choose from {', '.join(engine_names())}"
+        ) from None
+
+
+def engine_names() -> list[str]:
+    """Registered backend names, sorted."""
+    return sorted(_REGISTRY)
+
+
+register_engine(
+    "reference",
+    run_trials,
+    stream="sequential",
+    description="run_one_trial per trial (the specification)",
+)
+register_engine(
+    "fast",
+    run_trials_fast,
+    stream="sequential",
+    description="scalar loop on locals and buffered uniforms; identical to reference",
+)
+register_engine(
+    "vectorized",
+    run_trials_vectorized,
+    stream="vectorized",
+    description="all live trials advanced together as NumPy arrays",
+)
+
+
+@dataclass(frozen=True, slots=True)
+class StatTest:
+    """One hypothesis test of "both backends have the same distribution".
+
+    Attributes:
+        name: What was compared, e.g. "chi2 attempts".
+        statistic: Test statistic.
+        p_value: p-value under the null of equal distributions.
+    """
+
+    name: str
+    statistic: float
+    p_value: float
+
+
+@dataclass(frozen=True, slots=True)
+class EquivalenceReport:
+    """Outcome of `check_equivalence`.
+
+    Attributes:
+        engine_a: First backend name.
+        engine_b: Second backend name.
+        n_trials: Trials per backend.
+        exact: True if the backends share a stream (trials compared
+            row by row), False if only distributions were tested.
+        mismatched_trials: Rows that differ (exact mode only).
+        tests: Distribution tests (different streams only).
+        alpha: Family-wise significance level.
+        passed: True if the backends are judged equivalent.
+    """
+
+    engine_a: str
+    engine_b: str
+    n_trials: int
+    exact: bool
+    mismatched_trials: int
+    tests: tuple[StatTest, ...]
+    alpha: float
+    passed: bool
+
+    def __str__(self) -> str:
+        head = f"{self.engine_a} vs {self.engine_b} ({self.n_trials} trials each): "
+        if self.exact:
+            return head + (
+                "identical" if self.passed else f"{self.mismatched_trials} trials differ"
+            )
+        # Bonferroni: each test is held to alpha / len(tests).
+        level = self.alpha / max(1, len(self.tests))
+        lines = [head + ("equivalent" if self.passed else "NOT equivalent")]
+        for t in self.tests:
+            flag = "" if t.p_value >= level else "  <-- rejected"
+            lines.append(f"  {t.name:<28} stat={t.statistic:12.4f}  p={t.p_value:.4g}{flag}")
+        return "\n".join(lines)
+
+
+def check_equivalence(
+    engine_a: str,
+    engine_b: str,
+    *,
+    config: TrialConfig,
+    rules: Rules,
+    n_trials: int,
+    seed: int,
+    alpha: float = 0.001,
+) -> EquivalenceReport:
+    """Run two backends on the same config and seed and compare them.
+
+    Backends on the same stream must match trial for trial. Otherwise
+    the outcome distributions are compared with:
+
+      - chi-square on the success rate,
+      - chi-square homogeneity on attempts split by outcome, and on
+        resets,
+      - two-sample KS on energy spent,
+      - a z-test on expected_energy_per_success (delta-method errors).
+
+    The backends are judged equivalent if no test rejects at the
+    Bonferroni-adjusted level alpha / number_of_tests.
+
+    Args:
+        engine_a: First backend name.
+        engine_b: Second backend name.
+        config: Trial configuration.
+        rules: Rules.
+        n_trials: Trials per backend.
+        seed: RNG seed used by both.
+        alpha: Family-wise significance level.
+
+    Returns:
+        EquivalenceReport.
+    """
+    a, b = get_engine(engine_a), get_engine(engine_b)
+    ra = run_simulation(config=config, rules=rules, n_trials=n_trials, seed=seed, runner=a.runner)
+    rb = run_simulation(config=config, rules=rules, n_trials=n_trials, seed=seed, runner=b.runner)
+
+    if a.stream == b.stream:
+        same = ra.success == rb.success
+        for column in ("attempts", "resets", "energy_spent", "k_final"):
+            same &= getattr(ra, column) == getattr(rb, column)
+        mismatched = int(same.size - np.count_nonzero(same))
+        return EquivalenceReport(
+            engine_a=a.name,
+            engine_b=b.name,
+            n_trials=int(n_trials),
+            exact=True,
+            mismatched_trials=mismatched,
+            tests=(),
+            alpha=float(alpha),
+            passed=mismatched == 0,
+        )
+
+    # Attempts per outcome: successes use categories 0..K, fails K+1..2K+1.
+    width = int(max(ra.attempts.max(initial=0), rb.attempts.max(initial=0))) + 1
+    tests = (
+        _chi2_homogeneity("chi2 success", ra.success.astype(np.int64), rb.success.astype(np.int64)),
+        _chi2_homogeneity(
+            "chi2 attempts by outcome",
+            ra.attempts + width * (~ra.success),
+            rb.attempts + width * (~rb.success),
+        ),
+        _chi2_homogeneity("chi2 resets", ra.resets, rb.resets),
+        _ks_two_sample("ks energy_spent", ra.energy_spent, rb.energy_spent),
+        _ratio_z_test(
+            "z energy_per_success",
+            SummaryAccumulator().update(ra),
+            SummaryAccumulator().update(rb),
+        ),
+    )
+    level = float(alpha) / len(tests)
+    return EquivalenceReport(
+        engine_a=a.name,
+        engine_b=b.name,
+        n_trials=int(n_trials),
+        exact=False,
+        mismatched_trials=0,
+        tests=tests,
+        alpha=float(alpha),
+        passed=all(t.p_value >= level for t in tests),
+    )
+
+
+def _chi2_homogeneity(name: str, x: np.ndarray, y: np.ndarray) -> StatTest:
+    """Chi-square test that two samples of small integers match.
+
+    Categories with fewer than 10 observations in total are pooled, so
+    every expected count is at least about 5.
+    """
+    size = int(max(x.max(initial=0), y.max(initial=0))) + 1
+    counts = np.stack([np.bincount(x, minlength=size), np.bincount(y, minlength=size)])
+    totals = counts.sum(axis=0)
+
+    sparse = totals < 10
+    pooled = counts[:, ~sparse]
+    if sparse.any():
+        pooled = np.column_stack([pooled, counts[:, sparse].sum(axis=1)])
+    pooled = pooled[:, pooled.sum(axis=0) > 0]
+    if pooled.shape[1] < 2:
+        return StatTest(name=name, statistic=0.0, p_value=1.0)
+
+    expected = np.outer(pooled.sum(axis=1), pooled.sum(axis=0)) / pooled.sum()
+    stat = float(((pooled - expected) ** 2 / expected).sum())
+    return StatTest(name=name, statistic=stat, p_value=_chi2_sf(stat, pooled.shape[1] - 1))
+
+
+def _ks_two_sample(name: str, x: np.ndarray, y: np.ndarray) -> StatTest:
+    """Two-sample KS test with the asymptotic Kolmogorov p-value.
+
+    With discrete data the test is conservative.
+    """
+    xs, ys = np.sort(x), np.sort(y)
+    grid = np.union1d(xs, ys)
+    cdf_x = np.searchsorted(xs, grid, side="right") / xs.size
+    cdf_y = np.searchsorted(ys, grid, side="right") / ys.size
+    d = float(np.abs(cdf_x - cdf_y).max(initial=0.0))
+
+    ne = xs.size * ys.size / (xs.size + ys.size)
+    lam = (math.sqrt(ne) + 0.12 + 0.11 / math.sqrt(ne)) * d
+    return StatTest(name=name, statistic=d, p_value=_kolmogorov_sf(lam))
+
+
+def _ratio_z_test(name: str, a: SummaryAccumulator, b: SummaryAccumulator) -> StatTest:
+    """Two-sided z-test that two energy-per-success ratios are equal."""
+    ia, ib = a.energy_per_success_interval(), b.energy_per_success_interval()
+    se = math.hypot(ia.std_error, ib.std_error)
+    if not math.isfinite(se) or se == 0.0:
+        equal = ia.estimate == ib.estimate
+        return StatTest(name=name, statistic=0.0 if equal else float("inf"), p_value=float(equal))
+    z = (ia.estimate - ib.estimate) / se
+    return StatTest(name=name, statistic=z, p_value=2.0 * NormalDist().cdf(-abs(z)))
+
+
+def _kolmogorov_sf(lam: float) -> float:
+    """P(K > lam) for the Kolmogorov distribution."""
+    if lam < 0.2:
+        return 1.0
+    total = 0.0
+    for j in range(1, 101):
+        term = 2.0 * (-1) ** (j - 1) * math.exp(-2.0 * j * j * lam * lam)
+        total += term
+        if abs(term) < 1e-12:
+            break
+    return min(1.0, max(0.0, total))
+
+
+def _chi2_sf(x: float, df: int) -> float:
+    """Survival function of the chi-square distribution.
+
+    Equal to the regularized upper incomplete gamma Q(df / 2, x / 2),
+    evaluated by series below a + 1 and by continued fraction above.
+    """
+    if x <= 0.0:
+        return 1.0
+    a, z = df / 2.0, x / 2.0
+    log_prefix = a * math.log(z) - z - math.lgamma(a)
+    if z < a + 1.0:
+        term = total = 1.0 / a
+        ap = a
+        for _ in range(1000):
+            ap += 1.0
+            term *= z / ap
+            total += term
+            if abs(term) < abs(total) * 1e-15:
+                break
+        return max(0.0, 1.0 - total * math.exp(log_prefix))
+
+    # Lentz's continued fraction for Q(a, z).
+    tiny = 1e-300
+    b = z + 1.0 - a
+    c = 1.0 / tiny
+    d = 1.0 / b
+    h = d
+    for i in range(1, 1000):
+        an = -i * (i - a)
+        b += 2.0
+        d = an * d + b
+        d = tiny if abs(d) < tiny else d
+        c = b + an / c
+        c = tiny if abs(c) < tiny else c
+        d = 1.0 / d
+        delta = d * c
+        h *= delta
+        if abs(delta - 1.0) < 1e-15:
+            break
+    return min(1.0, h * math.exp(log_prefix))
@@ -0,0 +1,284 @@
+"""Persistent, content-addressed cache of seeded simulation results.
+
+A seeded simulation is a pure function of (config, rules, seed,
+n_trials, runner) and of the code that implements the mechanics. Each
+entry is keyed by a SHA-256 over those inputs plus a hash of the
+mechanics source files, so editing the rules or an engine changes every
+key and old entries simply stop being hit (and age out).
+
+Layout under the cache root:
+
+    index.sqlite   one row per entry: accumulator JSON, size, last use
+    trials/<key>.npz   optional per-trial columns
+
+Entries are evicted least-recently-used first whenever the total size
+goes over `max_bytes`.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+import time
+from collections.abc import Callable, Iterator
+from contextlib import closing, contextmanager
+from dataclasses import fields
+from pathlib import Path
+
+import numpy as np
+
+from gaming_monte_carlo.simulation import (
+    distributions,
+    engine,
+    metrics,
+    results,
+    rules,
+    state,
+    streams,
+)
+from gaming_monte_carlo.simulation.engine import TrialRunner
+from gaming_monte_carlo.simulation.metrics import SummaryAccumulator
+from gaming_monte_carlo.simulation.results import TrialResults
+from gaming_monte_carlo.simulation.rules import Rules
+from gaming_monte_carlo.simulation.serialization import run_to_dict
+from gaming_monte_carlo.simulation.state import TrialConfig
+
+CACHE_DIR_ENV = "GAMING_MONTE_CARLO_CACHE_DIR"
+DEFAULT_MAX_BYTES = 1 << 30
+
+# Modules whose source defines what a seeded run produces.
+_VERSIONED_MODULES = (distributions, engine, metrics, results, rules, state, streams)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    accumulator TEXT,
+    has_trials INTEGER NOT NULL DEFAULT 0,
+    size INTEGER NOT NULL,
+    last_used REAL NOT NULL
+)
+"""
+
+
+def default_cache_dir() -> Path:
+    """Cache root from $GAMING_MONTE_CARLO_CACHE_DIR, else ~/.cache."""
+    env = os.environ.get(CACHE_DIR_ENV)
+    if env:
+        return Path(env).expanduser()
+    return Path.home() / ".cache" / "gaming_monte_carlo"
+
+
+def runner_name(runner: TrialRunner) -> str:
+    """Qualified name identifying a trial runner."""
+    return f"{runner.__module__}.{runner.__qualname__}"
+
+
+def code_version(runner: TrialRunner) -> str:
+    """Hash of the mechanics source plus the runner's own module."""
+    module = sys.modules.get(getattr(runner, "__module__", ""), None)
+    files = [Path(m.__file__) for m in _VERSIONED_MODULES]
+    if module is not None and getattr(module, "__file__", None):
+        files.append(Path(module.__file__))
+    return _files_hash(tuple(sorted(set(files))))
+
+
+@functools.cache
+def _files_hash(files: tuple[Path, ...]) -> str:
+    """SHA-256 over the contents of source files (cached per process)."""
+    digest = hashlib.sha256()
+    for path in files:
+        digest.update(path.name.encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def simulation_key(
+    *,
+    config: TrialConfig,
+    rules: Rules,
+    n_trials: int,
+    seed: int | None,
+    runner: TrialRunner,
+) -> str:
+    """Stable cache key for a seeded simulation.
+
+    Raises:
+        ValueError: If seed is None (unseeded runs are not reproducible).
+    """
+    if seed is None:
+        raise ValueError("Only seeded simulations can be cached")
+    payload = {
+        **run_to_dict(config, rules),
+        "n_trials": int(n_trials),
+        "seed": int(seed),
+        "runner": runner_name(runner),
+        "code": code_version(runner),
+    }
+    blob = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(blob.encode()).hexdigest()
+
+
+class SimulationCache:
+    """On-disk cache of accumulators and per-trial columns.
+
+    Safe to share between processes: every operation opens its own
+    SQLite connection, and blobs are written to a temporary file and
+    renamed into place.
+
+    Args:
+        root: Cache directory (created on first use).
+        max_bytes: Size limit for all entries. None disables eviction.
+    """
+
+    def __init__(self, root: Path | None = None, *, max_bytes: int | None = DEFAULT_MAX_BYTES):
+        self.root = default_cache_dir() if root is None else Path(root)
+        self.max_bytes = max_bytes
+
+    def get_accumulator(self, key: str) -> SummaryAccumulator | None:
+        """Cached accumulator for a key, or None."""
+        with self._db() as db:
+            row = db.execute("SELECT accumulator FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is None or row[0] is None:
+                return None
+            self._touch(db, key)
+        return SummaryAccumulator.from_dict(json.loads(row[0]))
+
+    def put_accumulator(self, key: str, acc: SummaryAccumulator) -> None:
+        """Store an accumulator."""
+        blob = json.dumps(acc.to_dict(), separators=(",", ":"))
+        with self._db() as db:
+            db.execute(
+                "INSERT INTO entries (key, accumulator, size, last_used) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET accumulator = excluded.accumulator, "
+                "last_used = excluded.last_used",
+                (key, blob, len(blob), time.time()),
+            )
+            self._evict(db)
+
+    def get_trials(self, key: str) -> TrialResults | None:
+        """Cached per-trial columns for a key, or None."""
+        path = self._trials_path(key)
+        with self._db() as db:
+            row = db.execute("SELECT has_trials FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is None or not row[0] or not path.exists():
+                return None
+            self._touch(db, key)
+        with np.load(path) as data:
+            return TrialResults(**{f.name: data[f.name] for f in fields(TrialResults)})
+
+    def put_trials(self, key: str, trials: TrialResults) -> None:
+        """Store per-trial columns (and their accumulator)."""
+        path = self._trials_path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        with tmp.open("wb") as fh:
+            np.savez(fh, **{f.name: getattr(trials, f.name) for f in fields(TrialResults)})
+        os.replace(tmp, path)
+
+        acc = SummaryAccumulator().update(trials)
+        blob = json.dumps(acc.to_dict(), separators=(",", ":"))
+        with self._db() as db:
+            db.execute(
+                "INSERT OR REPLACE INTO entries (key, accumulator, has_trials, size, last_used) "
+                "VALUES (?, ?, 1, ?, ?)",
+                (key, blob, len(blob) + path.stat().st_size, time.time()),
+            )
+            self._evict(db)
+
+    def size_bytes(self) -> int:
+        """Total size of all entries."""
+        with self._db() as db:
+            return int(db.execute("SELECT coalesce(sum(size), 0) FROM entries").fetchone()[0])
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._db() as db:
+            keys = [k for (k,) in db.execute("SELECT key FROM entries WHERE has_trials = 1")]
+            db.execute("DELETE FROM entries")
+        for key in keys:
+            self._trials_path(key).unlink(missing_ok=True)
+
+    def _trials_path(self, key: str) -> Path:
+        return self.root / "trials" / f"{key}.npz"
+
+    @contextmanager
+    def _db(self) -> Iterator[sqlite3.Connection]:
+        """Open the index, committing on success."""
+        self.root.mkdir(parents=True, exist_ok=True)
+        with closing(sqlite3.connect(self.root / "index.sqlite", timeout=30.0)) as db:
+            with db:
+                db.execute(_SCHEMA)
+                yield db
+
+    def _touch(self, db: sqlite3.Connection, key: str) -> None:
+        db.execute("UPDATE entries SET last_used = ? WHERE key = ?", (time.time(), key))
+
+    def _evict(self, db: sqlite3.Connection) -> None:
+        """Drop least recently used entries until under max_bytes."""
+        if self.max_bytes is None:
+            return
+        total = int(db.execute("SELECT coalesce(sum(size), 0) FROM entries").fetchone()[0])
+        if total <= self.max_bytes:
+            return
+        rows = db.execute(
+            "SELECT key, size, has_trials FROM entries ORDER BY last_used, rowid"
+        ).fetchall()
+        for key, size, has_trials in rows:
+            if total <= self.max_bytes:
+                break
+            db.execute("DELETE FROM entries WHERE key = ?", (key,))
+            if has_trials:
+                self._trials_path(key).unlink(missing_ok=True)
+            total -= int(size)
+
+
+def cached_accumulator(
+    cache: SimulationCache | None,
+    *,
+    config: TrialConfig,
+    rules: Rules,
+    n_trials: int,
+    seed: int | None,
+    runner: TrialRunner,
+    compute: Callable[[], SummaryAccumulator],
+) -> SummaryAccumulator:
+    """Return the cached accumulator for a run, computing it on a miss.
+
+    Unseeded runs (and a None cache) always compute.
+    """
+    if cache is None or seed is None:
+        return compute()
+    key = simulation_key(config=config, rules=rules, n_trials=n_trials, seed=seed, runner=runner)
+    acc = cache.get_accumulator(key)
+    if acc is None:
+        acc = compute()
+        cache.put_accumulator(key, acc)
+    return acc
+
+
+def cached_trials(
+    cache: SimulationCache | None,
+    *,
+    config: TrialConfig,
+    rules: Rules,
+    n_trials: int,
+    seed: int | None,
+    runner: TrialRunner,
+    compute: Callable[[], TrialResults],
+) -> TrialResults:
+    """Return the cached per-trial columns for a run, computing on a miss.
+
+    Unseeded runs (and a None cache) always compute.
+    """
+    if cache is None or seed is None:
+        return compute()
+    key = simulation_key(config=config, rules=rules, n_trials=n_trials, seed=seed, runner=runner)
+    trials = cache.get_trials(key)
+    if trials is None:
+        trials = compute()
+        cache.put_trials(key, trials)
+    return trials
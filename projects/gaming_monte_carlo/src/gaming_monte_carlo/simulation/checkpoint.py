@@ -0,0 +1,307 @@
+"""Checkpointed, resumable and extendable accumulated simulations.
+
+Every stream block has its own RNG derived from the root entropy and
+the block index (see `streams.py`), so a run that has finished blocks
+[0, b) is fully described by its accumulator, the root entropy and b.
+A checkpoint stores exactly that, plus the bit-generator state of block
+b, which is checked on resume so a changed stream layout is caught
+instead of silently mixing two streams. Resuming therefore gives the
+same accumulator as an uninterrupted run, bit for bit, whatever the
+engine.
+
+Checkpoints are JSON files written to a temporary file and renamed
+into place, so a crash mid-write leaves the previous checkpoint intact.
+
+Extending a finished run by more trials reuses its accumulator: only
+the partial last block (if any) is re-simulated, removed with
+`SummaryAccumulator.subtract`, and the run continues from that block.
+The result equals a fresh run of the larger trial count.
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from gaming_monte_carlo.simulation.cache import (
+    SimulationCache,
+    code_version,
+    runner_name,
+    simulation_key,
+)
+from gaming_monte_carlo.simulation.engine import TrialRunner, run_trials
+from gaming_monte_carlo.simulation.metrics import SummaryAccumulator
+from gaming_monte_carlo.simulation.results import TrialResults
+from gaming_monte_carlo.simulation.rules import Rules
+from gaming_monte_carlo.simulation.serialization import (
+    read_json,
+    run_from_dict,
+    run_to_dict,
+    write_json_atomic,
+)
+from gaming_monte_carlo.simulation.state import TrialConfig
+from gaming_monte_carlo.simulation.streams import (
+    STREAM_BLOCK_SIZE,
+    block_rng,
+    iter_blocks,
+    n_blocks,
+    root_seed_sequence,
+)
+
+DEFAULT_CHECKPOINT_SECONDS = 60.0
+
+
+@dataclass(frozen=True, slots=True)
+class Checkpoint:
+    """State of an accumulated run after its first `next_block` blocks.
+
+    Attributes:
+        config: Trial configuration.
+        rules: Rules.
+        n_trials: Trials the run will have when finished.
+        entropy: Root SeedSequence entropy (the seed, or the OS entropy
+            drawn for an unseeded run).
+        runner: Qualified name of the per-block runner.
+        code_version: Hash of the mechanics source (see
+            `cache.code_version`).
+        next_block: First block not yet in the accumulator.
+        rng_state: Bit-generator state block `next_block` starts from.
+        accumulator: Totals over blocks [0, next_block).
+    """
+
+    config: TrialConfig
+    rules: Rules
+    n_trials: int
+    entropy: int
+    runner: str
+    code_version: str
+    next_block: int
+    rng_state: dict[str, Any]
+    accumulator: SummaryAccumulator
+
+    @property
+    def done(self) -> bool:
+        """True once every block is in the accumulator."""
+        return self.next_block >= n_blocks(self.n_trials)
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON-ready checkpoint (see `from_dict`)."""
+        return {
+            **run_to_dict(self.config, self.rules),
+            "n_trials": self.n_trials,
+            "entropy": self.entropy,
+            "runner": self.runner,
+            "code_version": self.code_version,
+            "next_block": self.next_block,
+            "rng_state": self.rng_state,
+            "accumulator": self.accumulator.to_dict(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> Checkpoint:
+        """Inverse of `to_dict`."""
+        config, rules = run_from_dict(data)
+        return cls(
+            config=config,
+            rules=rules,
+            n_trials=int(data["n_trials"]),
+            entropy=int(data["entropy"]),
+            runner=str(data["runner"]),
+            code_version=str(data["code_version"]),
+            next_block=int(data["next_block"]),
+            rng_state=dict(data["rng_state"]),
+            accumulator=SummaryAccumulator.from_dict(data["accumulator"]),
+        )
+
+    def save(self, path: Path) -> None:
+        """Write atomically (temporary file, then rename)."""
+        write_json_atomic(path, self.to_dict())
+
+    @classmethod
+    def load(cls, path: Path) -> Checkpoint:
+        """Read a checkpoint written by `save`."""
+        return cls.from_dict(read_json(path))
+
+
+def _block_state(entropy: int, block: int) -> dict[str, Any]:
+    return block_rng(root_seed_sequence(entropy), block).bit_generator.state
+
+
+def run_simulation_checkpointed(
+    *,
+    config: TrialConfig,
+    rules: Rules,
+    n_trials: int,
+    path: Path,
+    seed: int | None = None,
+    runner: TrialRunner = run_trials,
+    resume: bool = False,
+    every_seconds: float = DEFAULT_CHECKPOINT_SECONDS,
+) -> SummaryAccumulator:
+    """Accumulate a run block by block, checkpointing to `path`.
+
+    A checkpoint is written whenever `every_seconds` have passed since
+    the last one, and once more when the run finishes.
+
+    Args:
+        config: Trial configuration.
+        rules: Rules.
+        n_trials: Number of trials.
+        path: Checkpoint file.
+        seed: RNG seed. None uses fresh OS entropy (recorded in the
+            checkpoint, so unseeded runs resume too). When resuming,
+            None takes the checkpoint's entropy and a seed must match
+            it.
+        runner: Per-block trial runner.
+        resume: Continue from `path` if it exists, instead of starting
+            over.
+        every_seconds: Minimum wall time between checkpoints.
+
+    Returns:
+        The accumulator of all n_trials trials, identical to an
+        uninterrupted `run_simulation_streaming` run.
+
+    Raises:
+        ValueError: If the checkpoint belongs to a different run (or
+            seed) or its RNG state does not match the stream.
+    """
+    path = Path(path)
+    version = code_version(runner)
+    if resume and path.exists():
+        checkpoint = Checkpoint.load(path)
+        expected = (config, rules, int(n_trials), runner_name(runner), version)
+        found = (
+            checkpoint.config,
+            checkpoint.rules,
+            checkpoint.n_trials,
+            checkpoint.runner,
+            checkpoint.code_version,
+        )
+        if found != expected:
+            raise ValueError(f"Checkpoint {path} is for a different run: {found} != {expected}")
+        if seed is not None and int(root_seed_sequence(seed).entropy) != checkpoint.entropy:
+            raise ValueError(f"Checkpoint {path} was written with a different seed")
+        if checkpoint.rng_state != _block_state(checkpoint.entropy, checkpoint.next_block):
+            raise ValueError(f"Checkpoint {path} does not match the RNG stream layout")
+        entropy = checkpoint.entropy
+        acc = checkpoint.accumulator
+        start = checkpoint.next_block
+    else:
+        entropy = int(root_seed_sequence(seed).entropy)
+        acc = SummaryAccumulator()
+        start = 0
+
+    def save(next_block: int) -> None:
+        Checkpoint(
+            config=config,
+            rules=rules,
+            n_trials=int(n_trials),
+            entropy=entropy,
+            runner=runner_name(runner),
+            code_version=version,
+            next_block=next_block,
+            rng_state=_block_state(entropy, next_block),
+            accumulator=acc,
+        ).save(path)
+
+    root = root_seed_sequence(entropy)
+    buffer = TrialResults.empty(min(int(n_trials), STREAM_BLOCK_SIZE))
+    last_save = time.monotonic()
+    for block, size in iter_blocks(n_trials, start_block=start):
+        out = buffer[:size]
+        runner(config=config, rules=rules, rng=block_rng(root, block), out=out)
+        acc.update(out)
+        if time.monotonic() - last_save >= every_seconds:
+            save(block + 1)
+            last_save = time.monotonic()
+    save(n_blocks(n_trials))
+    return acc
+
+
+def extend_accumulator(
+    acc: SummaryAccumulator,
+    *,
+    config: TrialConfig,
+    rules: Rules,
+    extra_trials: int,
+    seed: int,
+    runner: TrialRunner = run_trials,
+) -> SummaryAccumulator:
+    """Add trials to a finished seeded run without redoing it.
+
+    Args:
+        acc: Accumulator of a finished `acc.n_trials`-trial run with this
+            config, rules, seed and runner. Not modified.
+        config: Trial configuration.
+        rules: Rules.
+        extra_trials: Trials to add.
+        seed: RNG seed of the run.
+        runner: Per-block trial runner of the run.
+
+    Returns:
+        A new accumulator equal to a fresh run of
+        acc.n_trials + extra_trials trials.
+    """
+    n_old = acc.n_trials
+    n_new = n_old + int(extra_trials)
+    root = root_seed_sequence(seed)
+    extended = SummaryAccumulator.from_dict(acc.to_dict())
+
+    # Trials in a block depend on the block size for some engines, so
+    # a partial last block is re-simulated at its full new size.
+    start, partial = divmod(n_old, STREAM_BLOCK_SIZE)
+    if partial:
+        out = TrialResults.empty(partial)
+        runner(config=config, rules=rules, rng=block_rng(root, start), out=out)
+        extended.subtract(SummaryAccumulator().update(out))
+
+    for block, size in iter_blocks(n_new, start_block=start):
+        out = TrialResults.empty(size)
+        runner(config=config, rules=rules, rng=block_rng(root, block), out=out)
+        extended.update(out)
+    return extended
+
+
+def extend_cached_accumulator(
+    cache: SimulationCache,
+    *,
+    config: TrialConfig,
+    rules: Rules,
+    from_trials: int,
+    n_trials: int,
+    seed: int,
+    runner: TrialRunner = run_trials,
+) -> SummaryAccumulator:
+    """Cached n_trials result, extended from from_trials if needed.
+
+    On a cache hit for n_trials nothing is simulated. Otherwise the
+    from_trials entry is extended by the difference (or computed from
+    scratch if it is missing too), and the result is stored under
+    n_trials.
+
+    Raises:
+        ValueError: If from_trials > n_trials.
+    """
+    if from_trials > n_trials:
+        raise ValueError(f"Cannot extend {from_trials} trials down to {n_trials}")
+    key = simulation_key(config=config, rules=rules, n_trials=n_trials, seed=seed, runner=runner)
+    acc = cache.get_accumulator(key)
+    if acc is not None:
+        return acc
+
+    base_key = simulation_key(
+        config=config, rules=rules, n_trials=from_trials, seed=seed, runner=runner
+    )
+    base = cache.get_accumulator(base_key) or SummaryAccumulator()
+    acc = extend_accumulator(
+        base,
+        config=config,
+        rules=rules,
+        extra_trials=n_trials - base.n_trials,
+        seed=seed,
+        runner=runner,
+    )
+    cache.put_accumulator(key, acc)
+    return acc
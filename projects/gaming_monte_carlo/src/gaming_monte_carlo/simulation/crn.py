@@ -0,0 +1,221 @@
+"""Common-random-numbers (CRN) sweeps over initial_k.
+
+Trial i of every k in a sweep is driven by the same row of uniforms
+(see `engine.run_trials_from_uniforms`), so the per-k estimates are
+positively correlated and the differences between them are much more
+precise than with independent streams.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from gaming_monte_carlo.simulation.distributions import OutcomeDistributions
+from gaming_monte_carlo.simulation.engine import run_trials_from_uniforms, uniform_row_width
+from gaming_monte_carlo.simulation.metrics import Interval, Summary, SummaryAccumulator
+from gaming_monte_carlo.simulation.results import TrialResults
+from gaming_monte_carlo.simulation.rules import Rules
+from gaming_monte_carlo.simulation.state import TrialConfig
+from gaming_monte_carlo.simulation.streams import block_rng, iter_blocks, root_seed_sequence
+
+
+@dataclass(frozen=True, slots=True)
+class PairedDelta:
+    """Difference in expected_energy_per_success between two k values.
+
+    Attributes:
+        k_a: First k.
+        k_b: Second k.
+        interval: Interval for R(k_b) - R(k_a) from paired (CRN) trials.
+        independent_std_error: Standard error the same difference would
+            have with independent streams, for comparison.
+    """
+
+    k_a: int
+    k_b: int
+    interval: Interval
+    independent_std_error: float
+
+    @property
+    def variance_reduction(self) -> float:
+        """Independent variance divided by paired variance."""
+        paired = self.interval.std_error
+        if paired == 0.0:
+            return float("inf")
+        return (self.independent_std_error / paired) ** 2
+
+
+@dataclass(slots=True)
+class PairedSweepAccumulator:
+    """Running cross moments of (energy, success) across a k sweep.
+
+    For every trial the vector X = (E_k1..E_km, S_k1..S_km) is formed
+    and sum(X) and sum(X X^T) are accumulated exactly in int64, which is
+    enough to get the delta-method covariance of any two per-k
+    energy-per-success ratios.
+    """
+
+    ks: tuple[int, ...]
+    n_trials: int = 0
+    sums: np.ndarray = field(init=False)
+    cross: np.ndarray = field(init=False)
+
+    def __post_init__(self) -> None:
+        m = 2 * len(self.ks)
+        self.sums = np.zeros(m, dtype=np.int64)
+        self.cross = np.zeros((m, m), dtype=np.int64)
+
+    def update(self, per_k: Sequence[TrialResults | None]) -> None:
+        """Add one block of paired results (one TrialResults per k).
+
+        A None entry marks a k that is no longer simulated (e.g. dropped
+        from a race); it contributes zeros, and its moments must not be
+        queried afterwards.
+        """
+        size = next(len(r) for r in per_k if r is not None)
+        zeros = np.zeros(size, dtype=np.int64)
+        x = np.concatenate(
+            [
+                np.stack([zeros if r is None else r.energy_spent for r in per_k], axis=1),
+                np.stack([zeros if r is None else r.success for r in per_k], axis=1),
+            ],
+            axis=1,
+        ).astype(np.int64)
+        self.n_trials += int(x.shape[0])
+        self.sums += x.sum(axis=0)
+        # Integer matmul has no BLAS path. Every partial sum of the float
+        # product is an integer below 2**53 when this bound holds, so the
+        # float64 result is exact.
+        peak = int(np.abs(x).max(initial=0))
+        if peak * peak * x.shape[0] < 2**53:
+            xf = x.astype(np.float64)
+            self.cross += (xf.T @ xf).astype(np.int64)
+        else:
+            self.cross += x.T @ x
+
+    def ratio(self, i: int) -> float:
+        """expected_energy_per_success for ks[i]."""
+        m = len(self.ks)
+        n_s = int(self.sums[m + i])
+        return float("inf") if n_s == 0 else int(self.sums[i]) / n_s
+
+    def _influence_cov(self, i: int, j: int) -> float:
+        """Mean of psi_i * psi_j, where psi is the ratio's influence.
+
+        psi_i = (E_i - R_i * S_i) / p_i for each trial.
+        """
+        m = len(self.ks)
+        n = self.n_trials
+        if n == 0 or self.sums[m + i] == 0 or self.sums[m + j] == 0:
+            return float("inf")
+        r_i, r_j = self.ratio(i), self.ratio(j)
+        p_i = int(self.sums[m + i]) / n
+        p_j = int(self.sums[m + j]) / n
+        ee = int(self.cross[i, j])
+        es = int(self.cross[i, m + j])
+        se = int(self.cross[m + i, j])
+        ss = int(self.cross[m + i, m + j])
+        mean = (ee - r_j * es - r_i * se + r_i * r_j * ss) / n
+        return mean / (p_i * p_j)
+
+    def std_error(self, i: int) -> float:
+        """Standard error of expected_energy_per_success for ks[i]."""
+        return math.sqrt(max(0.0, self._influence_cov(i, i)) / self.n_trials)
+
+    def delta(self, i: int, j: int, confidence: float = 0.95) -> PairedDelta:
+        """Paired difference R(ks[j]) - R(ks[i]) with its interval."""
+        n = self.n_trials
+        var_i = self._influence_cov(i, i)
+        var_j = self._influence_cov(j, j)
+        var = float("inf")
+        if math.isfinite(var_i) and math.isfinite(var_j):
+            var = var_i + var_j - 2.0 * self._influence_cov(i, j)
+        return PairedDelta(
+            k_a=self.ks[i],
+            k_b=self.ks[j],
+            interval=Interval.normal(
+                self.ratio(j) - self.ratio(i), math.sqrt(max(0.0, var) / n), confidence
+            ),
+            independent_std_error=math.sqrt(max(0.0, var_i + var_j) / n),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class CrnSweep:
+    """Result of a common-random-numbers sweep.
+
+    Attributes:
+        summaries: Summary per k.
+        intervals: expected_energy_per_success interval per k.
+        deltas: Paired differences between neighbouring k values.
+        best_k: k with the lowest expected_energy_per_success.
+        distributions: Per-run outcome histograms per k.
+    """
+
+    summaries: dict[int, Summary]
+    intervals: dict[int, Interval]
+    deltas: list[PairedDelta]
+    best_k: int
+    distributions: dict[int, OutcomeDistributions]
+
+
+def run_crn_sweep(
+    *,
+    base_config: TrialConfig,
+    rules: Rules,
+    ks: Sequence[int],
+    n_trials: int,
+    seed: int | None = None,
+    confidence: float = 0.95,
+) -> CrnSweep:
+    """Simulate every k in `ks` from the same per-trial uniform rows.
+
+    Each stream block draws one (trials x 2 * max(ks)) uniform matrix,
+    and every k runs its trials from those rows.
+
+    Args:
+        base_config: Config providing snail level and hole bonus.
+        rules: Rules.
+        ks: initial_k values to compare.
+        n_trials: Trials per k.
+        seed: RNG seed. None uses fresh OS entropy.
+        confidence: Confidence level for intervals.
+
+    Returns:
+        CrnSweep.
+    """
+    ks = tuple(sorted({int(k) for k in ks}))
+    if not ks:
+        raise ValueError("ks must contain at least one k")
+
+    configs = [base_config.with_initial_k(k) for k in ks]
+    width = uniform_row_width(max(ks))
+    root = root_seed_sequence(seed)
+
+    per_k = [SummaryAccumulator() for _ in ks]
+    paired = PairedSweepAccumulator(ks)
+    for block, size in iter_blocks(n_trials):
+        uniforms = block_rng(root, block).random((size, width))
+        block_results: list[TrialResults] = []
+        for config, acc in zip(configs, per_k):
+            out = TrialResults.empty(size)
+            run_trials_from_uniforms(config=config, rules=rules, uniforms=uniforms, out=out)
+            acc.update(out)
+            block_results.append(out)
+        paired.update(block_results)
+
+    summaries = {k: acc.to_summary(c, rules) for k, c, acc in zip(ks, configs, per_k)}
+    intervals = {k: acc.energy_per_success_interval(confidence) for k, acc in zip(ks, per_k)}
+    deltas = [paired.delta(i, i + 1, confidence) for i in range(len(ks) - 1)]
+    best_k = min(summaries, key=lambda kk: summaries[kk].expected_energy_per_success)
+    return CrnSweep(
+        summaries=summaries,
+        intervals=intervals,
+        deltas=deltas,
+        best_k=best_k,
+        distributions={k: acc.distributions for k, acc in zip(ks, per_k)},
+    )
@@ -0,0 +1,348 @@
+"""Per-run outcome distributions: histograms and quantiles.
+
+Attempts, resets and energy per run are small non-negative integers
+(a run makes at most initial_k attempts), so unit-width integer
+histograms hold their distributions exactly in a few hundred counters.
+They are filled block by block, merge by adding counts, and give exact
+quantiles, so no approximate quantile sketch is needed.
+
+Energy until success (the energy of every failed run before the first
+success plus the successful run) is a compound geometric sum over runs.
+Its distribution is computed from the success and fail energy
+histograms with an FFT, without simulating repeated runs.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field, fields
+from typing import Any
+
+import numpy as np
+
+from gaming_monte_carlo.simulation.results import TrialResults
+
+DEFAULT_QUANTILES = (0.5, 0.9, 0.99)
+
+# Probability mass allowed to fall outside the energy-until-success grid.
+_TAIL_MASS = 1e-12
+
+# Largest FFT grid (in lattice units) for energy until success.
+_MAX_GRID = 1 << 24
+
+
+@dataclass(slots=True)
+class Histogram:
+    """Counts of a non-negative integer value (bin i holds value i).
+
+    Attributes:
+        counts: counts[v] is the number of observations equal to v.
+    """
+
+    counts: list[int] = field(default_factory=list)
+
+    def add(self, values: np.ndarray) -> Histogram:
+        """Count every value in an integer array.
+
+        Returns:
+            self, for chaining.
+        """
+        if values.size == 0:
+            return self
+        if int(values.min()) < 0:
+            raise ValueError("Histogram values must be non-negative")
+        return self._add_counts(np.bincount(values))
+
+    def merge(self, other: Histogram) -> Histogram:
+        """Add another histogram's counts into this one.
+
+        Returns:
+            self, for chaining.
+        """
+        return self._add_counts(np.asarray(other.counts, dtype=np.int64))
+
+    def subtract(self, other: Histogram) -> Histogram:
+        """Remove another histogram's (previously added) counts.
+
+        Trailing empty bins are dropped, so the result equals a
+        histogram built from the remaining observations only.
+
+        Returns:
+            self, for chaining.
+
+        Raises:
+            ValueError: If a count would become negative.
+        """
+        self._add_counts(-np.asarray(other.counts, dtype=np.int64))
+        if any(c < 0 for c in self.counts):
+            raise ValueError("Cannot subtract observations that were never added")
+        while self.counts and self.counts[-1] == 0:
+            self.counts.pop()
+        return self
+
+    def _add_counts(self, counts: np.ndarray) -> Histogram:
+        total = np.zeros(max(len(self.counts), counts.size), dtype=np.int64)
+        total[: len(self.counts)] = self.counts
+        total[: counts.size] += counts
+        self.counts = total.tolist()
+        return self
+
+    @property
+    def total(self) -> int:
+        """Number of observations."""
+        return sum(self.counts)
+
+    def mean(self) -> float:
+        """Mean value (0 when empty)."""
+        n = self.total
+        return sum(v * c for v, c in enumerate(self.counts)) / n if n else 0.0
+
+    def variance(self) -> float:
+        """Population variance (0 when empty)."""
+        n = self.total
+        if n == 0:
+            return 0.0
+        mean = self.mean()
+        return sum(c * (v - mean) ** 2 for v, c in enumerate(self.counts)) / n
+
+    def quantile(self, q: float) -> float:
+        """Smallest value v with P(X <= v) >= q (nan when empty)."""
+        n = self.total
+        if n == 0:
+            return float("nan")
+        cdf = np.cumsum(self.counts)
+        return float(np.searchsorted(cdf, float(q) * n, side="left"))
+
+    def pmf(self) -> np.ndarray:
+        """Probability of each value 0..len(counts)-1."""
+        counts = np.asarray(self.counts, dtype=float)
+        return counts / counts.sum() if counts.size else counts
+
+
+@dataclass(slots=True)
+class OutcomeDistributions:
+    """Mergeable histograms of attempts, resets and energy per run.
+
+    Every quantity is split by run outcome, so conditional and overall
+    distributions (and energy until success) can all be derived.
+    """
+
+    attempts_success: Histogram = field(default_factory=Histogram)
+    attempts_fail: Histogram = field(default_factory=Histogram)
+    resets_success: Histogram = field(default_factory=Histogram)
+    resets_fail: Histogram = field(default_factory=Histogram)
+    energy_success: Histogram = field(default_factory=Histogram)
+    energy_fail: Histogram = field(default_factory=Histogram)
+
+    def update(self, results: TrialResults) -> OutcomeDistributions:
+        """Add one chunk of results.
+
+        Returns:
+            self, for chaining.
+        """
+        won = results.success
+        lost = ~won
+        self.attempts_success.add(results.attempts[won])
+        self.attempts_fail.add(results.attempts[lost])
+        self.resets_success.add(results.resets[won])
+        self.resets_fail.add(results.resets[lost])
+        self.energy_success.add(results.energy_spent[won])
+        self.energy_fail.add(results.energy_spent[lost])
+        return self
+
+    def consume(self, chunks: Iterable[TrialResults]) -> OutcomeDistributions:
+        """Add every chunk from an iterable.
+
+        Returns:
+            self, for chaining.
+        """
+        for chunk in chunks:
+            self.update(chunk)
+        return self
+
+    def merge(self, other: OutcomeDistributions) -> OutcomeDistributions:
+        """Add another accumulator's counts into this one.
+
+        Returns:
+            self, for chaining.
+        """
+        for f in fields(self):
+            getattr(self, f.name).merge(getattr(other, f.name))
+        return self
+
+    def subtract(self, other: OutcomeDistributions) -> OutcomeDistributions:
+        """Remove another accumulator's (previously merged) counts.
+
+        Returns:
+            self, for chaining.
+        """
+        for f in fields(self):
+            getattr(self, f.name).subtract(getattr(other, f.name))
+        return self
+
+    def to_dict(self) -> dict[str, list[int]]:
+        """JSON-ready counts per histogram."""
+        return {f.name: list(getattr(self, f.name).counts) for f in fields(self)}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> OutcomeDistributions:
+        """Inverse of `to_dict`. Missing histograms are empty."""
+        return cls(
+            **{f.name: Histogram([int(c) for c in data.get(f.name, [])]) for f in fields(cls)}
+        )
+
+    def energy_until_success_pmf(self) -> tuple[np.ndarray, int, float]:
+        """Distribution of total energy spent up to and including success.
+
+        With per-run success probability p, the number of failed runs
+        before the first success is geometric, so the total is
+        S + F_1 + ... + F_N with N ~ Geometric(p). Its probability
+        generating function p * S(z) / (1 - q * F(z)) is evaluated on an
+        FFT grid. Energies are put on their greatest common divisor
+        lattice first, so the grid stays small.
+
+        Returns:
+            (pmf, unit, tail): pmf[i] is P(total == i * unit), and tail
+            bounds the probability mass the grid could not hold (it
+            wraps onto the start of the grid). pmf is empty when no run
+            has succeeded.
+        """
+        n_s = self.energy_success.total
+        n_f = self.energy_fail.total
+        if n_s == 0:
+            return np.zeros(0), 1, 1.0
+
+        observed = [
+            v
+            for h in (self.energy_success, self.energy_fail)
+            for v, c in enumerate(h.counts)
+            if c
+        ]
+        unit = math.gcd(*observed) or 1
+        s = self.energy_success.pmf()[::unit]
+        if n_f == 0:
+            return s, unit, 0.0
+
+        f = self.energy_fail.pmf()[::unit]
+        q = n_f / (n_s + n_f)
+        p = 1.0 - q
+        # Enough failed runs that P(N > n_max) < _TAIL_MASS, within the cap.
+        n_max = math.ceil(math.log(_TAIL_MASS) / math.log(q)) if q < 1.0 else _MAX_GRID
+        size = min(_MAX_GRID, (n_max + 1) * len(f) + len(s))
+        size = 1 << max(0, size - 1).bit_length()
+        n_fit = max(0, (size - len(s)) // len(f))
+        tail = q ** (n_fit + 1)
+
+        generating = p * np.fft.rfft(s, size) / (1.0 - q * np.fft.rfft(f, size))
+        pmf = np.clip(np.fft.irfft(generating, size), 0.0, None)
+        return pmf, unit, tail
+
+    def energy_until_success(self) -> EnergyUntilSuccess:
+        """Distribution and moments of energy until success.
+
+        The mean and standard deviation are exact compound-geometric
+        moments of the histograms, so they do not depend on the FFT grid:
+
+            E[T]   = E[S] + (q / p) E[F]
+            Var[T] = Var[S] + (q / p) Var[F] + (q / p^2) E[F]^2
+        """
+        pmf, unit, tail = self.energy_until_success_pmf()
+        n_s = self.energy_success.total
+        n_f = self.energy_fail.total
+        if n_s == 0:
+            inf = float("inf")
+            return EnergyUntilSuccess(pmf=pmf, unit=unit, tail=tail, mean=inf, std=inf)
+
+        q = n_f / (n_s + n_f)
+        p = 1.0 - q
+        mean_f = self.energy_fail.mean()
+        mean = self.energy_success.mean() + q / p * mean_f
+        var = (
+            self.energy_success.variance()
+            + q / p * self.energy_fail.variance()
+            + q / (p * p) * mean_f * mean_f
+        )
+        return EnergyUntilSuccess(pmf=pmf, unit=unit, tail=tail, mean=mean, std=math.sqrt(var))
+
+    def energy_until_success_quantiles(
+        self, quantiles: Sequence[float] = DEFAULT_QUANTILES
+    ) -> tuple[float, ...]:
+        """Quantiles of energy until success.
+
+        Levels the FFT grid cannot resolve (above 1 - tail) are inf.
+        """
+        dist = self.energy_until_success()
+        return tuple(dist.quantile(q) for q in quantiles)
+
+    def quantile_table(self, quantiles: Sequence[float] = DEFAULT_QUANTILES) -> QuantileTable:
+        """Per-run quantiles by outcome plus energy until success."""
+        qs = tuple(float(q) for q in quantiles)
+        rows = {
+            "attempts | success": self.attempts_success,
+            "attempts | fail": self.attempts_fail,
+            "resets | success": self.resets_success,
+            "resets | fail": self.resets_fail,
+            "energy | success": self.energy_success,
+            "energy | fail": self.energy_fail,
+        }
+        table = {name: tuple(h.quantile(q) for q in qs) for name, h in rows.items()}
+        table["energy until success"] = self.energy_until_success_quantiles(qs)
+        return QuantileTable(quantiles=qs, rows=table)
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class EnergyUntilSuccess:
+    """Energy until success for one configuration.
+
+    Attributes:
+        pmf: pmf[i] is P(total == i * unit); empty when no run succeeded.
+        unit: Lattice spacing of the energies.
+        tail: Bound on the probability mass beyond the grid.
+        mean: Expected energy until success (inf without successes).
+        std: Its standard deviation (inf without successes).
+    """
+
+    pmf: np.ndarray
+    unit: int
+    tail: float
+    mean: float
+    std: float
+
+    def quantile(self, q: float) -> float:
+        """Smallest total with P(T <= total) >= q.
+
+        Levels the FFT grid cannot resolve (above 1 - tail) are inf.
+        """
+        cdf = np.cumsum(self.pmf)
+        # Tolerate FFT round-off in the cumulative sum.
+        i = int(np.searchsorted(cdf, float(q) - 1e-9, side="left"))
+        reachable = i < cdf.size and float(q) <= 1.0 - self.tail
+        return float(i * self.unit) if reachable else float("inf")
+
+    def cdf(self, budget: float) -> float:
+        """P(T <= budget): probability of succeeding within a budget."""
+        if budget < 0 or self.pmf.size == 0:
+            return 0.0
+        i = min(int(budget // self.unit), self.pmf.size - 1)
+        return float(min(1.0, self.pmf[: i + 1].sum()))
+
+
+@dataclass(frozen=True, slots=True)
+class QuantileTable:
+    """Quantiles of several distributions.
+
+    Attributes:
+        quantiles: Probability levels, e.g. (0.5, 0.9, 0.99).
+        rows: Quantile values per distribution, in `quantiles` order.
+    """
+
+    quantiles: tuple[float, ...]
+    rows: dict[str, tuple[float, ...]]
+
+    def __str__(self) -> str:
+        header = f"{'':<22}" + "".join(f"{f'P{q * 100:g}':>12}" for q in self.quantiles)
+        lines = [header]
+        for name, values in self.rows.items():
+            lines.append(f"{name:<22}" + "".join(f"{v:12.1f}" for v in values))
+        return "\n".join(lines)
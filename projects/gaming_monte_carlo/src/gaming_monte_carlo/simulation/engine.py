@@ -1,37 +1,35 @@
 from __future__ import annotations
 
-import time
-from dataclasses import dataclass
+from collections.abc import Callable, Iterator
 
 import numpy as np
 from numpy.random import Generator
 
-from gaming_monte_carlo.simulation.rules import Rules, attempt_cost, p_reset_base, p_success
+from gaming_monte_carlo.simulation.results import TrialResult, TrialResults
+from gaming_monte_carlo.simulation.rules import ProbabilityTable, Rules, attempt_cost
 from gaming_monte_carlo.simulation.state import TrialConfig, TrialState
+from gaming_monte_carlo.simulation.streams import (
+    STREAM_BLOCK_SIZE,
+    block_rng,
+    iter_blocks,
+    n_blocks,
+    root_seed_sequence,
+)
 
+TrialRunner = Callable[..., None]
+"""Fills `out` (one stream block of TrialResults) from an explicit RNG."""
 
-@dataclass(frozen=True, slots=True)
-class TrialResult:
-    """Outcome of a single run (one run ends at success or k <= 0)."""
+K_BUILD_COST = 30
+"""Energy spent per point of initial_k before a run's first attempt."""
 
-    success: bool
-    attempts: int
-    resets: int
-    energy_spent: int
-    k_final: int
 
-
-def _make_rng() -> Generator:
-    """Create an RNG seeded from time.
-
-    Returns:
-        NumPy Generator.
-    """
-    # time_ns is plenty here; no reproducibility required.
-    return np.random.default_rng(time.time_ns())
-
-
-def run_one_trial(*, config: TrialConfig, rules: Rules, rng: Generator) -> TrialResult:
+def run_one_trial(
+    *,
+    config: TrialConfig,
+    rules: Rules,
+    rng: Generator,
+    table: ProbabilityTable | None = None,
+) -> TrialResult:
     """Run one trial (single run) until success or k <= 0.
 
     Termination:
@@ -47,15 +45,20 @@ def run_one_trial(*, config: TrialConfig, rules: Rules, rng: Generator) -> Trial
         config: Trial configuration.
         rules: Rules.
         rng: RNG to use.
+        table: Per-k probabilities for `config`. Built when omitted;
+            pass one in when running many trials.
 
     Returns:
         TrialResult.
     """
+    if table is None:
+        table = ProbabilityTable.build(config)
+
     state = TrialState.from_config(config)
 
     attempts = 0
     resets = 0
-    energy_spent = state.k*30
+    energy_spent = state.k * K_BUILD_COST
 
     while True:
         if state.success:
@@ -81,7 +84,7 @@ def run_one_trial(*, config: TrialConfig, rules: Rules, rng: Generator) -> Trial
         energy_spent += int(attempt_cost(state, rules))
 
         # Success roll.
-        ps = float(p_success(state, config))
+        ps = float(table.success[state.k])
         if rng.random() < ps:
             state = state.with_success(True)
             continue
@@ -93,27 +96,437 @@ def run_one_trial(*, config: TrialConfig, rules: Rules, rng: Generator) -> Trial
         state = state.with_k(state.k - 1)
 
         # Reset roll (only after failure).
-        pr_base = float(p_reset_base(state, config))
+        pr_base = float(table.reset_base[state.k])
         if rng.random() < pr_base:
             resets += 1
             state = state.with_reset_event()
 
 
-def run_simulation(*, config: TrialConfig, rules: Rules, n_trials: int) -> list[TrialResult]:
+def run_trials(
+    *,
+    config: TrialConfig,
+    rules: Rules,
+    rng: Generator,
+    out: TrialResults,
+) -> None:
+    """Run trials one at a time with the reference engine.
+
+    Args:
+        config: Trial configuration.
+        rules: Rules.
+        rng: RNG to use.
+        out: Container to fill; one trial is run per row.
+    """
+    table = ProbabilityTable.build(config)
+    for i in range(len(out)):
+        r = run_one_trial(config=config, rules=rules, rng=rng, table=table)
+        out.success[i] = r.success
+        out.attempts[i] = r.attempts
+        out.resets[i] = r.resets
+        out.energy_spent[i] = r.energy_spent
+        out.k_final[i] = r.k_final
+
+
+# Uniforms drawn per refill of the fast engine's buffer.
+_FAST_BUFFER_SIZE = 16_384
+
+
+def run_trials_fast(
+    *,
+    config: TrialConfig,
+    rules: Rules,
+    rng: Generator,
+    out: TrialResults,
+) -> None:
+    """Run trials one at a time without per-attempt allocations.
+
+    Same flow and the same draws as `run_one_trial`, so the results are
+    identical to `run_trials` for the same RNG. The trial state lives in
+    local variables, probabilities are read from the per-k table as
+    Python lists, and uniforms are taken from a buffer filled in bulk.
+    `rng.random(n)` yields the same numbers as n `rng.random()` calls,
+    and a buffer is only refilled between trials, so the stream is
+    consumed in the reference order (the unused tail of the last buffer
+    is discarded along with the block's RNG).
+
+    Args:
+        config: Trial configuration.
+        rules: Rules.
+        rng: RNG to use.
+        out: Container to fill; one trial is run per row.
+    """
+    initial = TrialState.from_config(config)
+    k0 = initial.k
+    # The default attempt cost does not depend on state.
+    cost = int(attempt_cost(initial, rules))
+    table = ProbabilityTable.build(config)
+    p_success = table.success.tolist()
+    p_reset = table.reset_base.tolist()
+
+    n = len(out)
+    # A trial draws at most two uniforms per attempt.
+    need = uniform_row_width(k0)
+    refill = max(_FAST_BUFFER_SIZE, need)
+    u: list[float] = []
+    i = 0
+
+    success_col = [False] * n
+    attempts_col = [0] * n
+    resets_col = [0] * n
+    k_col = [0] * n
+    for t in range(n):
+        if len(u) - i < need:
+            u = u[i:] + rng.random(refill).tolist()
+            i = 0
+
+        k = k0
+        attempts = 0
+        resets = 0
+        success = False
+        while k > 0:
+            # Pay attempt cost (summed after the loop), then roll success.
+            attempts += 1
+            x = u[i]
+            i += 1
+            if x < p_success[k]:
+                success = True
+                break
+            # Failure: k decay, then reset roll at the decayed k.
+            k -= 1
+            if u[i] < p_reset[k]:
+                resets += 1
+            i += 1
+
+        success_col[t] = success
+        attempts_col[t] = attempts
+        resets_col[t] = resets
+        k_col[t] = k
+
+    out.success[:] = success_col
+    out.attempts[:] = attempts_col
+    out.resets[:] = resets_col
+    out.k_final[:] = k_col
+    out.energy_spent[:] = k0 * K_BUILD_COST + cost * out.attempts
+
+
+def run_blocks(
+    *,
+    runner: TrialRunner,
+    config: TrialConfig,
+    rules: Rules,
+    n_trials: int,
+    entropy: int,
+    start_block: int = 0,
+    stop_block: int | None = None,
+    out: TrialResults | None = None,
+) -> TrialResults:
+    """Run a contiguous range of stream blocks.
+
+    Args:
+        runner: Per-block trial runner (e.g. `run_trials`).
+        config: Trial configuration.
+        rules: Rules.
+        n_trials: Total trials in the whole simulation.
+        entropy: Root seed entropy shared by every block.
+        start_block: First block (inclusive).
+        stop_block: Last block (exclusive). Defaults to all blocks.
+        out: Preallocated container for the covered trials. Allocated
+            when omitted.
+
+    Returns:
+        Results of the covered blocks, in trial order.
+    """
+    root = root_seed_sequence(entropy)
+    stop = n_blocks(n_trials) if stop_block is None else int(stop_block)
+    first = int(start_block) * STREAM_BLOCK_SIZE
+    if out is None:
+        out = TrialResults.empty(min(int(n_trials), stop * STREAM_BLOCK_SIZE) - first)
+
+    for block, size in iter_blocks(n_trials, start_block, stop):
+        offset = block * STREAM_BLOCK_SIZE - first
+        runner(
+            config=config,
+            rules=rules,
+            rng=block_rng(root, block),
+            out=out[offset : offset + size],
+        )
+    return out
+
+
+def run_simulation(
+    *,
+    config: TrialConfig,
+    rules: Rules,
+    n_trials: int,
+    seed: int | None = None,
+    workers: int = 1,
+    chunk_size: int | None = None,
+    runner: TrialRunner = run_trials,
+    engine: str | None = None,
+) -> TrialResults:
     """Run many trials.
 
+    Trials are split into fixed stream blocks, each with its own RNG
+    derived from `seed` (see `streams.py`). The results depend only on
+    the seed, never on `workers` or `chunk_size`.
+
     Args:
         config: Trial configuration.
         rules: Rules.
         n_trials: Number of trials.
+        seed: RNG seed. None uses fresh OS entropy.
+        workers: Worker processes. 1 runs in-process; other values run
+            chunks in a process pool (None uses every core).
+        chunk_size: Trials per pool work unit (parallel mode only).
+        runner: Per-block trial runner.
+        engine: Registered backend name (see `backends.py`). Overrides
+            `runner` when given.
 
     Returns:
-        List of TrialResult.
+        Columnar TrialResults.
     """
-    rng = _make_rng()
-    results: list[TrialResult] = []
+    runner = _resolve_runner(runner, engine)
+    if workers != 1:
+        from gaming_monte_carlo.simulation.parallel import run_simulation_parallel
+
+        return run_simulation_parallel(
+            config=config,
+            rules=rules,
+            n_trials=n_trials,
+            seed=seed,
+            workers=workers,
+            chunk_size=chunk_size,
+            runner=runner,
+        )
+
+    return run_blocks(
+        runner=runner,
+        config=config,
+        rules=rules,
+        n_trials=n_trials,
+        entropy=root_seed_sequence(seed).entropy,
+    )
+
+
+def run_simulation_streaming(
+    *,
+    config: TrialConfig,
+    rules: Rules,
+    n_trials: int,
+    seed: int | None = None,
+    runner: TrialRunner = run_trials,
+    engine: str | None = None,
+) -> Iterator[TrialResults]:
+    """Run many trials, yielding one stream block at a time.
+
+    Uses the same block layout as `run_simulation`, so the yielded rows
+    concatenate to exactly its output. A single block-sized buffer is
+    reused, so memory stays flat whatever n_trials is; each yielded
+    container is only valid until the next one is requested. Feed the
+    blocks to `SummaryAccumulator.consume` to summarize a run.
 
-    for _ in range(int(n_trials)):
-        results.append(run_one_trial(config=config, rules=rules, rng=rng))
+    Args:
+        config: Trial configuration.
+        rules: Rules.
+        n_trials: Number of trials.
+        seed: RNG seed. None uses fresh OS entropy.
+        runner: Per-block trial runner.
+        engine: Registered backend name. Overrides `runner` when given.
+
+    Yields:
+        TrialResults for each block, in trial order.
+    """
+    runner = _resolve_runner(runner, engine)
+    root = root_seed_sequence(seed)
+    buffer = TrialResults.empty(min(int(n_trials), STREAM_BLOCK_SIZE))
+    for block, size in iter_blocks(n_trials):
+        out = buffer[:size]
+        runner(config=config, rules=rules, rng=block_rng(root, block), out=out)
+        yield out
 
-    return results
+
+def _resolve_runner(runner: TrialRunner, engine: str | None) -> TrialRunner:
+    """The named backend's runner, or `runner` when no name is given."""
+    if engine is None:
+        return runner
+    from gaming_monte_carlo.simulation.backends import get_engine
+
+    return get_engine(engine).runner
+
+
+def _start_batch(
+    *,
+    config: TrialConfig,
+    rules: Rules,
+    out: TrialResults,
+    table: ProbabilityTable | None = None,
+) -> tuple[int, ProbabilityTable]:
+    """Reset `out` to fresh trials and return (attempt_cost, table).
+
+    `table` is built from `config` when omitted.
+    """
+    initial = TrialState.from_config(config)
+
+    out.k_final[:] = initial.k
+    out.success[:] = False
+    out.attempts[:] = 0
+    out.resets[:] = 0
+    out.energy_spent[:] = initial.k * K_BUILD_COST
+
+    # The default attempt cost does not depend on state, so it is paid as
+    # one constant per attempt.
+    if table is None:
+        table = ProbabilityTable.build(config)
+    return int(attempt_cost(initial, rules)), table
+
+
+def run_trials_vectorized(
+    *,
+    config: TrialConfig,
+    rules: Rules,
+    rng: Generator,
+    out: TrialResults,
+    table: ProbabilityTable | None = None,
+) -> None:
+    """Run a batch of trials at once, advancing every live trial per step.
+
+    Each loop iteration resolves one attempt for every trial that is
+    still running, in the same order as `run_one_trial`:
+
+      1) pay attempt cost
+      2) roll success (trial ends on success)
+      3) on failure, decay k by 1 and roll reset at the decayed k
+
+    The per-trial statistics match the reference engine; the RNG stream
+    is consumed in a different order, so individual trials differ.
+
+    Args:
+        config: Trial configuration.
+        rules: Rules.
+        rng: RNG to use.
+        out: Container to fill; one trial is run per row.
+        table: Per-k probabilities to roll against. Built from `config`
+            when omitted; importance sampling passes a tilted table.
+    """
+    cost, table = _start_batch(config=config, rules=rules, out=out, table=table)
+
+    # The columns of `out` are the live state arrays.
+    k = out.k_final
+    success = out.success
+    attempts = out.attempts
+    resets = out.resets
+    energy_spent = out.energy_spent
+
+    live = np.flatnonzero(k > 0)
+    while live.size:
+        # Pay attempt cost.
+        attempts[live] += 1
+        energy_spent[live] += cost
+
+        # Success roll.
+        won = rng.random(live.size) < table.success[k[live]]
+        success[live[won]] = True
+
+        # Failure path: k decay, then reset roll at the decayed k.
+        failed = live[~won]
+        k[failed] -= 1
+        reset = rng.random(failed.size) < table.reset_base[k[failed]]
+        resets[failed[reset]] += 1
+
+        live = failed[k[failed] > 0]
+
+
+def uniform_row_width(max_k: int) -> int:
+    """Uniforms a trial can consume when starting at k <= max_k.
+
+    Every failure decays k by 1, so a trial makes at most initial_k
+    attempts, each with one success roll and one reset roll.
+    """
+    return 2 * max(0, int(max_k))
+
+
+def run_trials_from_uniforms(
+    *,
+    config: TrialConfig,
+    rules: Rules,
+    uniforms: np.ndarray,
+    out: TrialResults,
+) -> None:
+    """Run a batch of trials, each driven by its own row of uniforms.
+
+    Row i is trial i's private random stream: attempt j (0-based) rolls
+    success with `uniforms[i, 2j]` and, on failure, rolls reset with
+    `uniforms[i, 2j + 1]`. Trials therefore draw the same numbers
+    whatever their initial_k, which couples simulations that share the
+    rows (common random numbers). The flow is the same as
+    `run_trials_vectorized`.
+
+    Args:
+        config: Trial configuration.
+        rules: Rules.
+        uniforms: Array of shape
+            (len(out), >= uniform_row_width(initial_k)).
+        out: Container to fill; one trial is run per row.
+    """
+    if uniforms.shape[0] != len(out):
+        raise ValueError(f"Expected {len(out)} uniform rows, got {uniforms.shape[0]}")
+    if uniforms.shape[1] < uniform_row_width(config.initial_k):
+        raise ValueError(
+            f"Uniform rows of width {uniforms.shape[1]} are too short for "
+            f"initial_k={config.initial_k}"
+        )
+
+    cost, table = _start_batch(config=config, rules=rules, out=out)
+
+    k = out.k_final
+    success = out.success
+    attempts = out.attempts
+    resets = out.resets
+    energy_spent = out.energy_spent
+
+    live = np.flatnonzero(k > 0)
+    step = 0
+    while live.size:
+        # Pay attempt cost.
+        attempts[live] += 1
+        energy_spent[live] += cost
+
+        # Success roll.
+        won = uniforms[live, 2 * step] < table.success[k[live]]
+        success[live[won]] = True
+
+        # Failure path: k decay, then reset roll at the decayed k.
+        failed = live[~won]
+        k[failed] -= 1
+        reset = uniforms[failed, 2 * step + 1] < table.reset_base[k[failed]]
+        resets[failed[reset]] += 1
+
+        live = failed[k[failed] > 0]
+        step += 1
+
+
+def run_simulation_vectorized(
+    *,
+    config: TrialConfig,
+    rules: Rules,
+    n_trials: int,
+    seed: int | None = None,
+    workers: int = 1,
+    chunk_size: int | None = None,
+) -> TrialResults:
+    """Run many trials with the vectorized engine.
+
+    Same block layout and arguments as `run_simulation`.
+
+    Returns:
+        Columnar TrialResults.
+    """
+    return run_simulation(
+        config=config,
+        rules=rules,
+        n_trials=n_trials,
+        seed=seed,
+        workers=workers,
+        chunk_size=chunk_size,
+        runner=run_trials_vectorized,
+    )
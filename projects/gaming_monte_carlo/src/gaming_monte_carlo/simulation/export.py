@@ -0,0 +1,286 @@
+"""Per-trial columns on disk, for reanalysis without re-simulating.
+
+An export is a directory with one `.npy` file per TrialResults column
+plus a `manifest.json` describing the run (config, rules, seed and root
+entropy, engine, trial count and code version):
+
+    manifest.json
+    success.npy  attempts.npy  resets.npy  energy_spent.npy  k_final.npy
+
+The column files are preallocated with `np.lib.format.open_memmap`, and
+blocks are written straight into them as they are simulated, so
+exporting never holds more than one block in memory. The manifest is
+written last; a directory without one is an unfinished export.
+
+`open_trials` maps the files back read-only as a TrialResults whose
+columns are memory maps, so pages are read from disk only when touched
+and `summarize_results` works on exports far larger than RAM.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, fields
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from gaming_monte_carlo.simulation.backends import get_engine
+from gaming_monte_carlo.simulation.cache import code_version
+from gaming_monte_carlo.simulation.engine import run_simulation_streaming
+from gaming_monte_carlo.simulation.results import TrialResults
+from gaming_monte_carlo.simulation.rules import Rules
+from gaming_monte_carlo.simulation.serialization import (
+    read_json,
+    run_from_dict,
+    run_to_dict,
+    write_json_atomic,
+)
+from gaming_monte_carlo.simulation.state import TrialConfig
+from gaming_monte_carlo.simulation.streams import root_seed_sequence
+
+MANIFEST_NAME = "manifest.json"
+FORMAT_VERSION = 1
+
+
+@dataclass(frozen=True, slots=True)
+class TrialManifest:
+    """Description of an exported run.
+
+    Attributes:
+        config: Trial configuration.
+        rules: Rules.
+        n_trials: Rows in every column.
+        seed: RNG seed (None if the run was unseeded).
+        entropy: Root SeedSequence entropy (the seed, or the OS entropy
+            drawn for an unseeded run). Passing it as the seed replays
+            the run.
+        engine: Backend name that produced the trials.
+        code_version: Hash of the mechanics source (see
+            `cache.code_version`).
+        columns: Column name to file name, relative to the export.
+    """
+
+    config: TrialConfig
+    rules: Rules
+    n_trials: int
+    seed: int | None
+    entropy: int
+    engine: str
+    code_version: str
+    columns: dict[str, str]
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON-ready manifest (see `from_dict`)."""
+        return {
+            "format_version": FORMAT_VERSION,
+            **run_to_dict(self.config, self.rules),
+            "n_trials": self.n_trials,
+            "seed": self.seed,
+            "entropy": self.entropy,
+            "engine": self.engine,
+            "code_version": self.code_version,
+            "columns": dict(self.columns),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> TrialManifest:
+        """Inverse of `to_dict`.
+
+        Raises:
+            ValueError: For an unsupported format version.
+        """
+        version = data.get("format_version")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"Unsupported trial export format version {version!r}")
+        config, rules = run_from_dict(data)
+        return cls(
+            config=config,
+            rules=rules,
+            n_trials=int(data["n_trials"]),
+            seed=None if data["seed"] is None else int(data["seed"]),
+            entropy=int(data["entropy"]),
+            engine=str(data["engine"]),
+            code_version=str(data["code_version"]),
+            columns={str(k): str(v) for k, v in data["columns"].items()},
+        )
+
+
+class TrialColumnWriter:
+    """Streams blocks of TrialResults into preallocated `.npy` memmaps.
+
+    Usage:
+        with TrialColumnWriter(path, config=..., rules=..., n_trials=n,
+                               seed=s, engine="fast") as writer:
+            for block in run_simulation_streaming(
+                ..., seed=writer.manifest.entropy, engine="fast"
+            ):
+                writer.write(block)
+
+    Blocks must be simulated with `manifest.entropy` as their seed, so
+    that unseeded exports record the entropy they were drawn from.
+
+    The manifest is written when the context exits cleanly, after
+    checking that exactly n_trials rows were written.
+
+    Args:
+        directory: Export directory (created if missing).
+        config: Trial configuration.
+        rules: Rules.
+        n_trials: Total rows that will be written.
+        seed: RNG seed of the run. None draws fresh OS entropy.
+        engine: Backend name of the run.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        *,
+        config: TrialConfig,
+        rules: Rules,
+        n_trials: int,
+        seed: int | None,
+        engine: str,
+    ) -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        # A stale manifest would describe columns that are being replaced.
+        (self.directory / MANIFEST_NAME).unlink(missing_ok=True)
+
+        template = TrialResults.empty(0)
+        self.manifest = TrialManifest(
+            config=config,
+            rules=rules,
+            n_trials=int(n_trials),
+            seed=seed,
+            entropy=int(root_seed_sequence(seed).entropy),
+            engine=engine,
+            code_version=code_version(get_engine(engine).runner),
+            columns={f.name: f"{f.name}.npy" for f in fields(TrialResults)},
+        )
+        self._columns = TrialResults(
+            **{
+                name: np.lib.format.open_memmap(
+                    self.directory / file,
+                    mode="w+",
+                    dtype=getattr(template, name).dtype,
+                    shape=(self.manifest.n_trials,),
+                )
+                for name, file in self.manifest.columns.items()
+            }
+        )
+        self.rows_written = 0
+
+    def write(self, block: TrialResults) -> None:
+        """Append one block of rows.
+
+        Raises:
+            ValueError: If the block would overflow n_trials.
+        """
+        if self.rows_written + len(block) > self.manifest.n_trials:
+            raise ValueError(
+                f"Export holds {self.manifest.n_trials} trials; "
+                f"cannot write {len(block)} more after {self.rows_written}"
+            )
+        self._columns.assign(self.rows_written, block)
+        self.rows_written += len(block)
+
+    def tee(self, blocks: Iterable[TrialResults]) -> Iterator[TrialResults]:
+        """Write every block while passing it through unchanged."""
+        for block in blocks:
+            self.write(block)
+            yield block
+
+    def close(self) -> TrialManifest:
+        """Flush the columns and write the manifest.
+
+        Raises:
+            ValueError: If fewer than n_trials rows were written.
+        """
+        if self.rows_written != self.manifest.n_trials:
+            raise ValueError(
+                f"Export expected {self.manifest.n_trials} trials, got {self.rows_written}"
+            )
+        for f in fields(self._columns):
+            getattr(self._columns, f.name).flush()
+        write_json_atomic(self.directory / MANIFEST_NAME, self.manifest.to_dict(), indent=2)
+        return self.manifest
+
+    def __enter__(self) -> TrialColumnWriter:
+        return self
+
+    def __exit__(self, exc_type: object, *exc: object) -> None:
+        if exc_type is None:
+            self.close()
+
+
+def export_simulation(
+    directory: Path,
+    *,
+    config: TrialConfig,
+    rules: Rules,
+    n_trials: int,
+    seed: int | None = None,
+    engine: str = "reference",
+) -> TrialManifest:
+    """Simulate block by block and store every trial's columns.
+
+    The stored rows are exactly `run_simulation(..., engine=engine)`.
+
+    Args:
+        directory: Export directory.
+        config: Trial configuration.
+        rules: Rules.
+        n_trials: Number of trials.
+        seed: RNG seed. None uses fresh OS entropy.
+        engine: Registered backend name.
+
+    Returns:
+        The written manifest.
+    """
+    with TrialColumnWriter(
+        directory, config=config, rules=rules, n_trials=n_trials, seed=seed, engine=engine
+    ) as writer:
+        for block in run_simulation_streaming(
+            config=config,
+            rules=rules,
+            n_trials=n_trials,
+            seed=writer.manifest.entropy,
+            engine=engine,
+        ):
+            writer.write(block)
+    return writer.manifest
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class StoredTrials:
+    """An opened export.
+
+    Attributes:
+        manifest: Run description.
+        results: Read-only columns, memory-mapped from the `.npy` files.
+    """
+
+    manifest: TrialManifest
+    results: TrialResults
+
+
+def open_trials(directory: Path) -> StoredTrials:
+    """Map an export's columns without reading them into memory.
+
+    Raises:
+        FileNotFoundError: If the manifest is missing (unfinished export).
+        ValueError: If a column does not have manifest.n_trials rows.
+    """
+    directory = Path(directory)
+    manifest = TrialManifest.from_dict(read_json(directory / MANIFEST_NAME))
+    columns = {
+        name: np.load(directory / file, mmap_mode="r") for name, file in manifest.columns.items()
+    }
+    for name, column in columns.items():
+        if column.shape != (manifest.n_trials,):
+            raise ValueError(
+                f"Column {name!r} has shape {column.shape}, expected ({manifest.n_trials},)"
+            )
+    return StoredTrials(manifest=manifest, results=TrialResults(**columns))
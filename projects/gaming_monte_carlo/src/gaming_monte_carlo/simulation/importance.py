@@ -0,0 +1,189 @@
+"""Importance sampling for snails whose runs rarely succeed.
+
+Above level 24 the per-attempt success chance gets small, so most runs
+fail and the per-run success rate (and everything divided by it) needs
+huge trial counts to estimate. Here success rolls are instead drawn
+from a tilted per-k probability that makes successes common, and each
+trial is weighted by its likelihood ratio, so weighted averages
+estimate the untilted expectations. Reset rolls are not tilted.
+
+The tilt is exponential in the Bernoulli success roll: the odds of
+success are multiplied by a constant t at every k,
+
+    p'(k) = t * p(k) / (1 - p(k) + t * p(k)),
+
+and by default t is chosen so that a tilted run succeeds with
+probability `DEFAULT_TARGET_SUCCESS`. Every roll is still sampled;
+the rules only decide which distribution the rolls come from.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, replace
+
+import numpy as np
+
+from gaming_monte_carlo.simulation.analysis import run_success_probability
+from gaming_monte_carlo.simulation.engine import run_trials_vectorized
+from gaming_monte_carlo.simulation.metrics import Interval, Summary, WeightedSummaryAccumulator
+from gaming_monte_carlo.simulation.results import TrialResults
+from gaming_monte_carlo.simulation.rules import ProbabilityTable, Rules
+from gaming_monte_carlo.simulation.state import TrialConfig
+from gaming_monte_carlo.simulation.streams import block_rng, iter_blocks, root_seed_sequence
+
+DEFAULT_TARGET_SUCCESS = 0.5
+
+
+def tilt_success(success: np.ndarray, tilt: float) -> np.ndarray:
+    """Multiply the odds of every success probability by `tilt`."""
+    p = np.asarray(success, dtype=float)
+    return tilt * p / (1.0 - p + tilt * p)
+
+
+def choose_tilt(
+    table: ProbabilityTable,
+    initial_k: int,
+    target_success: float = DEFAULT_TARGET_SUCCESS,
+) -> float:
+    """Odds tilt that makes a run succeed with probability target_success.
+
+    Returns 1 (no tilt) when runs already succeed at least that often or
+    can never succeed.
+
+    Raises:
+        ValueError: If target_success is not in (0, 1).
+    """
+    if not 0.0 < target_success < 1.0:
+        raise ValueError("target_success must be in (0, 1)")
+    p_run = run_success_probability(table.success, initial_k)
+    if p_run >= target_success or p_run == 0.0:
+        return 1.0
+
+    # The tilted run success probability increases with the tilt.
+    lo, hi = 0.0, 1.0
+    while run_success_probability(tilt_success(table.success, math.exp(hi)), initial_k) < (
+        target_success
+    ):
+        lo, hi = hi, 2.0 * hi
+    for _ in range(60):
+        mid = (lo + hi) / 2.0
+        tilted = run_success_probability(tilt_success(table.success, math.exp(mid)), initial_k)
+        lo, hi = (mid, hi) if tilted < target_success else (lo, mid)
+    return math.exp(hi)
+
+
+def likelihood_ratios(
+    results: TrialResults,
+    table: ProbabilityTable,
+    tilted: ProbabilityTable,
+    initial_k: int,
+) -> np.ndarray:
+    """Target over proposal probability of every trial's success rolls.
+
+    Attempt j (1-based) rolls success at k = initial_k - j + 1, so a
+    trial's rolls are fixed by its attempts and success columns: it
+    failed attempts - success rolls and, if it succeeded, won the last.
+    Reset rolls have the same distribution under both and cancel.
+
+    Args:
+        results: Trials simulated from `tilted`.
+        table: Untilted probability table.
+        tilted: Proposal probability table.
+        initial_k: Starting k of the trials.
+
+    Returns:
+        One weight per trial.
+    """
+    k0 = int(initial_k)
+    # Roll probabilities in attempt order (k0, k0 - 1, ..., 1).
+    p = table.success[k0:0:-1]
+    p_tilt = tilted.success[k0:0:-1]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        log_fail = np.where(1.0 - p_tilt > 0.0, np.log((1.0 - p) / (1.0 - p_tilt)), 0.0)
+        log_win = np.where(p_tilt > 0.0, np.log(p / p_tilt), 0.0)
+    cum_fail = np.concatenate([[0.0], np.cumsum(log_fail)])
+    win = np.concatenate([[0.0], log_win])
+
+    failed_attempts = results.attempts - results.success
+    log_w = cum_fail[failed_attempts] + np.where(results.success, win[results.attempts], 0.0)
+    return np.exp(log_w)
+
+
+@dataclass(frozen=True, slots=True)
+class ImportanceResult:
+    """Outcome of an importance-sampled simulation.
+
+    Attributes:
+        summary: Weighted estimate of every Summary field.
+        interval: Interval for expected_energy_per_success.
+        tilt: Odds multiplier applied to every success roll.
+        n_trials: Trials run.
+        effective_sample_size: Kish effective sample size of all trials.
+        effective_successes: Kish effective sample size of the
+            successful trials, which drive the "until success" fields.
+    """
+
+    summary: Summary
+    interval: Interval
+    tilt: float
+    n_trials: int
+    effective_sample_size: float
+    effective_successes: float
+
+
+def run_simulation_importance(
+    *,
+    config: TrialConfig,
+    rules: Rules,
+    n_trials: int,
+    seed: int | None = None,
+    tilt: float | None = None,
+    target_success: float = DEFAULT_TARGET_SUCCESS,
+    confidence: float = 0.95,
+) -> ImportanceResult:
+    """Simulate with tilted success rolls and likelihood-ratio weights.
+
+    Trials run with the vectorized engine against a tilted probability
+    table, on the same stream blocks as `run_simulation`.
+
+    Args:
+        config: Trial configuration.
+        rules: Rules.
+        n_trials: Number of trials.
+        seed: RNG seed. None uses fresh OS entropy.
+        tilt: Odds multiplier for success rolls. None picks one with
+            `choose_tilt(target_success)`.
+        target_success: Tilted run success probability when tilt is None.
+        confidence: Confidence level for the interval.
+
+    Returns:
+        ImportanceResult.
+    """
+    table = ProbabilityTable.build(config)
+    if tilt is None:
+        tilt = choose_tilt(table, config.initial_k, target_success)
+    if tilt <= 0.0:
+        raise ValueError("tilt must be positive")
+    success = tilt_success(table.success, tilt)
+    tilted = replace(
+        table, success=success, real_reset=np.clip((1.0 - success) * table.reset_base, 0.0, 1.0)
+    )
+
+    root = root_seed_sequence(seed)
+    acc = WeightedSummaryAccumulator()
+    for block, size in iter_blocks(int(n_trials)):
+        out = TrialResults.empty(size)
+        run_trials_vectorized(
+            config=config, rules=rules, rng=block_rng(root, block), out=out, table=tilted
+        )
+        acc.update(out, likelihood_ratios(out, table, tilted, config.initial_k))
+
+    return ImportanceResult(
+        summary=acc.to_summary(config, rules),
+        interval=acc.energy_per_success_interval(confidence),
+        tilt=float(tilt),
+        n_trials=acc.n_trials,
+        effective_sample_size=acc.effective_sample_size,
+        effective_successes=acc.effective_successes,
+    )
@@ -0,0 +1,159 @@
+"""Coupled k-ladder: every initial_k from one set of trial paths.
+
+A trial only ever moves down the k ladder: it attempts at k0, k0 - 1,
+..., 1 until a success, and a reset only bumps a counter. So a trial
+that starts at k0 + 1 and fails its first attempt continues exactly
+like a fresh trial at k0. If the random numbers are tied to the level
+rather than to the attempt number, one path drawn for the largest k
+contains the path of every smaller k as a suffix.
+
+Each stream block draws one (trials x 2 * max(ks)) uniform matrix, laid
+out like `engine.run_trials_from_uniforms` rows for max(ks): level L
+rolls success with column 2 * (max_k - L) and, on failure, reset with
+the next column. A trial at k0 therefore uses the row suffix starting
+at column 2 * (max_k - k0), and gives exactly what
+`run_trials_from_uniforms` gives for that suffix.
+
+Per row, the outcome of every k0 follows from two scans over the
+levels: the highest success level m <= k0 (a running max) and a running
+count of reset events. With m = 0 meaning no success:
+
+    attempts = k0 - m + [m > 0]
+    resets   = resets rolled after failing levels m + 1 .. k0
+    k_final  = m
+
+All ks together cost O(trials * max_k), about one run at the largest k,
+instead of O(trials * sum(ks)) for independent runs. Trials are shared,
+so the per-k estimates are correlated the same way as a CRN sweep, and
+neighbouring-k differences come with paired intervals.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import numpy as np
+
+from gaming_monte_carlo.simulation.crn import CrnSweep, PairedSweepAccumulator
+from gaming_monte_carlo.simulation.engine import K_BUILD_COST, uniform_row_width
+from gaming_monte_carlo.simulation.metrics import SummaryAccumulator
+from gaming_monte_carlo.simulation.results import TrialResults
+from gaming_monte_carlo.simulation.rules import ProbabilityTable, Rules, attempt_cost
+from gaming_monte_carlo.simulation.state import TrialConfig, TrialState
+from gaming_monte_carlo.simulation.streams import block_rng, iter_blocks, root_seed_sequence
+
+
+def run_ladder_from_uniforms(
+    *,
+    base_config: TrialConfig,
+    rules: Rules,
+    ks: Sequence[int],
+    uniforms: np.ndarray,
+) -> list[TrialResults]:
+    """Run one batch of coupled trials for every k in `ks`.
+
+    Args:
+        base_config: Config providing snail level and hole bonus.
+        rules: Rules.
+        ks: initial_k values (each >= 0).
+        uniforms: Array of shape (trials, >= uniform_row_width(max(ks))).
+
+    Returns:
+        One TrialResults per k, in the order of `ks`. Results for k
+        equal `run_trials_from_uniforms` on the rows'
+        `[:, 2 * (max(ks) - k):]` suffix.
+    """
+    top = max(ks)
+    width = uniform_row_width(top)
+    if uniforms.shape[1] < width:
+        raise ValueError(
+            f"Uniform rows of width {uniforms.shape[1]} are too short for max k={top}"
+        )
+    n = uniforms.shape[0]
+    table = ProbabilityTable.build(base_config, max_k=top)
+    cost = int(attempt_cost(TrialState.from_config(base_config), rules))
+
+    # Column j of `hit` / `reset` is level j + 1, read from the row
+    # backwards so the largest k consumes the row from its start.
+    hit = uniforms[:, 0:width:2][:, ::-1] < table.success[1:]
+    reset = uniforms[:, 1:width:2][:, ::-1] < table.reset_base[:-1]
+
+    # best[:, k] is the highest success level <= k (0 if none), and
+    # n_resets[:, k] the resets rolled after failing levels 1..k.
+    levels = np.arange(1, top + 1, dtype=np.int16)
+    best = np.zeros((n, top + 1), dtype=np.int16)
+    np.maximum.accumulate(np.where(hit, levels, 0), axis=1, out=best[:, 1:])
+    n_resets = np.zeros((n, top + 1), dtype=np.int32)
+    np.cumsum(reset, axis=1, out=n_resets[:, 1:])
+
+    rows = np.arange(n)
+    per_k = []
+    for k in ks:
+        m = best[:, k]
+        out = TrialResults.empty(n)
+        np.greater(m, 0, out=out.success)
+        out.k_final[:] = m
+        out.attempts[:] = k - m + out.success
+        out.resets[:] = n_resets[:, k] - n_resets[rows, m]
+        out.energy_spent[:] = K_BUILD_COST * k + cost * out.attempts.astype(np.int64)
+        per_k.append(out)
+    return per_k
+
+
+def run_ladder_sweep(
+    *,
+    base_config: TrialConfig,
+    rules: Rules,
+    ks: Sequence[int],
+    n_trials: int,
+    seed: int | None = None,
+    confidence: float = 0.95,
+) -> CrnSweep:
+    """Simulate every k in `ks` from one shared set of coupled paths.
+
+    Args:
+        base_config: Config providing snail level and hole bonus.
+        rules: Rules.
+        ks: initial_k values to compare.
+        n_trials: Trials per k (all ks share the same trials).
+        seed: RNG seed. None uses fresh OS entropy.
+        confidence: Confidence level for intervals.
+
+    Returns:
+        CrnSweep with one Summary per k and paired neighbouring-k deltas.
+
+    Raises:
+        ValueError: If ks is empty or holds a k below 1.
+    """
+    ks = tuple(sorted({int(k) for k in ks}))
+    if not ks:
+        raise ValueError("ks must contain at least one k")
+    if ks[0] < 1:
+        raise ValueError(f"ks must be >= 1, got {ks[0]}")
+
+    configs = [base_config.with_initial_k(k) for k in ks]
+    width = uniform_row_width(max(ks))
+    root = root_seed_sequence(seed)
+
+    per_k = [SummaryAccumulator() for _ in ks]
+    paired = PairedSweepAccumulator(ks)
+    for block, size in iter_blocks(n_trials):
+        uniforms = block_rng(root, block).random((size, width))
+        block_results = run_ladder_from_uniforms(
+            base_config=base_config, rules=rules, ks=ks, uniforms=uniforms
+        )
+        for acc, out in zip(per_k, block_results):
+            acc.update(out)
+        paired.update(block_results)
+
+    summaries = {k: acc.to_summary(c, rules) for k, c, acc in zip(ks, configs, per_k)}
+    intervals = {k: acc.energy_per_success_interval(confidence) for k, acc in zip(ks, per_k)}
+    deltas = [paired.delta(i, i + 1, confidence) for i in range(len(ks) - 1)]
+    best_k = min(summaries, key=lambda kk: summaries[kk].expected_energy_per_success)
+    return CrnSweep(
+        summaries=summaries,
+        intervals=intervals,
+        deltas=deltas,
+        best_k=best_k,
+        distributions={k: acc.distributions for k, acc in zip(ks, per_k)},
+    )
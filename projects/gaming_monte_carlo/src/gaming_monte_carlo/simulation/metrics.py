@@ -1,13 +1,23 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import math
+from collections.abc import Iterable
+from dataclasses import dataclass, field, fields
+from statistics import NormalDist
+from typing import Any
 
 import numpy as np
 
-from gaming_monte_carlo.simulation.engine import TrialResult
+from gaming_monte_carlo.simulation.distributions import Histogram, OutcomeDistributions
+from gaming_monte_carlo.simulation.results import TrialResult, TrialResults
 from gaming_monte_carlo.simulation.rules import Rules
 from gaming_monte_carlo.simulation.state import TrialConfig
 
+DEFAULT_BOOTSTRAP_REPLICATES = 2_000
+
+# Rows per slice when summarizing a large TrialResults.
+_SUMMARY_SLICE = 1 << 20
+
 
 @dataclass(frozen=True, slots=True)
 class Summary:
@@ -72,103 +82,631 @@ class Summary:
         return "\n".join(lines)
 
 
+@dataclass(frozen=True, slots=True)
+class Interval:
+    """Two-sided normal confidence interval for an estimate.
+
+    Attributes:
+        estimate: Point estimate.
+        std_error: Estimated standard error (inf if unknown).
+        low: Lower bound.
+        high: Upper bound.
+        confidence: Confidence level, e.g. 0.95.
+    """
+
+    estimate: float
+    std_error: float
+    low: float
+    high: float
+    confidence: float
+
+    @classmethod
+    def normal(cls, estimate: float, std_error: float, confidence: float) -> Interval:
+        """Build estimate +/- z * std_error for the given confidence."""
+        z = NormalDist().inv_cdf(0.5 + float(confidence) / 2.0)
+        return cls(
+            estimate=estimate,
+            std_error=std_error,
+            low=estimate - z * std_error,
+            high=estimate + z * std_error,
+            confidence=float(confidence),
+        )
+
+    @property
+    def half_width(self) -> float:
+        """Half the interval width."""
+        return (self.high - self.low) / 2.0
+
+    @property
+    def relative_half_width(self) -> float:
+        """Half width relative to |estimate| (inf when undefined)."""
+        if not math.isfinite(self.half_width) or self.estimate == 0.0:
+            return float("inf")
+        return self.half_width / abs(self.estimate)
+
+    def __str__(self) -> str:
+        return (
+            f"{self.estimate:.3f} [{self.low:.3f}, {self.high:.3f}] "
+            f"({self.confidence:.0%} CI)"
+        )
+
+
+@dataclass(slots=True)
+class SummaryAccumulator:
+    """Mergeable running totals behind a Summary.
+
+    Holds exact integer counts and sums split by success and fail, so
+    chunks can be consumed as they are produced (and merged across
+    workers) without keeping per-trial results. Summing integers keeps
+    the result independent of chunking and merge order. The per-run
+    histograms in `distributions` are integer counts too.
+    """
+
+    n_trials: int = 0
+    n_success: int = 0
+    attempts_success: int = 0
+    attempts_fail: int = 0
+    resets_success: int = 0
+    resets_fail: int = 0
+    energy_success: int = 0
+    energy_fail: int = 0
+    energy_sq_success: int = 0
+    energy_sq_fail: int = 0
+    distributions: OutcomeDistributions = field(default_factory=OutcomeDistributions)
+
+    @property
+    def n_fail(self) -> int:
+        """Number of failed runs."""
+        return self.n_trials - self.n_success
+
+    def update(self, results: TrialResults) -> SummaryAccumulator:
+        """Add one chunk of results.
+
+        Args:
+            results: Columnar results for the chunk.
+
+        Returns:
+            self, for chaining.
+        """
+        mask_s = results.success
+        n = len(results)
+        n_success = int(np.count_nonzero(mask_s))
+
+        attempts_total = int(results.attempts.sum(dtype=np.int64))
+        resets_total = int(results.resets.sum(dtype=np.int64))
+        energy_total = int(results.energy_spent.sum(dtype=np.int64))
+        attempts_s = int(results.attempts.sum(dtype=np.int64, where=mask_s))
+        resets_s = int(results.resets.sum(dtype=np.int64, where=mask_s))
+        energy_s = int(results.energy_spent.sum(dtype=np.int64, where=mask_s))
+        energy_sq = results.energy_spent.astype(np.int64) ** 2
+        energy_sq_total = int(energy_sq.sum())
+        energy_sq_s = int(energy_sq.sum(where=mask_s))
+
+        self.n_trials += n
+        self.n_success += n_success
+        self.attempts_success += attempts_s
+        self.attempts_fail += attempts_total - attempts_s
+        self.resets_success += resets_s
+        self.resets_fail += resets_total - resets_s
+        self.energy_success += energy_s
+        self.energy_fail += energy_total - energy_s
+        self.energy_sq_success += energy_sq_s
+        self.energy_sq_fail += energy_sq_total - energy_sq_s
+        self.distributions.update(results)
+        return self
+
+    def consume(self, chunks: Iterable[TrialResults]) -> SummaryAccumulator:
+        """Add every chunk from an iterable (e.g. a streaming engine).
+
+        Returns:
+            self, for chaining.
+        """
+        for chunk in chunks:
+            self.update(chunk)
+        return self
+
+    def merge(self, other: SummaryAccumulator) -> SummaryAccumulator:
+        """Add another accumulator's totals into this one.
+
+        Returns:
+            self, for chaining.
+        """
+        self.n_trials += other.n_trials
+        self.n_success += other.n_success
+        self.attempts_success += other.attempts_success
+        self.attempts_fail += other.attempts_fail
+        self.resets_success += other.resets_success
+        self.resets_fail += other.resets_fail
+        self.energy_success += other.energy_success
+        self.energy_fail += other.energy_fail
+        self.energy_sq_success += other.energy_sq_success
+        self.energy_sq_fail += other.energy_sq_fail
+        self.distributions.merge(other.distributions)
+        return self
+
+    def subtract(self, other: SummaryAccumulator) -> SummaryAccumulator:
+        """Remove totals previously merged or consumed into this one.
+
+        Integer totals make this exact: acc.merge(x).subtract(x) == acc.
+
+        Returns:
+            self, for chaining.
+        """
+        for f in fields(self):
+            if f.name != "distributions":
+                setattr(self, f.name, getattr(self, f.name) - getattr(other, f.name))
+        self.distributions.subtract(other.distributions)
+        return self
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON-ready totals (see `from_dict`)."""
+        data: dict[str, Any] = {
+            f.name: getattr(self, f.name) for f in fields(self) if f.name != "distributions"
+        }
+        data["distributions"] = self.distributions.to_dict()
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> SummaryAccumulator:
+        """Inverse of `to_dict`."""
+        data = dict(data)
+        distributions = OutcomeDistributions.from_dict(data.pop("distributions", {}))
+        return cls(**{k: int(v) for k, v in data.items()}, distributions=distributions)
+
+    def energy_per_success_interval(self, confidence: float = 0.95) -> Interval:
+        """Confidence interval for expected_energy_per_success.
+
+        The estimate is the ratio R = sum(energy) / n_success, so its
+        standard error comes from the delta method:
+
+            Var(R) ~= Var(E_i - R * S_i) / (n * p^2)
+
+        where S_i is the success indicator of run i.
+
+        Args:
+            confidence: Confidence level, e.g. 0.95.
+
+        Returns:
+            Interval (infinite when there are no successes yet).
+        """
+        n = self.n_trials
+        n_s = self.n_success
+        if n_s == 0:
+            inf = float("inf")
+            return Interval(
+                estimate=inf, std_error=inf, low=inf, high=inf, confidence=float(confidence)
+            )
+
+        r = (self.energy_success + self.energy_fail) / n_s
+        p = n_s / n
+        energy_sq = self.energy_sq_success + self.energy_sq_fail
+        # Mean of (E_i - R S_i)^2; the mean of E_i - R S_i is exactly 0.
+        resid_sq = (energy_sq - 2.0 * r * self.energy_success + r * r * n_s) / n
+        var = max(0.0, resid_sq) * n / max(1, n - 1)
+        return Interval.normal(r, math.sqrt(var / n) / p, confidence)
+
+    def field_intervals(
+        self,
+        config: TrialConfig,
+        confidence: float = 0.95,
+        replicates: int = DEFAULT_BOOTSTRAP_REPLICATES,
+    ) -> SummaryIntervals:
+        """Bootstrap interval for every Summary field.
+
+        See `bootstrap_intervals`.
+        """
+        return bootstrap_intervals(
+            self.distributions, config, confidence=confidence, replicates=replicates
+        )
+
+    def to_summary(self, config: TrialConfig, rules: Rules) -> Summary:
+        """Compute the Summary for everything consumed so far.
+
+        Metrics are observational only (LOCKED) except the "until
+        success" expectations, which are computed analytically from
+        per-run success probability to avoid nested simulation.
+        """
+        _ = rules
+
+        n = self.n_trials
+        if n == 0:
+            return Summary(
+                n_trials=0,
+                success_rate=0.0,
+                fail_rate=1.0,
+                p_needs_reset_before_success=1.0,
+                mean_attempts=0.0,
+                mean_resets=0.0,
+                mean_energy=0.0,
+                mean_attempts_success=0.0,
+                mean_attempts_fail=0.0,
+                mean_energy_success=0.0,
+                mean_energy_fail=0.0,
+                expected_runs_per_success=float("inf"),
+                expected_resets_before_success=float("inf"),
+                expected_attempts_per_success=float("inf"),
+                expected_energy_per_success=float("inf"),
+                expected_encouragement_upgrades_per_success=float("inf"),
+            )
+
+        n_s = self.n_success
+        n_f = self.n_fail
+
+        p = n_s / n
+        q = 1.0 - p
+
+        mean_attempts = (self.attempts_success + self.attempts_fail) / n
+        mean_resets = (self.resets_success + self.resets_fail) / n
+        mean_energy = (self.energy_success + self.energy_fail) / n
+
+        # Conditional means. If there are no successes/failures, define as 0.
+        mean_attempts_success = self.attempts_success / n_s if n_s else 0.0
+        mean_attempts_fail = self.attempts_fail / n_f if n_f else 0.0
+        mean_energy_success = self.energy_success / n_s if n_s else 0.0
+        mean_energy_fail = self.energy_fail / n_f if n_f else 0.0
+
+        # "Until success" expectations (geometric over runs).
+        #
+        # Expected #runs until first success: 1/p
+        # Expected #failed runs before success: q/p
+        # P(needs at least one reset before success): q
+        #
+        # Expected total attempts until success:
+        #   E[A | success] + (q/p) * E[A | fail]
+        #
+        # Same for energy.
+        if p == 0.0:
+            expected_runs_per_success = float("inf")
+            expected_resets_before_success = float("inf")
+            expected_attempts_per_success = float("inf")
+            expected_energy_per_success = float("inf")
+            expected_encouragement_upgrades_per_success = float("inf")
+        else:
+            expected_runs_per_success = 1.0 / p
+            expected_resets_before_success = q / p
+
+            expected_attempts_per_success = mean_attempts_success + (q / p) * mean_attempts_fail
+            expected_energy_per_success = mean_energy_success + (q / p) * mean_energy_fail
+
+            # Your "encouragement upgrades" model:
+            # one "run" costs initial_k encouragement upgrades to build back up.
+            expected_encouragement_upgrades_per_success = float(config.initial_k) * (1.0 / p)
+
+        return Summary(
+            n_trials=n,
+            success_rate=p,
+            fail_rate=q,
+            p_needs_reset_before_success=q,
+            mean_attempts=mean_attempts,
+            mean_resets=mean_resets,
+            mean_energy=mean_energy,
+            mean_attempts_success=mean_attempts_success,
+            mean_attempts_fail=mean_attempts_fail,
+            mean_energy_success=mean_energy_success,
+            mean_energy_fail=mean_energy_fail,
+            expected_runs_per_success=expected_runs_per_success,
+            expected_resets_before_success=expected_resets_before_success,
+            expected_attempts_per_success=expected_attempts_per_success,
+            expected_energy_per_success=expected_energy_per_success,
+            expected_encouragement_upgrades_per_success=(
+                expected_encouragement_upgrades_per_success
+            ),
+        )
+
+
 def summarize_results(
-    results: list[TrialResult],
+    results: TrialResults | list[TrialResult],
     config: TrialConfig,
     rules: Rules,
 ) -> Summary:
     """Summarize a batch of trial results.
 
-    Metrics are observational only (LOCKED) except the "until success"
-    expectations, which are computed analytically from per-run success
-    probability to avoid nested simulation.
+    Columnar results are read directly, in slices so temporaries stay
+    small (the columns may be memory maps of an export much larger than
+    RAM, see `export.open_trials`); a list of TrialResult is converted
+    once for compatibility. See `SummaryAccumulator` for summarizing
+    chunks without holding every result.
     """
-    _ = rules
+    if not isinstance(results, TrialResults):
+        results = TrialResults.from_rows(results)
+    acc = SummaryAccumulator()
+    for start in range(0, len(results), _SUMMARY_SLICE):
+        acc.update(results[start : start + _SUMMARY_SLICE])
+    return acc.to_summary(config, rules)
 
-    n = len(results)
-    if n == 0:
+
+@dataclass(slots=True)
+class WeightedSummaryAccumulator:
+    """Running weighted totals behind an importance-sampled Summary.
+
+    Each trial carries a likelihood ratio w (target over proposal
+    probability of its rolls). Every Summary field is a ratio of
+    expectations, so the weighted sums below give self-normalised
+    estimates of all of them. Sums are floats, so unlike
+    SummaryAccumulator the last bits depend on chunking.
+    """
+
+    n_trials: int = 0
+    weight: float = 0.0
+    weight_sq: float = 0.0
+    weight_success: float = 0.0
+    weight_sq_success: float = 0.0
+    attempts_success: float = 0.0
+    attempts_fail: float = 0.0
+    resets_success: float = 0.0
+    resets_fail: float = 0.0
+    energy_success: float = 0.0
+    energy_fail: float = 0.0
+    # Squared-weight moments for the delta-method interval.
+    wsq_energy_sq: float = 0.0
+    wsq_energy_success: float = 0.0
+
+    def update(self, results: TrialResults, weights: np.ndarray) -> WeightedSummaryAccumulator:
+        """Add one chunk of results with their likelihood ratios.
+
+        Returns:
+            self, for chaining.
+        """
+        s = results.success
+        w = np.asarray(weights, dtype=float)
+        w_s = np.where(s, w, 0.0)
+        w_f = w - w_s
+        w_sq = w * w
+        energy = results.energy_spent.astype(float)
+
+        self.n_trials += len(results)
+        self.weight += float(w.sum())
+        self.weight_sq += float(w_sq.sum())
+        self.weight_success += float(w_s.sum())
+        self.weight_sq_success += float(w_sq.sum(where=s))
+        self.attempts_success += float(w_s @ results.attempts)
+        self.attempts_fail += float(w_f @ results.attempts)
+        self.resets_success += float(w_s @ results.resets)
+        self.resets_fail += float(w_f @ results.resets)
+        self.energy_success += float(w_s @ energy)
+        self.energy_fail += float(w_f @ energy)
+        self.wsq_energy_sq += float(w_sq @ (energy * energy))
+        self.wsq_energy_success += float((w_sq * energy).sum(where=s))
+        return self
+
+    def merge(self, other: WeightedSummaryAccumulator) -> WeightedSummaryAccumulator:
+        """Add another accumulator's totals into this one.
+
+        Returns:
+            self, for chaining.
+        """
+        for f in fields(self):
+            setattr(self, f.name, getattr(self, f.name) + getattr(other, f.name))
+        return self
+
+    @property
+    def effective_sample_size(self) -> float:
+        """Kish effective sample size (sum w)^2 / sum w^2."""
+        return self.weight**2 / self.weight_sq if self.weight_sq > 0.0 else 0.0
+
+    @property
+    def effective_successes(self) -> float:
+        """Kish effective sample size of the successful runs."""
+        if self.weight_sq_success <= 0.0:
+            return 0.0
+        return self.weight_success**2 / self.weight_sq_success
+
+    def energy_per_success_interval(self, confidence: float = 0.95) -> Interval:
+        """Confidence interval for expected_energy_per_success.
+
+        R = sum(w E) / sum(w S), and with psi_i = w_i (E_i - R S_i):
+
+            Var(R) ~= sum(psi_i^2) / sum(w S)^2
+        """
+        if self.weight_success <= 0.0:
+            inf = float("inf")
+            return Interval(
+                estimate=inf, std_error=inf, low=inf, high=inf, confidence=float(confidence)
+            )
+        r = (self.energy_success + self.energy_fail) / self.weight_success
+        psi_sq = (
+            self.wsq_energy_sq
+            - 2.0 * r * self.wsq_energy_success
+            + r * r * self.weight_sq_success
+        )
+        var = max(0.0, psi_sq) / self.weight_success**2
+        return Interval.normal(r, math.sqrt(var), confidence)
+
+    def to_summary(self, config: TrialConfig, rules: Rules) -> Summary:
+        """Weighted Summary, with n_trials the number of trials run.
+
+        Weighted counts are rescaled to sum to n_trials and then go
+        through the same formulas as `SummaryAccumulator.to_summary`.
+        """
+        _ = rules
+        n = self.n_trials
+        scale = n / self.weight if self.weight > 0.0 else 0.0
+        columns = _summary_columns(
+            n=n,
+            n_success=np.array([self.weight_success * scale]),
+            sums={name: np.array([getattr(self, name) * scale]) for name in _HIST_SUMS},
+            initial_k=config.initial_k,
+        )
         return Summary(
-            n_trials=0,
-            success_rate=0.0,
-            fail_rate=1.0,
-            p_needs_reset_before_success=1.0,
-            mean_attempts=0.0,
-            mean_resets=0.0,
-            mean_energy=0.0,
-            mean_attempts_success=0.0,
-            mean_attempts_fail=0.0,
-            mean_energy_success=0.0,
-            mean_energy_fail=0.0,
-            expected_runs_per_success=float("inf"),
-            expected_resets_before_success=float("inf"),
-            expected_attempts_per_success=float("inf"),
-            expected_energy_per_success=float("inf"),
-            expected_encouragement_upgrades_per_success=float("inf"),
+            **{
+                name: int(values[0]) if name == "n_trials" else float(values[0])
+                for name, values in columns.items()
+            }
         )
 
-    success = np.fromiter((1.0 if r.success else 0.0 for r in results), dtype=float, count=n)
-    energy = np.fromiter((float(r.energy_spent) for r in results), dtype=float, count=n)
-    attempts = np.fromiter((float(r.attempts) for r in results), dtype=float, count=n)
-    resets = np.fromiter((float(r.resets) for r in results), dtype=float, count=n)
 
-    p = float(success.mean())
-    q = 1.0 - p
+@dataclass(frozen=True, slots=True)
+class SummaryIntervals:
+    """Standard error and confidence interval for every Summary field.
 
-    mean_attempts = float(attempts.mean())
-    mean_resets = float(resets.mean())
-    mean_energy = float(energy.mean())
+    Attributes:
+        intervals: Interval per Summary field name, in field order.
+        replicates: Bootstrap replicates behind the intervals.
+    """
 
-    # Conditional means. If there are no successes/failures, define as 0.
-    mask_s = success == 1.0
-    mask_f = ~mask_s
+    intervals: dict[str, Interval]
+    replicates: int
 
-    mean_attempts_success = float(attempts[mask_s].mean()) if mask_s.any() else 0.0
-    mean_attempts_fail = float(attempts[mask_f].mean()) if mask_f.any() else 0.0
-    mean_energy_success = float(energy[mask_s].mean()) if mask_s.any() else 0.0
-    mean_energy_fail = float(energy[mask_f].mean()) if mask_f.any() else 0.0
+    def __getitem__(self, name: str) -> Interval:
+        return self.intervals[name]
 
-    # "Until success" expectations (geometric over runs).
-    #
-    # Expected #runs until first success: 1/p
-    # Expected #failed runs before success: q/p
-    # P(needs at least one reset before success): q
-    #
-    # Expected total attempts until success:
-    #   E[A | success] + (q/p) * E[A | fail]
-    #
-    # Same for energy.
-    if p == 0.0:
-        expected_runs_per_success = float("inf")
-        expected_resets_before_success = float("inf")
-        expected_attempts_per_success = float("inf")
-        expected_energy_per_success = float("inf")
-        expected_encouragement_upgrades_per_success = float("inf")
-    else:
-        expected_runs_per_success = 1.0 / p
-        expected_resets_before_success = q / p
-
-        expected_attempts_per_success = mean_attempts_success + (q / p) * mean_attempts_fail
-        expected_energy_per_success = mean_energy_success + (q / p) * mean_energy_fail
-
-        # Your "encouragement upgrades" model:
-        # one "run" costs initial_k encouragement upgrades to build back up.
-        expected_encouragement_upgrades_per_success = float(config.initial_k) * (1.0 / p)
-
-    return Summary(
-        n_trials=n,
-        success_rate=p,
-        fail_rate=q,
-        p_needs_reset_before_success=q,
-        mean_attempts=mean_attempts,
-        mean_resets=mean_resets,
-        mean_energy=mean_energy,
-        mean_attempts_success=mean_attempts_success,
-        mean_attempts_fail=mean_attempts_fail,
-        mean_energy_success=mean_energy_success,
-        mean_energy_fail=mean_energy_fail,
-        expected_runs_per_success=expected_runs_per_success,
-        expected_resets_before_success=expected_resets_before_success,
-        expected_attempts_per_success=expected_attempts_per_success,
-        expected_energy_per_success=expected_energy_per_success,
-        expected_encouragement_upgrades_per_success=expected_encouragement_upgrades_per_success,
+    def __str__(self) -> str:
+        width = max(len(name) for name in self.intervals)
+        return "\n".join(
+            f"{name:<{width}}  {interval}  se={interval.std_error:.4g}"
+            for name, interval in self.intervals.items()
+        )
+
+
+def bootstrap_intervals(
+    distributions: OutcomeDistributions,
+    config: TrialConfig,
+    *,
+    confidence: float = 0.95,
+    replicates: int = DEFAULT_BOOTSTRAP_REPLICATES,
+    seed: int = 0,
+) -> SummaryIntervals:
+    """Bootstrap standard errors and percentile intervals for a Summary.
+
+    Every Summary field is a function of the success count and of the
+    per-outcome sums of one quantity (attempts, resets or energy). The
+    outcome histograms are exact, so resampling trials is equivalent to
+    drawing the success count from Binomial(n, p) and each per-outcome
+    sum from a multinomial over its histogram. All replicates are drawn
+    as arrays at once; nothing loops over trials or replicates, and the
+    cost does not grow with n_trials.
+
+    Args:
+        distributions: Outcome histograms of the run.
+        config: Trial configuration (initial_k enters one field).
+        confidence: Confidence level, e.g. 0.95.
+        replicates: Bootstrap replicates.
+        seed: Bootstrap RNG seed, so intervals are reproducible.
+
+    Returns:
+        SummaryIntervals. The estimate of each interval is the observed
+        Summary value; std_error is inf if any replicate is undefined
+        (e.g. has no successes).
+    """
+    d = distributions
+    n_s = d.attempts_success.total
+    n = n_s + d.attempts_fail.total
+    observed = _summary_columns(
+        n=n,
+        n_success=np.array([n_s], dtype=float),
+        sums={name: np.array([_hist_sum(getattr(d, name))]) for name in _HIST_SUMS},
+        initial_k=config.initial_k,
+    )
+
+    rng = np.random.default_rng(seed)
+    b = max(1, int(replicates))
+    n_s_b = rng.binomial(n, n_s / n, size=b) if n else np.zeros(b, dtype=np.int64)
+    n_f_b = n - n_s_b
+    sums = {
+        name: _resample_sum(rng, getattr(d, name), n_s_b if name.endswith("success") else n_f_b)
+        for name in _HIST_SUMS
+    }
+    boot = _summary_columns(
+        n=n, n_success=n_s_b.astype(float), sums=sums, initial_k=config.initial_k
     )
+
+    alpha = (1.0 - float(confidence)) / 2.0
+    intervals: dict[str, Interval] = {}
+    for name, values in boot.items():
+        estimate = float(observed[name][0])
+        finite = bool(np.isfinite(values).all())
+        intervals[name] = Interval(
+            estimate=estimate,
+            std_error=float(values.std(ddof=1)) if finite and b > 1 else float("inf"),
+            low=float(np.quantile(values, alpha, method="lower")),
+            high=float(np.quantile(values, 1.0 - alpha, method="higher")),
+            confidence=float(confidence),
+        )
+    return SummaryIntervals(intervals=intervals, replicates=b)
+
+
+# Histograms whose sums the Summary fields depend on.
+_HIST_SUMS = (
+    "attempts_success",
+    "attempts_fail",
+    "resets_success",
+    "resets_fail",
+    "energy_success",
+    "energy_fail",
+)
+
+
+def _hist_sum(hist: Histogram) -> float:
+    """Sum of the observations in a histogram."""
+    return float(np.dot(np.arange(len(hist.counts)), hist.counts)) if hist.counts else 0.0
+
+
+def _resample_sum(rng: np.random.Generator, hist: Histogram, counts: np.ndarray) -> np.ndarray:
+    """Per replicate, the sum of `counts[i]` draws from a histogram.
+
+    Draws are with replacement.
+    """
+    values = np.flatnonzero(hist.counts)
+    if values.size == 0:
+        return np.zeros(counts.shape[0])
+    weights = np.asarray(hist.counts, dtype=float)[values]
+    draws = rng.multinomial(counts, weights / weights.sum())
+    return draws @ values.astype(float)
+
+
+def _summary_columns(
+    *,
+    n: int,
+    n_success: np.ndarray,
+    sums: dict[str, np.ndarray],
+    initial_k: int,
+) -> dict[str, np.ndarray]:
+    """Summary fields for arrays of sufficient statistics.
+
+    Same formulas as `SummaryAccumulator.to_summary`, elementwise.
+    """
+    inf = float("inf")
+    n_s = n_success
+    n_f = n - n_s
+    with np.errstate(divide="ignore", invalid="ignore"):
+        p = n_s / n if n else np.zeros_like(n_s)
+        q = 1.0 - p
+        mean_attempts_success = np.where(n_s > 0, sums["attempts_success"] / n_s, 0.0)
+        mean_attempts_fail = np.where(n_f > 0, sums["attempts_fail"] / n_f, 0.0)
+        mean_energy_success = np.where(n_s > 0, sums["energy_success"] / n_s, 0.0)
+        mean_energy_fail = np.where(n_f > 0, sums["energy_fail"] / n_f, 0.0)
+        odds = q / p
+        columns = {
+            "n_trials": np.full(n_s.shape, float(n)),
+            "success_rate": p,
+            "fail_rate": q,
+            "p_needs_reset_before_success": q,
+            "mean_attempts": (sums["attempts_success"] + sums["attempts_fail"]) / n,
+            "mean_resets": (sums["resets_success"] + sums["resets_fail"]) / n,
+            "mean_energy": (sums["energy_success"] + sums["energy_fail"]) / n,
+            "mean_attempts_success": mean_attempts_success,
+            "mean_attempts_fail": mean_attempts_fail,
+            "mean_energy_success": mean_energy_success,
+            "mean_energy_fail": mean_energy_fail,
+            "expected_runs_per_success": np.where(p > 0, 1.0 / p, inf),
+            "expected_resets_before_success": np.where(p > 0, odds, inf),
+            "expected_attempts_per_success": np.where(
+                p > 0, mean_attempts_success + odds * mean_attempts_fail, inf
+            ),
+            "expected_energy_per_success": np.where(
+                p > 0, mean_energy_success + odds * mean_energy_fail, inf
+            ),
+            "expected_encouragement_upgrades_per_success": np.where(
+                p > 0, float(initial_k) * (1.0 / p), inf
+            ),
+        }
+    if n == 0:
+        # Mirror the empty Summary.
+        columns.update(
+            fail_rate=np.ones(n_s.shape),
+            p_needs_reset_before_success=np.ones(n_s.shape),
+            mean_attempts=np.zeros(n_s.shape),
+            mean_resets=np.zeros(n_s.shape),
+            mean_energy=np.zeros(n_s.shape),
+        )
+    return {f.name: columns[f.name] for f in fields(Summary)}
@@ -0,0 +1,166 @@
+"""Risk-aware objectives for choosing initial_k.
+
+The mean energy per success ignores how bad an unlucky streak gets.
+Every objective here is a statistic of energy until success (see
+`OutcomeDistributions.energy_until_success`), computed from the
+per-k histograms a sweep already collected, so no trials are re-run.
+
+Objectives are written as short specs:
+
+    mean          expected energy until success (minimized)
+    p90           90th percentile of energy until success (minimized)
+    mean+2sd      mean plus 2 standard deviations (minimized)
+    budget:2000   P(success within 2000 energy) (maximized)
+"""
+
+from __future__ import annotations
+
+import math
+import re
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+
+from gaming_monte_carlo.simulation.distributions import EnergyUntilSuccess, OutcomeDistributions
+
+DEFAULT_OBJECTIVES = ("mean", "p50", "p90", "p99", "mean+1sd")
+
+_QUANTILE = re.compile(r"p(\d+(?:\.\d+)?)")
+_MEAN_SD = re.compile(r"mean\+(\d+(?:\.\d+)?)sd")
+_BUDGET = re.compile(r"budget:(\d+(?:\.\d+)?)")
+
+
+@dataclass(frozen=True, slots=True)
+class Objective:
+    """One statistic of energy until success to optimize over k.
+
+    Attributes:
+        kind: "mean", "quantile", "mean_sd" or "budget".
+        parameter: Quantile level, lambda, or energy budget (unused for
+            mean).
+    """
+
+    kind: str
+    parameter: float = 0.0
+
+    @property
+    def label(self) -> str:
+        """Column header, e.g. P90 or P(E<=2000)."""
+        if self.kind == "quantile":
+            return f"P{self.parameter * 100:g}"
+        if self.kind == "mean_sd":
+            return f"mean+{self.parameter:g}sd"
+        if self.kind == "budget":
+            return f"P(E<={self.parameter:g})"
+        return "mean"
+
+    @property
+    def maximize(self) -> bool:
+        """True when larger values are better."""
+        return self.kind == "budget"
+
+    def evaluate(self, energy: EnergyUntilSuccess) -> float:
+        """Value of the objective for one k."""
+        if self.kind == "quantile":
+            return energy.quantile(self.parameter)
+        if self.kind == "mean_sd":
+            return energy.mean + self.parameter * energy.std
+        if self.kind == "budget":
+            return energy.cdf(self.parameter)
+        return energy.mean
+
+
+def parse_objective(spec: str) -> Objective:
+    """Parse an objective spec (see the module docstring).
+
+    Raises:
+        ValueError: For an unknown spec or a quantile outside (0, 100).
+    """
+    text = spec.strip().lower()
+    if text == "mean":
+        return Objective("mean")
+    if match := _QUANTILE.fullmatch(text):
+        level = float(match.group(1)) / 100.0
+        if not 0.0 < level < 1.0:
+            raise ValueError(f"Quantile objective {spec!r} must be between p0 and p100")
+        return Objective("quantile", level)
+    if match := _MEAN_SD.fullmatch(text):
+        return Objective("mean_sd", float(match.group(1)))
+    if match := _BUDGET.fullmatch(text):
+        return Objective("budget", float(match.group(1)))
+    raise ValueError(
+        f"Unknown objective {spec!r}; expected mean, p<percent>, mean+<lambda>sd "
+        "or budget:<energy>"
+    )
+
+
+def parse_objectives(spec: str) -> tuple[Objective, ...]:
+    """Parse a comma-separated list of objective specs."""
+    objectives = tuple(parse_objective(part) for part in spec.split(",") if part.strip())
+    if not objectives:
+        raise ValueError("At least one objective is required")
+    return objectives
+
+
+@dataclass(frozen=True, slots=True)
+class ObjectiveTable:
+    """Objective values for every k, and the best k per objective.
+
+    Attributes:
+        objectives: Objectives, in column order.
+        values: values[k] holds one value per objective.
+        best_k: Best k per objective, in column order.
+    """
+
+    objectives: tuple[Objective, ...]
+    values: dict[int, tuple[float, ...]]
+    best_k: tuple[int, ...]
+
+    def __str__(self) -> str:
+        width = max(12, *(len(o.label) + 2 for o in self.objectives))
+        lines = [f"{'k':>6}" + "".join(f"{o.label:>{width}}" for o in self.objectives)]
+        for k, row in self.values.items():
+            cells = (
+                f"{v:{width}.4f}" if o.maximize else f"{v:{width}.1f}"
+                for o, v in zip(self.objectives, row)
+            )
+            lines.append(f"{k:6d}" + "".join(cells))
+        lines.append(f"{'best_k':>6}" + "".join(f"{k:>{width}d}" for k in self.best_k))
+        return "\n".join(lines)
+
+
+def evaluate_objectives(
+    distributions: Mapping[int, OutcomeDistributions],
+    objectives: Sequence[Objective] | None = None,
+) -> ObjectiveTable:
+    """Evaluate every objective for every k and pick the best k for each.
+
+    Ties go to the smallest k. NaN values (never expected, but possible
+    for an empty histogram) never win.
+
+    Args:
+        distributions: Per-run outcome histograms per k.
+        objectives: Objectives to evaluate. None uses DEFAULT_OBJECTIVES.
+
+    Returns:
+        ObjectiveTable with ks in increasing order.
+    """
+    if objectives is None:
+        objectives = parse_objectives(",".join(DEFAULT_OBJECTIVES))
+    objectives = tuple(objectives)
+    if not distributions:
+        raise ValueError("distributions must contain at least one k")
+    values: dict[int, tuple[float, ...]] = {}
+    for k in sorted(distributions):
+        energy = distributions[k].energy_until_success()
+        values[k] = tuple(o.evaluate(energy) for o in objectives)
+
+    best_k = []
+    for i, objective in enumerate(objectives):
+        sign = -1.0 if objective.maximize else 1.0
+
+        def score(k: int) -> float:
+            v = values[k][i]
+            return math.inf if math.isnan(v) else sign * v
+
+        best_k.append(min(values, key=score))
+    return ObjectiveTable(objectives=objectives, values=values, best_k=tuple(best_k))
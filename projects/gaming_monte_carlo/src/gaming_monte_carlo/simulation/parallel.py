@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from gaming_monte_carlo.simulation.engine import TrialRunner, run_blocks, run_trials
+from gaming_monte_carlo.simulation.metrics import SummaryAccumulator
+from gaming_monte_carlo.simulation.results import TrialResults
+from gaming_monte_carlo.simulation.rules import Rules
+from gaming_monte_carlo.simulation.state import TrialConfig
+from gaming_monte_carlo.simulation.streams import (
+    STREAM_BLOCK_SIZE,
+    block_rng,
+    iter_blocks,
+    n_blocks,
+    root_seed_sequence,
+)
+
+DEFAULT_CHUNK_SIZE = 16 * STREAM_BLOCK_SIZE
+
+
+def chunk_block_ranges(n_trials: int, chunk_size: int | None = None) -> list[tuple[int, int]]:
+    """Group stream blocks into contiguous work units.
+
+    Args:
+        n_trials: Total number of trials.
+        chunk_size: Trials per work unit, rounded up to whole blocks.
+            None uses DEFAULT_CHUNK_SIZE.
+
+    Returns:
+        List of (start_block, stop_block) ranges covering every block.
+    """
+    size = DEFAULT_CHUNK_SIZE if chunk_size is None else int(chunk_size)
+    if size <= 0:
+        raise ValueError(f"chunk_size must be positive, got {size}")
+
+    per_chunk = -(-size // STREAM_BLOCK_SIZE)
+    total = n_blocks(n_trials)
+    return [(start, min(total, start + per_chunk)) for start in range(0, total, per_chunk)]
+
+
+def resolve_workers(workers: int | None) -> int:
+    """Resolve a worker count, where None means every available core."""
+    if workers is None:
+        return os.cpu_count() or 1
+    if int(workers) <= 0:
+        raise ValueError(f"workers must be positive, got {workers}")
+    return int(workers)
+
+
+def summarize_blocks(
+    *,
+    runner: TrialRunner,
+    config: TrialConfig,
+    rules: Rules,
+    n_trials: int,
+    entropy: int,
+    start_block: int,
+    stop_block: int,
+) -> SummaryAccumulator:
+    """Run a range of stream blocks and reduce them in the worker.
+
+    Only the accumulator travels back to the parent, so a work unit's
+    memory and pickling cost do not grow with its trial count.
+
+    Args:
+        runner: Per-block trial runner.
+        config: Trial configuration.
+        rules: Rules.
+        n_trials: Total trials in the whole simulation.
+        entropy: Root seed entropy shared by every block.
+        start_block: First block (inclusive).
+        stop_block: Last block (exclusive).
+
+    Returns:
+        SummaryAccumulator over the covered trials.
+    """
+    root = root_seed_sequence(entropy)
+    buffer = TrialResults.empty(STREAM_BLOCK_SIZE)
+    acc = SummaryAccumulator()
+    for block, size in iter_blocks(n_trials, start_block, stop_block):
+        out = buffer[:size]
+        runner(config=config, rules=rules, rng=block_rng(root, block), out=out)
+        acc.update(out)
+    return acc
+
+
+def run_simulation_parallel(
+    *,
+    config: TrialConfig,
+    rules: Rules,
+    n_trials: int,
+    seed: int | None = None,
+    workers: int | None = None,
+    chunk_size: int | None = None,
+    runner: TrialRunner = run_trials,
+) -> TrialResults:
+    """Run a simulation across a process pool.
+
+    Every chunk is a contiguous range of stream blocks, and every block
+    draws from its own child of the root SeedSequence. Chunk results are
+    copied into one preallocated container at their block offset, so the
+    output equals the in-process `run_simulation` for the same seed
+    whatever the worker count or chunk size.
+
+    Args:
+        config: Trial configuration.
+        rules: Rules.
+        n_trials: Number of trials.
+        seed: RNG seed. None uses fresh OS entropy.
+        workers: Worker processes. None uses every core.
+        chunk_size: Trials per work unit. None uses DEFAULT_CHUNK_SIZE.
+        runner: Per-block trial runner (must be picklable).
+
+    Returns:
+        Columnar TrialResults in trial order.
+    """
+    entropy = root_seed_sequence(seed).entropy
+    ranges = chunk_block_ranges(n_trials, chunk_size)
+    n_workers = min(resolve_workers(workers), max(1, len(ranges)))
+
+    results = TrialResults.empty(n_trials)
+    with ProcessPoolExecutor(max_workers=n_workers) as pool:
+        futures = [
+            pool.submit(
+                run_blocks,
+                runner=runner,
+                config=config,
+                rules=rules,
+                n_trials=n_trials,
+                entropy=entropy,
+                start_block=start,
+                stop_block=stop,
+            )
+            for start, stop in ranges
+        ]
+        for (start, _), future in zip(ranges, futures):
+            results.assign(start * STREAM_BLOCK_SIZE, future.result())
+    return results
@@ -0,0 +1,165 @@
+"""Statistical racing search for the k with the lowest energy per success.
+
+All candidates start with a small batch of trials. After every round the
+current leader (lowest expected_energy_per_success) is compared to each
+other survivor, and any k whose paired difference to the leader is
+confidently positive is dropped. The next round's batch grows
+geometrically, so the remaining budget goes to the close contenders
+(successive halving).
+
+Candidates share common random numbers (see `crn.py`): every survivor
+runs the same stream blocks from the same uniform rows, which makes the
+pairwise comparisons much sharper than independent intervals.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+from gaming_monte_carlo.simulation.crn import PairedDelta, PairedSweepAccumulator
+from gaming_monte_carlo.simulation.distributions import OutcomeDistributions
+from gaming_monte_carlo.simulation.engine import run_trials_from_uniforms, uniform_row_width
+from gaming_monte_carlo.simulation.metrics import Interval, Summary, SummaryAccumulator
+from gaming_monte_carlo.simulation.results import TrialResults
+from gaming_monte_carlo.simulation.rules import Rules
+from gaming_monte_carlo.simulation.state import TrialConfig
+from gaming_monte_carlo.simulation.streams import (
+    STREAM_BLOCK_SIZE,
+    block_rng,
+    n_blocks,
+    root_seed_sequence,
+)
+
+
+@dataclass(frozen=True, slots=True)
+class RaceResult:
+    """Outcome of a racing search.
+
+    Attributes:
+        best_k: Chosen k.
+        interval: expected_energy_per_success interval for best_k.
+        summaries: Summary per k over the trials it received.
+        trials_by_k: Trials each k received before it was dropped.
+        eliminated: Paired comparison against the leader that dropped
+            each eliminated k.
+        total_trials: Trials simulated across every k.
+        resolved: True if every other k was eliminated before the cap.
+        distributions: Per-run outcome histograms per k.
+    """
+
+    best_k: int
+    interval: Interval
+    summaries: dict[int, Summary]
+    trials_by_k: dict[int, int]
+    eliminated: dict[int, PairedDelta]
+    total_trials: int
+    resolved: bool
+    distributions: dict[int, OutcomeDistributions]
+
+
+def race_best_k(
+    *,
+    base_config: TrialConfig,
+    rules: Rules,
+    ks: Sequence[int],
+    seed: int | None = None,
+    confidence: float = 0.95,
+    initial_trials: int = 2 * STREAM_BLOCK_SIZE,
+    growth: float = 2.0,
+    max_trials_per_k: int = 1_000_000,
+) -> RaceResult:
+    """Find the k with the lowest expected energy per success by racing.
+
+    The per-comparison confidence is Bonferroni-adjusted for the number
+    of candidates, so `confidence` bounds the chance that any elimination
+    in a round is wrong.
+
+    Args:
+        base_config: Config providing snail level and hole bonus.
+        rules: Rules.
+        ks: Candidate initial_k values.
+        seed: RNG seed. None uses fresh OS entropy.
+        confidence: Family-wise confidence for eliminations.
+        initial_trials: Trials per survivor in the first round.
+        growth: Factor by which each round's batch grows.
+        max_trials_per_k: Cap on trials for any single k. Batches are
+            rounded up to whole stream blocks.
+
+    Returns:
+        RaceResult.
+
+    Raises:
+        ValueError: If ks is empty, growth < 1, or initial_trials or
+            max_trials_per_k is below 1.
+    """
+    ks = tuple(sorted({int(k) for k in ks}))
+    if not ks:
+        raise ValueError("ks must contain at least one k")
+    if growth < 1.0:
+        raise ValueError(f"growth must be >= 1, got {growth}")
+    if int(initial_trials) < 1:
+        raise ValueError(f"initial_trials must be >= 1, got {initial_trials}")
+    if int(max_trials_per_k) < 1:
+        raise ValueError(f"max_trials_per_k must be >= 1, got {max_trials_per_k}")
+
+    configs = [base_config.with_initial_k(k) for k in ks]
+    pairwise_confidence = 1.0 - (1.0 - float(confidence)) / max(1, len(ks) - 1)
+
+    # The row width is fixed by the largest candidate so every block draws
+    # the same uniforms however many candidates are still running.
+    width = uniform_row_width(max(ks))
+    root = root_seed_sequence(seed)
+
+    per_k = [SummaryAccumulator() for _ in ks]
+    paired = PairedSweepAccumulator(ks)
+    alive = [True] * len(ks)
+    eliminated: dict[int, PairedDelta] = {}
+
+    block = 0
+    batch = float(initial_trials)
+    while paired.n_trials == 0 or (sum(alive) > 1 and paired.n_trials < max_trials_per_k):
+        budget = min(int(batch), int(max_trials_per_k) - paired.n_trials)
+        for _ in range(n_blocks(budget)):
+            uniforms = block_rng(root, block).random((STREAM_BLOCK_SIZE, width))
+            block_results: list[TrialResults | None] = []
+            for i, config in enumerate(configs):
+                if not alive[i]:
+                    block_results.append(None)
+                    continue
+                out = TrialResults.empty(STREAM_BLOCK_SIZE)
+                run_trials_from_uniforms(config=config, rules=rules, uniforms=uniforms, out=out)
+                per_k[i].update(out)
+                block_results.append(out)
+            paired.update(block_results)
+            block += 1
+
+        leader = _leader(paired, alive)
+        for i in range(len(ks)):
+            if not alive[i] or i == leader:
+                continue
+            delta = paired.delta(leader, i, pairwise_confidence)
+            if delta.interval.low > 0.0:
+                alive[i] = False
+                eliminated[ks[i]] = delta
+        batch *= growth
+
+    best = _leader(paired, alive)
+    return RaceResult(
+        best_k=ks[best],
+        interval=per_k[best].energy_per_success_interval(confidence),
+        summaries={k: acc.to_summary(c, rules) for k, c, acc in zip(ks, configs, per_k)},
+        trials_by_k={k: acc.n_trials for k, acc in zip(ks, per_k)},
+        eliminated=eliminated,
+        total_trials=sum(acc.n_trials for acc in per_k),
+        resolved=sum(alive) == 1,
+        distributions={k: acc.distributions for k, acc in zip(ks, per_k)},
+    )
+
+
+def _leader(paired: PairedSweepAccumulator, alive: Sequence[bool]) -> int:
+    """Index of the surviving k with the lowest energy per success."""
+    candidates = [i for i, a in enumerate(alive) if a]
+    if paired.n_trials == 0:
+        return candidates[0]
+    return min(candidates, key=paired.ratio)
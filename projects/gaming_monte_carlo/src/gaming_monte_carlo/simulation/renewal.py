@@ -0,0 +1,281 @@
+"""Energy-budget renewal simulation: successes bought by a daily budget.
+
+A day starts with a fixed energy budget and chains runs until the
+budget is used up. Every run rebuilds k at `K_BUILD_COST` energy per k
+and then plays attempts with the same mechanics as the engines: pay
+the attempt cost, roll success, and on failure decay k and roll reset
+at the decayed k, all against the config's ProbabilityTable. The
+budget is applied on top:
+
+  - a run is only started if the budget still covers the rebuild and
+    one attempt;
+  - a run that cannot pay for its next attempt is cut short (no
+    success), and its energy is lost;
+  - whatever is left at the end of the day is the leftover.
+
+Days are simulated in stream blocks (see `streams.py`), all days of a
+block in parallel, one attempt per live day per step, so results
+depend only on the seed and the number of days.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+import numpy as np
+from numpy.random import Generator
+
+from gaming_monte_carlo.simulation.distributions import DEFAULT_QUANTILES, Histogram
+from gaming_monte_carlo.simulation.engine import K_BUILD_COST
+from gaming_monte_carlo.simulation.rules import ProbabilityTable, Rules, attempt_cost
+from gaming_monte_carlo.simulation.state import TrialConfig, TrialState
+from gaming_monte_carlo.simulation.streams import block_rng, iter_blocks, root_seed_sequence
+
+
+@dataclass(slots=True)
+class RenewalAccumulator:
+    """Mergeable per-day totals of a renewal simulation.
+
+    Attributes:
+        n_days: Days simulated.
+        runs: Runs started (including cut ones).
+        cut_runs: Runs stopped because the budget ran out.
+        abandoned_energy: Energy spent on cut runs.
+        resets: Reset events rolled over all runs.
+        successes: Histogram of successes per day.
+        leftover: Histogram of energy left at the end of the day.
+    """
+
+    n_days: int = 0
+    runs: int = 0
+    cut_runs: int = 0
+    abandoned_energy: int = 0
+    resets: int = 0
+    successes: Histogram = field(default_factory=Histogram)
+    leftover: Histogram = field(default_factory=Histogram)
+
+    def merge(self, other: RenewalAccumulator) -> RenewalAccumulator:
+        """Add another accumulator's totals into this one.
+
+        Returns:
+            self, for chaining.
+        """
+        self.n_days += other.n_days
+        self.runs += other.runs
+        self.cut_runs += other.cut_runs
+        self.abandoned_energy += other.abandoned_energy
+        self.resets += other.resets
+        self.successes.merge(other.successes)
+        self.leftover.merge(other.leftover)
+        return self
+
+
+def simulate_days(
+    *,
+    config: TrialConfig,
+    rules: Rules,
+    budget: int,
+    rng: Generator,
+    n_days: int,
+    table: ProbabilityTable | None = None,
+) -> RenewalAccumulator:
+    """Simulate a batch of days in parallel.
+
+    Args:
+        config: Trial configuration (initial_k is rebuilt every run).
+        rules: Rules.
+        budget: Energy available per day.
+        rng: RNG to use.
+        n_days: Days in the batch.
+        table: Per-k probabilities for `config`. Built when omitted.
+
+    Returns:
+        RenewalAccumulator for the batch.
+    """
+    k0 = int(config.initial_k)
+    cost = int(attempt_cost(TrialState.from_config(config), rules))
+    if k0 <= 0 or cost <= 0:
+        raise ValueError(
+            f"Renewal needs initial_k >= 1 and a positive attempt cost, got {k0} and {cost}"
+        )
+    if table is None:
+        table = ProbabilityTable.build(config)
+    rebuild = K_BUILD_COST * k0
+
+    remaining = np.full(n_days, int(budget), dtype=np.int64)
+    successes = np.zeros(n_days, dtype=np.int64)
+    # k of the run in progress on each day; 0 between runs.
+    k = np.zeros(n_days, dtype=np.int64)
+    run_spent = np.zeros(n_days, dtype=np.int64)
+    acc = RenewalAccumulator(n_days=int(n_days))
+
+    live = np.arange(n_days)
+    while live.size:
+        # Days between runs start the next one, or are done for the day.
+        idle = live[k[live] == 0]
+        start = idle[remaining[idle] >= rebuild + cost]
+        k[start] = k0
+        remaining[start] -= rebuild
+        run_spent[start] = rebuild
+        acc.runs += int(start.size)
+        live = live[k[live] > 0]
+
+        # A run that cannot pay for its next attempt is cut; the day is
+        # then too short for another run.
+        broke = remaining[live] < cost
+        cut = live[broke]
+        acc.cut_runs += int(cut.size)
+        acc.abandoned_energy += int(run_spent[cut].sum())
+        k[cut] = 0
+        live = live[~broke]
+
+        # Pay attempt cost.
+        remaining[live] -= cost
+        run_spent[live] += cost
+
+        # Success roll.
+        won = rng.random(live.size) < table.success[k[live]]
+        successes[live[won]] += 1
+        k[live[won]] = 0
+
+        # Failure path: k decay, then reset roll at the decayed k.
+        failed = live[~won]
+        k[failed] -= 1
+        reset = rng.random(failed.size) < table.reset_base[k[failed]]
+        acc.resets += int(np.count_nonzero(reset))
+
+    acc.successes.add(successes)
+    acc.leftover.add(remaining)
+    return acc
+
+
+@dataclass(frozen=True, slots=True)
+class RenewalSummary:
+    """What a daily energy budget buys at one initial_k.
+
+    Attributes:
+        budget: Energy per day.
+        initial_k: k rebuilt for every run.
+        n_days: Days simulated.
+        mean_successes: Mean successes per day.
+        std_successes: Standard deviation of successes per day.
+        p_no_success: Probability a day has no success.
+        successes_quantiles: Successes per day at DEFAULT_QUANTILES.
+        mean_leftover: Mean energy left at the end of a day.
+        leftover_quantiles: Leftover energy at DEFAULT_QUANTILES.
+        runs_per_day: Mean runs started per day.
+        cut_runs_per_day: Mean runs cut short by the budget per day.
+        abandoned_energy_per_day: Mean energy lost in cut runs per day.
+        resets_per_day: Mean reset events per day.
+        successes: Histogram of successes per day.
+        leftover: Histogram of leftover energy.
+    """
+
+    budget: int
+    initial_k: int
+    n_days: int
+    mean_successes: float
+    std_successes: float
+    p_no_success: float
+    successes_quantiles: tuple[float, ...]
+    mean_leftover: float
+    leftover_quantiles: tuple[float, ...]
+    runs_per_day: float
+    cut_runs_per_day: float
+    abandoned_energy_per_day: float
+    resets_per_day: float
+    successes: Histogram = field(compare=False, repr=False)
+    leftover: Histogram = field(compare=False, repr=False)
+
+    @classmethod
+    def from_accumulator(
+        cls, acc: RenewalAccumulator, *, budget: int, initial_k: int
+    ) -> RenewalSummary:
+        """Summarize accumulated days."""
+        n = max(1, acc.n_days)
+        counts = acc.successes.counts
+        return cls(
+            budget=int(budget),
+            initial_k=int(initial_k),
+            n_days=acc.n_days,
+            mean_successes=acc.successes.mean(),
+            std_successes=float(np.sqrt(acc.successes.variance())),
+            p_no_success=(counts[0] if counts else 0) / n,
+            successes_quantiles=tuple(acc.successes.quantile(q) for q in DEFAULT_QUANTILES),
+            mean_leftover=acc.leftover.mean(),
+            leftover_quantiles=tuple(acc.leftover.quantile(q) for q in DEFAULT_QUANTILES),
+            runs_per_day=acc.runs / n,
+            cut_runs_per_day=acc.cut_runs / n,
+            abandoned_energy_per_day=acc.abandoned_energy / n,
+            resets_per_day=acc.resets / n,
+            successes=acc.successes,
+            leftover=acc.leftover,
+        )
+
+    def distribution_table(self) -> str:
+        """P(successes per day == s) for every observed s."""
+        total = max(1, self.successes.total)
+        lines = [f"{'successes':>10}{'days':>12}{'P':>10}{'P(>=)':>10}"]
+        at_least = 1.0
+        for s, c in enumerate(self.successes.counts):
+            if c:
+                lines.append(f"{s:10d}{c:12d}{c / total:10.4f}{at_least:10.4f}")
+            at_least -= c / total
+        return "\n".join(lines)
+
+    def __str__(self) -> str:
+        qs = "/".join(f"P{q * 100:g}" for q in DEFAULT_QUANTILES)
+        lines = [
+            f"Days: {self.n_days} | budget={self.budget} | k={self.initial_k}",
+            f"Mean successes per day: {self.mean_successes:.3f} "
+            f"(sd {self.std_successes:.3f})",
+            f"P(no success in a day): {self.p_no_success:.6f}",
+            f"Successes per day {qs}: "
+            + " / ".join(f"{v:g}" for v in self.successes_quantiles),
+            "",
+            f"Mean leftover energy: {self.mean_leftover:.3f}",
+            f"Leftover energy {qs}: " + " / ".join(f"{v:g}" for v in self.leftover_quantiles),
+            "",
+            f"Runs per day: {self.runs_per_day:.3f}",
+            f"Runs cut short per day: {self.cut_runs_per_day:.3f}",
+            f"Energy lost in cut runs per day: {self.abandoned_energy_per_day:.3f}",
+            f"Resets per day: {self.resets_per_day:.3f}",
+        ]
+        return "\n".join(lines)
+
+
+def run_renewal(
+    *,
+    config: TrialConfig,
+    rules: Rules,
+    budget: int,
+    n_days: int,
+    seed: int | None = None,
+) -> RenewalSummary:
+    """Simulate n_days budgeted days and summarize them.
+
+    Args:
+        config: Trial configuration (initial_k is rebuilt every run).
+        rules: Rules.
+        budget: Energy available per day.
+        n_days: Number of days.
+        seed: RNG seed. None uses fresh OS entropy.
+
+    Returns:
+        RenewalSummary.
+    """
+    table = ProbabilityTable.build(config)
+    root = root_seed_sequence(seed)
+    acc = RenewalAccumulator()
+    for block, size in iter_blocks(n_days):
+        acc.merge(
+            simulate_days(
+                config=config,
+                rules=rules,
+                budget=budget,
+                rng=block_rng(root, block),
+                n_days=size,
+                table=table,
+            )
+        )
+    return RenewalSummary.from_accumulator(acc, budget=budget, initial_k=config.initial_k)
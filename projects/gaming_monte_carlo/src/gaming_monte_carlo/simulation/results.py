@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass, fields
+from typing import overload
+
+import numpy as np
+
+_ITER_SLICE = 65_536
+
+
+@dataclass(frozen=True, slots=True)
+class TrialResult:
+    """Outcome of a single run (one run ends at success or k <= 0)."""
+
+    success: bool
+    attempts: int
+    resets: int
+    energy_spent: int
+    k_final: int
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class TrialResults:
+    """Columnar outcomes of many runs (struct of arrays).
+
+    Row i across the columns is one TrialResult. Slicing returns views,
+    so engines can fill a preallocated container block by block.
+
+    Attributes:
+        success: bool array.
+        attempts: int32 array.
+        resets: int32 array.
+        energy_spent: int32 array.
+        k_final: int32 array.
+    """
+
+    success: np.ndarray
+    attempts: np.ndarray
+    resets: np.ndarray
+    energy_spent: np.ndarray
+    k_final: np.ndarray
+
+    @classmethod
+    def empty(cls, n_trials: int) -> TrialResults:
+        """Preallocate zeroed columns for n_trials runs."""
+        n = max(0, int(n_trials))
+        return cls(
+            success=np.zeros(n, dtype=bool),
+            attempts=np.zeros(n, dtype=np.int32),
+            resets=np.zeros(n, dtype=np.int32),
+            energy_spent=np.zeros(n, dtype=np.int32),
+            k_final=np.zeros(n, dtype=np.int32),
+        )
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[TrialResult]) -> TrialResults:
+        """Build columns from row objects (compatibility path)."""
+        rows = rows if isinstance(rows, Sequence) else list(rows)
+        n = len(rows)
+        return cls(
+            success=np.fromiter((r.success for r in rows), dtype=bool, count=n),
+            attempts=np.fromiter((r.attempts for r in rows), dtype=np.int32, count=n),
+            resets=np.fromiter((r.resets for r in rows), dtype=np.int32, count=n),
+            energy_spent=np.fromiter((r.energy_spent for r in rows), dtype=np.int32, count=n),
+            k_final=np.fromiter((r.k_final for r in rows), dtype=np.int32, count=n),
+        )
+
+    @classmethod
+    def concat(cls, parts: Iterable[TrialResults]) -> TrialResults:
+        """Concatenate several containers in order."""
+        parts = list(parts)
+        if not parts:
+            return cls.empty(0)
+        return cls(
+            **{
+                f.name: np.concatenate([getattr(p, f.name) for p in parts])
+                for f in fields(cls)
+            }
+        )
+
+    def assign(self, start: int, other: TrialResults) -> None:
+        """Copy `other` into rows [start, start + len(other))."""
+        stop = int(start) + len(other)
+        for f in fields(self):
+            getattr(self, f.name)[int(start) : stop] = getattr(other, f.name)
+
+    def row(self, i: int) -> TrialResult:
+        """Return row i as a TrialResult."""
+        return TrialResult(
+            success=bool(self.success[i]),
+            attempts=int(self.attempts[i]),
+            resets=int(self.resets[i]),
+            energy_spent=int(self.energy_spent[i]),
+            k_final=int(self.k_final[i]),
+        )
+
+    def __len__(self) -> int:
+        return int(self.success.shape[0])
+
+    @overload
+    def __getitem__(self, index: int) -> TrialResult: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> TrialResults: ...
+
+    def __getitem__(self, index: int | slice) -> TrialResult | TrialResults:
+        if isinstance(index, slice):
+            return TrialResults(
+                **{f.name: getattr(self, f.name)[index] for f in fields(self)}
+            )
+        return self.row(index)
+
+    def __iter__(self) -> Iterator[TrialResult]:
+        # Convert in slices so row iteration never doubles peak memory.
+        for start in range(0, len(self), _ITER_SLICE):
+            part = self[start : start + _ITER_SLICE]
+            columns = zip(
+                part.success.tolist(),
+                part.attempts.tolist(),
+                part.resets.tolist(),
+                part.energy_spent.tolist(),
+                part.k_final.tolist(),
+            )
+            for s, a, r, e, k in columns:
+                yield TrialResult(success=s, attempts=a, resets=r, energy_spent=e, k_final=k)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, TrialResults):
+            return NotImplemented
+        return all(
+            np.array_equal(getattr(self, f.name), getattr(other, f.name)) for f in fields(self)
+        )
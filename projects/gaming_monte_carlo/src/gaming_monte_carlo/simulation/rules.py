@@ -3,6 +3,8 @@ from __future__ import annotations
 import math
 from dataclasses import dataclass
 
+import numpy as np
+
 from gaming_monte_carlo.simulation.analysis import clamp01
 from gaming_monte_carlo.simulation.state import TrialConfig, TrialState
 
@@ -32,23 +34,30 @@ def attempt_cost(state: TrialState, rules: Rules) -> int:
     return int(rules.attempt_energy_cost)
 
 
+def _as_float(value: float | np.ndarray) -> float | np.ndarray:
+    """Convert a scalar to float, or an array to a float64 array."""
+    if isinstance(value, np.ndarray):
+        return value.astype(float, copy=False)
+    return float(value)
+
+
 def snail_success_chance(
     snail_level: int,
-    encouragement: float,
+    encouragement: float | np.ndarray,
     hole_bonus: float = 0.0,
-) -> float:
+) -> float | np.ndarray:
     """Compute snail success probability using your piecewise equation.
 
     Args:
         snail_level: Snail level (L). Piecewise boundary at 24.
-        encouragement: Encouragement value (E).
+        encouragement: Encouragement value (E), or an array of values.
         hole_bonus: Hole bonus percent (H), e.g. 12.5 for +12.5%.
 
     Returns:
-        Probability in [0.0, 1.0].
+        Probability in [0.0, 1.0], elementwise for array input.
     """
     l = float(snail_level)
-    e = float(encouragement)
+    e = _as_float(encouragement)
 
     hole_mult = 1.0 + float(hole_bonus) / 100.0
 
@@ -62,7 +71,10 @@ def snail_success_chance(
     return clamp01(base * hole_mult * enc_mult)
 
 
-def snail_reset_base_chance(snail_level: int, encouragement: float) -> float:
+def snail_reset_base_chance(
+    snail_level: int,
+    encouragement: float | np.ndarray,
+) -> float | np.ndarray:
     """Compute reset *base* probability using your piecewise equation.
 
     Important:
@@ -71,13 +83,13 @@ def snail_reset_base_chance(snail_level: int, encouragement: float) -> float:
 
     Args:
         snail_level: Snail level (L). Piecewise boundary at 24.
-        encouragement: Encouragement value (E).
+        encouragement: Encouragement value (E), or an array of values.
 
     Returns:
-        Probability in [0.0, 1.0].
+        Probability in [0.0, 1.0], elementwise for array input.
     """
     l = float(snail_level)
-    e = float(encouragement)
+    e = _as_float(encouragement)
 
     if snail_level > 24:
         numerator = math.pow(l - 24.0, 0.19) - 0.9
@@ -86,6 +98,11 @@ def snail_reset_base_chance(snail_level: int, encouragement: float) -> float:
         numerator = math.pow(l + 1.0, 0.07) - 1.0
         denom = 1.0 + (300.0 * e) / (100.0 + e) / 100.0
 
+    if isinstance(denom, np.ndarray):
+        with np.errstate(divide="ignore", invalid="ignore"):
+            raw = np.where(denom == 0.0, 0.0, numerator / denom)
+        return clamp01(np.maximum(0.0, raw))
+
     raw = 0.0 if denom == 0.0 else numerator / denom
     return clamp01(max(0.0, raw))
 
@@ -110,9 +127,9 @@ def p_reset_base(state: TrialState, config: TrialConfig) -> float:
 def real_reset_chance_per_attempt(
     *,
     snail_level: int,
-    encouragement: float,
+    encouragement: float | np.ndarray,
     hole_bonus: float = 0.0,
-) -> float:
+) -> float | np.ndarray:
     """Compute per-attempt probability of a reset event.
 
     With simulation order:
@@ -125,3 +142,57 @@ def real_reset_chance_per_attempt(
     ps = snail_success_chance(snail_level, encouragement, hole_bonus)
     pr_base = snail_reset_base_chance(snail_level, encouragement)
     return clamp01((1.0 - ps) * pr_base)
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class ProbabilityTable:
+    """Per-k probabilities for one (snail_level, hole_bonus) pair.
+
+    Probabilities depend only on (snail_level, k, hole_bonus), and k only
+    decays from initial_k, so every value an engine needs is computed
+    once here and indexed by k afterwards.
+
+    Attributes:
+        snail_level: Snail level the table was built for.
+        hole_bonus: Hole bonus percent the table was built for.
+        success: p_success at k = 0..max_k.
+        reset_base: p_reset_base at k = 0..max_k.
+        real_reset: Per-attempt reset probability at k = 0..max_k.
+    """
+
+    snail_level: int
+    hole_bonus: float
+    success: np.ndarray
+    reset_base: np.ndarray
+    real_reset: np.ndarray
+
+    @classmethod
+    def build(cls, config: TrialConfig, max_k: int | None = None) -> ProbabilityTable:
+        """Evaluate the rules for every k in one vectorized call each.
+
+        Args:
+            config: Trial configuration (snail level and hole bonus).
+            max_k: Highest k to cover. Defaults to config.initial_k.
+
+        Returns:
+            ProbabilityTable indexed by k.
+        """
+        top = max(0, int(config.initial_k if max_k is None else max_k))
+        ks = np.arange(top + 1, dtype=float)
+        level = int(config.snail_level)
+        hole_bonus = float(config.hole_bonus)
+
+        success = snail_success_chance(level, ks, hole_bonus)
+        reset_base = snail_reset_base_chance(level, ks)
+        return cls(
+            snail_level=level,
+            hole_bonus=hole_bonus,
+            success=success,
+            reset_base=reset_base,
+            real_reset=clamp01((1.0 - success) * reset_base),
+        )
+
+    @property
+    def max_k(self) -> int:
+        """Highest k covered by the table."""
+        return int(self.success.shape[0]) - 1
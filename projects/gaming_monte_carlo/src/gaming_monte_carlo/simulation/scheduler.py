@@ -0,0 +1,249 @@
+"""Parallel sweeps on one shared process pool.
+
+Every (job, chunk) work unit of a sweep goes to the same pool, and each
+unit reduces its blocks to a SummaryAccumulator in the worker. The
+pool's queue balances units across cores, and a job's accumulator is
+yielded as soon as its last chunk comes back. Accumulators hold exact
+integer sums, so a completed job is identical whatever order its chunks
+finish in.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Hashable, Iterator, Mapping, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+
+from gaming_monte_carlo.simulation.cache import SimulationCache, simulation_key
+from gaming_monte_carlo.simulation.distributions import OutcomeDistributions
+from gaming_monte_carlo.simulation.engine import TrialRunner, run_trials
+from gaming_monte_carlo.simulation.metrics import Interval, Summary, SummaryAccumulator
+from gaming_monte_carlo.simulation.parallel import (
+    chunk_block_ranges,
+    resolve_workers,
+    summarize_blocks,
+)
+from gaming_monte_carlo.simulation.rules import Rules
+from gaming_monte_carlo.simulation.state import TrialConfig
+from gaming_monte_carlo.simulation.streams import root_seed_sequence
+
+# How often the scheduler wakes to check for cancellation (seconds).
+_POLL_INTERVAL = 0.1
+
+# Work units kept in flight per worker. Units are submitted lazily, so a
+# grid with many jobs never queues (or has to cancel) all of them at once.
+_UNITS_PER_WORKER = 4
+
+
+@dataclass(frozen=True, slots=True)
+class KSweepResult:
+    """Summary of one k from a sweep.
+
+    Attributes:
+        k: initial_k.
+        summary: Summary over the trials that finished.
+        interval: expected_energy_per_success interval.
+        complete: False if the sweep stopped before every chunk of this k
+            finished (cancelled or out of time budget).
+        distributions: Per-run outcome histograms.
+    """
+
+    k: int
+    summary: Summary
+    interval: Interval
+    complete: bool
+    distributions: OutcomeDistributions
+
+
+def iter_sweep_accumulators(
+    jobs: Mapping[Hashable, tuple[TrialConfig, Rules]],
+    *,
+    n_trials: int,
+    seed: int | None = None,
+    workers: int | None = None,
+    chunk_size: int | None = None,
+    runner: TrialRunner = run_trials,
+    time_budget: float | None = None,
+    cancel: threading.Event | None = None,
+    cache: SimulationCache | None = None,
+) -> Iterator[tuple[Hashable, SummaryAccumulator, bool]]:
+    """Simulate every job on one shared pool, streaming accumulators.
+
+    Each job uses the same block layout and seed as `run_simulation`, so
+    a complete job matches a single run of its config with that seed.
+    Units are submitted job by job, so early jobs finish (and are
+    yielded) first.
+
+    When `cancel` is set or `time_budget` seconds have passed, queued
+    units are dropped and running units are allowed to finish (so the
+    budget can overrun by about one unit). Every job left unfinished
+    that has at least one chunk is then yielded as incomplete. Closing
+    the generator early also shuts the pool down.
+
+    With a cache (and a seed), cached jobs are yielded first without
+    touching the pool, and every job that completes is stored.
+
+    Args:
+        jobs: (config, rules) per job key.
+        n_trials: Trials per job.
+        seed: RNG seed. None uses fresh OS entropy.
+        workers: Worker processes. None uses every core.
+        chunk_size: Trials per work unit. None uses the parallel default.
+        runner: Per-block trial runner (must be picklable).
+        time_budget: Wall-clock budget in seconds. None means unlimited.
+        cancel: Event that stops the sweep when set.
+        cache: Result cache. None disables caching.
+
+    Yields:
+        (key, accumulator, complete) per job, in completion order.
+    """
+    cache_keys: dict[Hashable, str] = {}
+    if cache is not None and seed is not None:
+        misses: dict[Hashable, tuple[TrialConfig, Rules]] = {}
+        for key, (config, rules) in jobs.items():
+            cache_keys[key] = simulation_key(
+                config=config, rules=rules, n_trials=n_trials, seed=seed, runner=runner
+            )
+            hit = cache.get_accumulator(cache_keys[key])
+            if hit is None:
+                misses[key] = (config, rules)
+            else:
+                yield key, hit, True
+        jobs = misses
+
+    def finished(key: Hashable) -> tuple[Hashable, SummaryAccumulator, bool]:
+        if key in cache_keys:
+            cache.put_accumulator(cache_keys[key], accs[key])
+        return key, accs[key], True
+
+    entropy = root_seed_sequence(seed).entropy
+    ranges = chunk_block_ranges(n_trials, chunk_size)
+    deadline = None if time_budget is None else time.monotonic() + float(time_budget)
+
+    accs = {key: SummaryAccumulator() for key in jobs}
+    remaining = {key: len(ranges) for key in jobs}
+    if not ranges:
+        for key in jobs:
+            yield finished(key)
+        return
+
+    n_workers = resolve_workers(workers)
+    window = _UNITS_PER_WORKER * n_workers
+    units = ((key, start, stop) for key in jobs for start, stop in ranges)
+
+    pool = ProcessPoolExecutor(max_workers=n_workers)
+    owner: dict[Future[SummaryAccumulator], Hashable] = {}
+    try:
+        while True:
+            if (cancel is not None and cancel.is_set()) or _expired(deadline):
+                break
+            while len(owner) < window and (unit := next(units, None)) is not None:
+                key, start, stop = unit
+                config, rules = jobs[key]
+                future = pool.submit(
+                    summarize_blocks,
+                    runner=runner,
+                    config=config,
+                    rules=rules,
+                    n_trials=n_trials,
+                    entropy=entropy,
+                    start_block=start,
+                    stop_block=stop,
+                )
+                owner[future] = key
+            if not owner:
+                break
+
+            timeout = _POLL_INTERVAL if cancel is not None else None
+            if deadline is not None:
+                left = max(0.0, deadline - time.monotonic())
+                timeout = left if timeout is None else min(timeout, left)
+
+            done, _ = wait(owner, timeout=timeout, return_when=FIRST_COMPLETED)
+            for future in done:
+                key = owner.pop(future)
+                accs[key].merge(future.result())
+                remaining[key] -= 1
+                if remaining[key] == 0:
+                    yield finished(key)
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+    # Units that were already running when the sweep stopped still count.
+    for future, key in owner.items():
+        if future.cancelled() or future.exception() is not None:
+            continue
+        accs[key].merge(future.result())
+        remaining[key] -= 1
+        if remaining[key] == 0:
+            yield finished(key)
+
+    for key, left in remaining.items():
+        if left and accs[key].n_trials:
+            yield key, accs[key], False
+
+
+def iter_k_sweep(
+    *,
+    base_config: TrialConfig,
+    rules: Rules,
+    ks: Sequence[int],
+    n_trials: int,
+    seed: int | None = None,
+    workers: int | None = None,
+    chunk_size: int | None = None,
+    runner: TrialRunner = run_trials,
+    confidence: float = 0.95,
+    time_budget: float | None = None,
+    cancel: threading.Event | None = None,
+    cache: SimulationCache | None = None,
+) -> Iterator[KSweepResult]:
+    """Simulate every k on one shared pool, streaming per-k summaries.
+
+    See `iter_sweep_accumulators` for ordering, cancellation and the
+    time budget; a k that did not finish has complete=False.
+
+    Args:
+        base_config: Config providing snail level and hole bonus.
+        rules: Rules.
+        ks: initial_k values to sweep.
+        n_trials: Trials per k.
+        seed: RNG seed. None uses fresh OS entropy.
+        workers: Worker processes. None uses every core.
+        chunk_size: Trials per work unit. None uses the parallel default.
+        runner: Per-block trial runner (must be picklable).
+        confidence: Confidence level for intervals.
+        time_budget: Wall-clock budget in seconds. None means unlimited.
+        cancel: Event that stops the sweep when set.
+        cache: Result cache. None disables caching.
+
+    Yields:
+        KSweepResult per k, in completion order.
+    """
+    configs = {int(k): base_config.with_initial_k(k) for k in ks}
+    accumulators = iter_sweep_accumulators(
+        {k: (config, rules) for k, config in configs.items()},
+        n_trials=n_trials,
+        seed=seed,
+        workers=workers,
+        chunk_size=chunk_size,
+        runner=runner,
+        time_budget=time_budget,
+        cancel=cancel,
+        cache=cache,
+    )
+    for k, acc, complete in accumulators:
+        yield KSweepResult(
+            k=k,
+            summary=acc.to_summary(configs[k], rules),
+            interval=acc.energy_per_success_interval(confidence),
+            complete=complete,
+            distributions=acc.distributions,
+        )
+
+
+def _expired(deadline: float | None) -> bool:
+    """True once a monotonic deadline has passed."""
+    return deadline is not None and time.monotonic() >= deadline
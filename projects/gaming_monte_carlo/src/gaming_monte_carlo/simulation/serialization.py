@@ -0,0 +1,48 @@
+"""JSON helpers shared by checkpoints, shard files and trial exports.
+
+Each of those files describes a run by its TrialConfig and Rules, and
+is written to a temporary file and renamed into place, so a crash
+mid-write never leaves a truncated file behind.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any
+
+from gaming_monte_carlo.simulation.rules import Rules
+from gaming_monte_carlo.simulation.state import TrialConfig
+
+
+def run_to_dict(config: TrialConfig, rules: Rules) -> dict[str, Any]:
+    """JSON-ready {"config": ..., "rules": ...} (see `run_from_dict`)."""
+    return {"config": asdict(config), "rules": asdict(rules)}
+
+
+def run_from_dict(data: dict[str, Any]) -> tuple[TrialConfig, Rules]:
+    """Inverse of `run_to_dict`; extra keys in `data` are ignored."""
+    return TrialConfig(**data["config"]), Rules(**data["rules"])
+
+
+def write_json_atomic(path: Path, data: Any, *, indent: int | None = None) -> None:
+    """Write JSON atomically (temporary file, then rename).
+
+    Args:
+        path: Destination file. Parent directories are created.
+        data: JSON-ready object.
+        indent: Indentation. None writes compact JSON.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    separators = (",", ":") if indent is None else None
+    tmp = path.with_suffix(f"{path.suffix}.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(data, indent=indent, separators=separators), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def read_json(path: Path) -> Any:
+    """Read a JSON file written by `write_json_atomic`."""
+    return json.loads(Path(path).read_text(encoding="utf-8"))
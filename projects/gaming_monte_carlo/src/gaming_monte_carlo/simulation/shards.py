@@ -0,0 +1,325 @@
+"""Split one simulation into shards that run anywhere and merge exactly.
+
+A run of n_trials is laid out in stream blocks, each with its own child
+of the root SeedSequence (see `streams.py`). Shard i of K owns a
+contiguous range of those blocks, so its random numbers depend only on
+the seed and its block range, not on the machine that runs it or on the
+other shards. A shard writes a small JSON file holding its run
+description and integer SummaryAccumulator totals.
+
+`merge_shards` checks that the files describe the same run and cover
+every block exactly once, then adds them up. Accumulator totals are
+integers, so the merged Summary equals the one a single machine would
+produce with the same seed and engine, bit for bit.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from gaming_monte_carlo.simulation.backends import get_engine
+from gaming_monte_carlo.simulation.cache import code_version
+from gaming_monte_carlo.simulation.metrics import SummaryAccumulator
+from gaming_monte_carlo.simulation.parallel import resolve_workers, summarize_blocks
+from gaming_monte_carlo.simulation.rules import Rules
+from gaming_monte_carlo.simulation.serialization import (
+    read_json,
+    run_from_dict,
+    run_to_dict,
+    write_json_atomic,
+)
+from gaming_monte_carlo.simulation.state import TrialConfig
+from gaming_monte_carlo.simulation.streams import n_blocks
+
+FORMAT_VERSION = 1
+
+
+def shard_block_ranges(n_trials: int, n_shards: int) -> list[tuple[int, int]]:
+    """Split the stream blocks of a run into n_shards contiguous ranges.
+
+    Block counts differ by at most one between shards. When there are
+    more shards than blocks, the trailing shards are empty.
+
+    Returns:
+        List of (start_block, stop_block) ranges, one per shard.
+
+    Raises:
+        ValueError: If n_shards is not positive.
+    """
+    if int(n_shards) <= 0:
+        raise ValueError(f"n_shards must be positive, got {n_shards}")
+    total = n_blocks(n_trials)
+    per, extra = divmod(total, int(n_shards))
+    ranges = []
+    start = 0
+    for index in range(int(n_shards)):
+        stop = start + per + (index < extra)
+        ranges.append((start, stop))
+        start = stop
+    return ranges
+
+
+def shard_file_name(index: int, n_shards: int) -> str:
+    """Conventional file name of one shard, e.g. shard-003-of-016.json."""
+    width = max(3, len(str(n_shards)))
+    return f"shard-{index:0{width}d}-of-{n_shards:0{width}d}.json"
+
+
+@dataclass(frozen=True, slots=True)
+class ShardResult:
+    """Accumulated totals of one shard, plus the run it belongs to.
+
+    Attributes:
+        config: Trial configuration.
+        rules: Rules.
+        n_trials: Trials in the whole run (all shards).
+        seed: RNG seed of the whole run.
+        engine: Backend name.
+        code_version: Hash of the mechanics source (see
+            `cache.code_version`).
+        index: Shard index in [0, n_shards).
+        n_shards: Number of shards the run is split into.
+        start_block: First stream block of the shard (inclusive).
+        stop_block: Last stream block of the shard (exclusive).
+        accumulator: Totals over the shard's trials.
+    """
+
+    config: TrialConfig
+    rules: Rules
+    n_trials: int
+    seed: int
+    engine: str
+    code_version: str
+    index: int
+    n_shards: int
+    start_block: int
+    stop_block: int
+    accumulator: SummaryAccumulator
+
+    def run_key(self) -> tuple[Any, ...]:
+        """Fields every shard of the same run shares."""
+        return (
+            self.config,
+            self.rules,
+            self.n_trials,
+            self.seed,
+            self.engine,
+            self.code_version,
+            self.n_shards,
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON-ready shard (see `from_dict`)."""
+        return {
+            "format_version": FORMAT_VERSION,
+            **run_to_dict(self.config, self.rules),
+            "n_trials": self.n_trials,
+            "seed": self.seed,
+            "engine": self.engine,
+            "code_version": self.code_version,
+            "index": self.index,
+            "n_shards": self.n_shards,
+            "start_block": self.start_block,
+            "stop_block": self.stop_block,
+            "accumulator": self.accumulator.to_dict(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> ShardResult:
+        """Inverse of `to_dict`.
+
+        Raises:
+            ValueError: For an unsupported format version.
+        """
+        version = data.get("format_version")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"Unsupported shard format version {version!r}")
+        config, rules = run_from_dict(data)
+        return cls(
+            config=config,
+            rules=rules,
+            n_trials=int(data["n_trials"]),
+            seed=int(data["seed"]),
+            engine=str(data["engine"]),
+            code_version=str(data["code_version"]),
+            index=int(data["index"]),
+            n_shards=int(data["n_shards"]),
+            start_block=int(data["start_block"]),
+            stop_block=int(data["stop_block"]),
+            accumulator=SummaryAccumulator.from_dict(data["accumulator"]),
+        )
+
+    def save(self, path: Path) -> None:
+        """Write atomically (temporary file, then rename)."""
+        write_json_atomic(path, self.to_dict())
+
+    @classmethod
+    def load(cls, path: Path) -> ShardResult:
+        """Read a shard written by `save`."""
+        return cls.from_dict(read_json(path))
+
+
+def run_shard(
+    *,
+    config: TrialConfig,
+    rules: Rules,
+    n_trials: int,
+    seed: int,
+    n_shards: int,
+    index: int,
+    engine: str = "reference",
+) -> ShardResult:
+    """Simulate the blocks of one shard.
+
+    Args:
+        config: Trial configuration.
+        rules: Rules.
+        n_trials: Trials in the whole run.
+        seed: RNG seed of the whole run. Required: every shard must
+            derive its blocks from the same root.
+        n_shards: Number of shards.
+        index: Shard to run, in [0, n_shards).
+        engine: Registered backend name.
+
+    Returns:
+        The shard's totals.
+
+    Raises:
+        ValueError: If index is out of range.
+    """
+    if not 0 <= int(index) < int(n_shards):
+        raise ValueError(f"Shard index {index} is out of range for {n_shards} shards")
+    start, stop = shard_block_ranges(n_trials, n_shards)[int(index)]
+    runner = get_engine(engine).runner
+    acc = summarize_blocks(
+        runner=runner,
+        config=config,
+        rules=rules,
+        n_trials=n_trials,
+        entropy=int(seed),
+        start_block=start,
+        stop_block=stop,
+    )
+    return ShardResult(
+        config=config,
+        rules=rules,
+        n_trials=int(n_trials),
+        seed=int(seed),
+        engine=engine,
+        code_version=code_version(runner),
+        index=int(index),
+        n_shards=int(n_shards),
+        start_block=start,
+        stop_block=stop,
+        accumulator=acc,
+    )
+
+
+def _run_shard_to_file(directory: Path, **kwargs: Any) -> Path:
+    shard = run_shard(**kwargs)
+    path = Path(directory) / shard_file_name(shard.index, shard.n_shards)
+    shard.save(path)
+    return path
+
+
+def run_shards_locally(
+    directory: Path,
+    *,
+    config: TrialConfig,
+    rules: Rules,
+    n_trials: int,
+    seed: int,
+    n_shards: int,
+    indices: Iterable[int] | None = None,
+    engine: str = "reference",
+    workers: int | None = None,
+) -> list[Path]:
+    """Run shards in a local process pool and write their files.
+
+    A stand-in for running the same shards on separate machines: each
+    worker process does exactly what a remote `run_shard` would.
+
+    Args:
+        directory: Where shard files are written (see `shard_file_name`).
+        config: Trial configuration.
+        rules: Rules.
+        n_trials: Trials in the whole run.
+        seed: RNG seed of the whole run.
+        n_shards: Number of shards.
+        indices: Shards to run. None runs all of them.
+        engine: Registered backend name.
+        workers: Worker processes. None uses every core.
+
+    Returns:
+        Paths of the written shard files, in index order.
+    """
+    todo = range(int(n_shards)) if indices is None else sorted(set(indices))
+    n_workers = min(resolve_workers(workers), max(1, len(todo)))
+    with ProcessPoolExecutor(max_workers=n_workers) as pool:
+        futures = [
+            pool.submit(
+                _run_shard_to_file,
+                directory,
+                config=config,
+                rules=rules,
+                n_trials=n_trials,
+                seed=seed,
+                n_shards=n_shards,
+                index=index,
+                engine=engine,
+            )
+            for index in todo
+        ]
+        return [future.result() for future in futures]
+
+
+def merge_shards(shards: Sequence[ShardResult]) -> tuple[ShardResult, SummaryAccumulator]:
+    """Combine every shard of one run.
+
+    Args:
+        shards: One ShardResult per shard, in any order.
+
+    Returns:
+        (first shard, for the run description; merged accumulator).
+
+    Raises:
+        ValueError: If the shards belong to different runs, a shard is
+            missing or duplicated, or the block ranges do not match the
+            run's layout.
+    """
+    if not shards:
+        raise ValueError("No shards to merge")
+    first = shards[0]
+    for shard in shards[1:]:
+        if shard.run_key() != first.run_key():
+            raise ValueError(
+                f"Shard {shard.index} belongs to a different run: "
+                f"{shard.run_key()} != {first.run_key()}"
+            )
+
+    by_index = {}
+    for shard in shards:
+        if shard.index in by_index:
+            raise ValueError(f"Shard {shard.index} given more than once")
+        by_index[shard.index] = shard
+    missing = sorted(set(range(first.n_shards)) - set(by_index))
+    if missing:
+        raise ValueError(f"Missing shards {missing} of {first.n_shards}")
+
+    ranges = shard_block_ranges(first.n_trials, first.n_shards)
+    acc = SummaryAccumulator()
+    for index, (start, stop) in enumerate(ranges):
+        shard = by_index[index]
+        if (shard.start_block, shard.stop_block) != (start, stop):
+            raise ValueError(
+                f"Shard {index} covers blocks [{shard.start_block}, {shard.stop_block}), "
+                f"expected [{start}, {stop})"
+            )
+        acc.merge(shard.accumulator)
+    if acc.n_trials != first.n_trials:
+        raise ValueError(f"Shards hold {acc.n_trials} trials, expected {first.n_trials}")
+    return first, acc
@@ -17,6 +17,14 @@ class TrialConfig:
     initial_k: int
     hole_bonus: float = 0.0
 
+    def with_initial_k(self, initial_k: int) -> TrialConfig:
+        """Return a copy with updated starting encouragement."""
+        return TrialConfig(
+            snail_level=int(self.snail_level),
+            initial_k=int(initial_k),
+            hole_bonus=float(self.hole_bonus),
+        )
+
 
 @dataclass(frozen=True, slots=True)
 class TrialState:
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+
+import numpy as np
+from numpy.random import Generator, SeedSequence
+
+# Trials are laid out in fixed-size blocks, each with its own RNG stream.
+# The layout depends only on the seed and the trial index, never on how
+# blocks are grouped into chunks or spread across workers.
+STREAM_BLOCK_SIZE = 8_192
+
+
+def root_seed_sequence(seed: int | None) -> SeedSequence:
+    """Create the root SeedSequence for a simulation.
+
+    Args:
+        seed: User seed. None draws fresh OS entropy, which can be read
+            back from `SeedSequence.entropy` to replay the run.
+
+    Returns:
+        Root SeedSequence.
+    """
+    return SeedSequence(seed)
+
+
+def block_seed_sequence(root: SeedSequence, block: int) -> SeedSequence:
+    """Return the SeedSequence for one trial block.
+
+    This is identical to `root.spawn(n)[block]` for any n > block, but
+    can be computed directly so workers never spawn unused children.
+
+    Args:
+        root: Root SeedSequence.
+        block: Block index.
+
+    Returns:
+        Child SeedSequence for the block.
+    """
+    return SeedSequence(
+        root.entropy,
+        spawn_key=(*root.spawn_key, int(block)),
+        pool_size=root.pool_size,
+    )
+
+
+def block_rng(root: SeedSequence, block: int) -> Generator:
+    """Create the RNG used by one trial block.
+
+    Args:
+        root: Root SeedSequence.
+        block: Block index.
+
+    Returns:
+        NumPy Generator.
+    """
+    return np.random.default_rng(block_seed_sequence(root, block))
+
+
+def n_blocks(n_trials: int) -> int:
+    """Number of blocks needed to cover n_trials."""
+    return -(-max(0, int(n_trials)) // STREAM_BLOCK_SIZE)
+
+
+def iter_blocks(
+    n_trials: int, start_block: int = 0, stop_block: int | None = None
+) -> Iterator[tuple[int, int]]:
+    """Yield (block_index, trials_in_block) for a range of blocks.
+
+    Args:
+        n_trials: Total number of trials in the simulation.
+        start_block: First block (inclusive).
+        stop_block: Last block (exclusive). Defaults to all blocks.
+
+    Yields:
+        (block_index, trials_in_block). Only the final block may be short.
+    """
+    n = max(0, int(n_trials))
+    total = n_blocks(n)
+    stop = total if stop_block is None else min(total, int(stop_block))
+    for block in range(int(start_block), stop):
+        yield block, min(STREAM_BLOCK_SIZE, n - block * STREAM_BLOCK_SIZE)
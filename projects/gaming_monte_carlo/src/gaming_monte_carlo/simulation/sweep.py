@@ -0,0 +1,401 @@
+"""Grid sweeps over snail_level, hole_bonus, initial_k and attempt cost.
+
+Every cell of the Cartesian grid is one job on the shared pool (see
+`scheduler.iter_sweep_accumulators`), and every cell uses the same seed,
+so a cell's row equals a single seeded run of that config. Rows are
+tidy: one row per cell, with the cell parameters followed by every
+Summary field and the energy-per-success interval.
+
+Tables are written as CSV, NPZ or Parquet (Parquet needs pyarrow). CSV
+tables are appended row by row as cells finish, so a sweep that is
+stopped can be resumed: cells already present with the same seed,
+trial count, runner and code version are skipped.
+"""
+
+from __future__ import annotations
+
+import csv
+import itertools
+import threading
+from collections.abc import Collection, Iterable, Iterator
+from dataclasses import astuple, dataclass, fields
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from gaming_monte_carlo.simulation.cache import SimulationCache, code_version, runner_name
+from gaming_monte_carlo.simulation.engine import TrialRunner, run_trials
+from gaming_monte_carlo.simulation.metrics import Interval, Summary
+from gaming_monte_carlo.simulation.rules import Rules
+from gaming_monte_carlo.simulation.scheduler import iter_sweep_accumulators
+from gaming_monte_carlo.simulation.state import TrialConfig
+
+SWEEP_FORMATS = ("csv", "npz", "parquet")
+
+
+@dataclass(frozen=True, slots=True, order=True)
+class SweepCell:
+    """One point of a sweep grid.
+
+    Attributes:
+        snail_level: Snail level.
+        hole_bonus: Hole bonus percent.
+        initial_k: Starting encouragement.
+        attempt_energy_cost: Energy cost per attempt.
+    """
+
+    snail_level: int
+    hole_bonus: float
+    initial_k: int
+    attempt_energy_cost: int
+
+    def config(self) -> TrialConfig:
+        """TrialConfig for this cell."""
+        return TrialConfig(
+            snail_level=int(self.snail_level),
+            initial_k=int(self.initial_k),
+            hole_bonus=float(self.hole_bonus),
+        )
+
+    def rules(self) -> Rules:
+        """Rules for this cell."""
+        return Rules(attempt_energy_cost=int(self.attempt_energy_cost))
+
+
+@dataclass(frozen=True, slots=True)
+class SweepGrid:
+    """Cartesian grid of sweep parameters.
+
+    Attributes:
+        snail_levels: Snail levels.
+        hole_bonuses: Hole bonus percents.
+        initial_ks: Starting encouragement values.
+        attempt_energy_costs: Energy costs per attempt.
+    """
+
+    snail_levels: tuple[int, ...]
+    hole_bonuses: tuple[float, ...] = (0.0,)
+    initial_ks: tuple[int, ...] = (1,)
+    attempt_energy_costs: tuple[int, ...] = (5,)
+
+    def cells(self) -> list[SweepCell]:
+        """Every cell, with initial_k varying fastest."""
+        return [
+            SweepCell(
+                snail_level=int(level),
+                hole_bonus=float(bonus),
+                initial_k=int(k),
+                attempt_energy_cost=int(cost),
+            )
+            for level, bonus, cost, k in itertools.product(
+                self.snail_levels, self.hole_bonuses, self.attempt_energy_costs, self.initial_ks
+            )
+        ]
+
+    def __len__(self) -> int:
+        return (
+            len(self.snail_levels)
+            * len(self.hole_bonuses)
+            * len(self.initial_ks)
+            * len(self.attempt_energy_costs)
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class SweepRow:
+    """Result for one grid cell.
+
+    Attributes:
+        cell: Grid cell.
+        seed: Seed the cell was simulated with.
+        runner: Qualified name of the trial runner (see `runner_name`).
+        code_version: Source hash of the runner (see `code_version`).
+        summary: Summary over the cell's trials.
+        interval: expected_energy_per_success interval.
+        complete: False if the sweep stopped before the cell finished.
+    """
+
+    cell: SweepCell
+    seed: int
+    runner: str
+    code_version: str
+    summary: Summary
+    interval: Interval
+    complete: bool
+
+    def record(self) -> dict[str, Any]:
+        """Flat table row, in SWEEP_COLUMNS order."""
+        values = (
+            *astuple(self.cell),
+            self.seed,
+            self.runner,
+            self.code_version,
+            *astuple(self.summary),
+            self.interval.low,
+            self.interval.high,
+        )
+        return dict(zip(SWEEP_COLUMNS, values))
+
+
+_CELL_COLUMNS = tuple(f.name for f in fields(SweepCell))
+SWEEP_COLUMNS = (
+    *_CELL_COLUMNS,
+    "seed",
+    "runner",
+    "code_version",
+    *(f.name for f in fields(Summary)),
+    "energy_per_success_low",
+    "energy_per_success_high",
+)
+_INT_COLUMNS = frozenset(("snail_level", "initial_k", "attempt_energy_cost", "seed", "n_trials"))
+_STR_COLUMNS = frozenset(("runner", "code_version"))
+
+
+def run_grid_sweep(
+    *,
+    grid: SweepGrid,
+    n_trials: int,
+    seed: int,
+    workers: int | None = None,
+    chunk_size: int | None = None,
+    runner: TrialRunner = run_trials,
+    confidence: float = 0.95,
+    skip: Collection[SweepCell] = (),
+    time_budget: float | None = None,
+    cancel: threading.Event | None = None,
+    cache: SimulationCache | None = None,
+) -> Iterator[SweepRow]:
+    """Simulate every grid cell on one shared pool.
+
+    Args:
+        grid: Sweep grid.
+        n_trials: Trials per cell.
+        seed: RNG seed shared by every cell. Sweeps are always seeded so
+            that rows can be reproduced and resumed.
+        workers: Worker processes. None uses every core.
+        chunk_size: Trials per work unit. None uses the parallel default.
+        runner: Per-block trial runner (must be picklable).
+        confidence: Confidence level for intervals.
+        skip: Cells that are already computed.
+        time_budget: Wall-clock budget in seconds. None means unlimited.
+        cancel: Event that stops the sweep when set.
+        cache: Result cache. None disables caching.
+
+    Yields:
+        SweepRow per cell, in completion order.
+    """
+    skip = frozenset(skip)
+    jobs = {cell: (cell.config(), cell.rules()) for cell in grid.cells() if cell not in skip}
+    accumulators = iter_sweep_accumulators(
+        jobs,
+        n_trials=n_trials,
+        seed=seed,
+        workers=workers,
+        chunk_size=chunk_size,
+        runner=runner,
+        time_budget=time_budget,
+        cancel=cancel,
+        cache=cache,
+    )
+    name, version = runner_name(runner), code_version(runner)
+    for cell, acc, complete in accumulators:
+        config, rules = jobs[cell]
+        yield SweepRow(
+            cell=cell,
+            seed=int(seed),
+            runner=name,
+            code_version=version,
+            summary=acc.to_summary(config, rules),
+            interval=acc.energy_per_success_interval(confidence),
+            complete=complete,
+        )
+
+
+def sweep_format(path: Path) -> str:
+    """Table format implied by a file suffix.
+
+    Raises:
+        ValueError: For unknown suffixes, or Parquet without pyarrow.
+    """
+    fmt = path.suffix.lower().lstrip(".")
+    if fmt not in SWEEP_FORMATS:
+        raise ValueError(f"Unsupported sweep table format {path.suffix!r}; use {SWEEP_FORMATS}")
+    if fmt == "parquet":
+        _pyarrow()
+    return fmt
+
+
+def read_sweep_table(path: Path) -> list[dict[str, Any]]:
+    """Read a table written by `write_sweep_table` or `append_sweep_csv`.
+
+    Returns:
+        Rows as dicts keyed by SWEEP_COLUMNS. A missing file is empty.
+    """
+    if not path.exists():
+        return []
+
+    fmt = sweep_format(path)
+    if fmt == "csv":
+        with path.open(newline="", encoding="utf-8") as fh:
+            return [_typed_record(row) for row in csv.DictReader(fh)]
+    if fmt == "npz":
+        with np.load(path) as data:
+            columns = {name: data[name].tolist() for name in data.files}
+    else:
+        columns = _pyarrow_parquet().read_table(path).to_pydict()
+    n = len(columns[SWEEP_COLUMNS[0]])
+    return [_typed_record({name: values[i] for name, values in columns.items()}) for i in range(n)]
+
+
+def write_sweep_table(path: Path, records: Iterable[dict[str, Any]]) -> None:
+    """Write a full sweep table, one row per cell.
+
+    Later records for the same cell replace earlier ones, and rows are
+    sorted by cell.
+    """
+    by_cell = {_record_cell(r): r for r in records}
+    rows = [by_cell[cell] for cell in sorted(by_cell)]
+
+    fmt = sweep_format(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if fmt == "csv":
+        with path.open("w", newline="", encoding="utf-8") as fh:
+            writer = csv.DictWriter(fh, fieldnames=SWEEP_COLUMNS)
+            writer.writeheader()
+            writer.writerows(rows)
+        return
+
+    columns = {name: [r[name] for r in rows] for name in SWEEP_COLUMNS}
+    if fmt == "npz":
+        arrays = {name: np.asarray(values, dtype=_npz_dtype(name)) for name, values in columns.items()}
+        with path.open("wb") as fh:
+            np.savez(fh, **arrays)
+    else:
+        pa = _pyarrow()
+        _pyarrow_parquet().write_table(pa.table(columns), path)
+
+
+def append_sweep_csv(path: Path, records: Iterable[dict[str, Any]]) -> None:
+    """Append rows to a CSV sweep table, writing the header if new.
+
+    A table with an older header is rewritten with SWEEP_COLUMNS first.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    new = not path.exists() or path.stat().st_size == 0
+    if not new and _csv_header(path) != list(SWEEP_COLUMNS):
+        write_sweep_table(path, read_sweep_table(path))
+    with path.open("a", newline="", encoding="utf-8") as fh:
+        writer = csv.DictWriter(fh, fieldnames=SWEEP_COLUMNS)
+        if new:
+            writer.writeheader()
+        writer.writerows(records)
+
+
+def completed_cells(
+    records: Iterable[dict[str, Any]],
+    *,
+    n_trials: int,
+    seed: int,
+    runner: TrialRunner = run_trials,
+) -> set[SweepCell]:
+    """Cells whose rows already hold n_trials trials under `seed`.
+
+    Rows simulated by another runner, or by an older version of the
+    same runner's source, do not count as completed.
+    """
+    key = (int(n_trials), int(seed), runner_name(runner), code_version(runner))
+    return {
+        _record_cell(r)
+        for r in records
+        if (int(r["n_trials"]), int(r["seed"]), r["runner"], r["code_version"]) == key
+    }
+
+
+def parse_values(spec: str, cast: type[int] | type[float] = int) -> tuple[Any, ...]:
+    """Parse comma-separated values and start:stop[:step] ranges.
+
+    Ranges include stop.
+
+    Examples:
+        "1:5" -> (1, 2, 3, 4, 5)
+        "0:10:2.5,12" -> (0.0, 2.5, 5.0, 7.5, 10.0, 12.0)
+    """
+    values: list[Any] = []
+    for part in spec.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        bounds = part.split(":")
+        if len(bounds) == 1:
+            values.append(cast(bounds[0]))
+            continue
+        if len(bounds) > 3:
+            raise ValueError(f"Invalid range {part!r}; expected start:stop[:step]")
+        start, stop = cast(bounds[0]), cast(bounds[1])
+        step = cast(bounds[2]) if len(bounds) == 3 else cast(1)
+        if step <= 0:
+            raise ValueError(f"Range step must be positive in {part!r}")
+        n = int(round((stop - start) / step + 1e-9)) + 1
+        values.extend(cast(start + i * step) for i in range(max(0, n)))
+    if not values:
+        raise ValueError(f"No values in {spec!r}")
+    return tuple(dict.fromkeys(values))
+
+
+def _record_cell(record: dict[str, Any]) -> SweepCell:
+    """Grid cell of a table row."""
+    return SweepCell(
+        snail_level=int(record["snail_level"]),
+        hole_bonus=float(record["hole_bonus"]),
+        initial_k=int(record["initial_k"]),
+        attempt_energy_cost=int(record["attempt_energy_cost"]),
+    )
+
+
+def _typed_record(raw: dict[str, Any]) -> dict[str, Any]:
+    """Coerce a row read back from disk to ints, floats and strings.
+
+    Tables written before the runner columns existed read back with
+    empty runner and code_version, so their cells are recomputed.
+    """
+    record: dict[str, Any] = {}
+    for name in SWEEP_COLUMNS:
+        if name in _STR_COLUMNS:
+            record[name] = str(raw.get(name) or "")
+        elif name in _INT_COLUMNS:
+            record[name] = int(raw[name])
+        else:
+            record[name] = float(raw[name])
+    return record
+
+
+def _csv_header(path: Path) -> list[str]:
+    """Column names of a CSV sweep table."""
+    with path.open(newline="", encoding="utf-8") as fh:
+        return next(csv.reader(fh), [])
+
+
+def _npz_dtype(name: str) -> type[np.generic]:
+    """NumPy dtype of a sweep column in NPZ tables."""
+    if name in _STR_COLUMNS:
+        return np.str_
+    return np.int64 if name in _INT_COLUMNS else np.float64
+
+
+def _pyarrow() -> Any:
+    """Import pyarrow, which is only needed for Parquet tables."""
+    try:
+        import pyarrow
+    except ImportError as exc:
+        raise ValueError("Parquet sweep tables need pyarrow; use .csv or .npz") from exc
+    return pyarrow
+
+
+def _pyarrow_parquet() -> Any:
+    """Import pyarrow.parquet (see `_pyarrow`)."""
+    _pyarrow()
+    import pyarrow.parquet
+
+    return pyarrow.parquet
+
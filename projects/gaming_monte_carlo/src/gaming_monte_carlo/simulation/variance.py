@@ -0,0 +1,273 @@
+"""Variance reduction for expected_energy_per_success.
+
+Two opt-in techniques, usable alone or together. Neither replaces
+simulation with a closed form: every roll is still sampled from the
+seeded stream.
+
+Antithetic pairs:
+    Each stream block draws half as many uniform rows as trials and runs
+    the second half of the block from 1 - U (see
+    `engine.run_trials_from_uniforms`). An early success for one trial
+    of a pair makes a late success likely for its twin, so the pair
+    average varies less than two independent trials.
+
+Control variates:
+    Per trial, three quantities with an exactly known mean of zero are
+    derived from the result columns and the probability table:
+
+      - S - P(run succeeds), with P(run succeeds) = 1 - prod(1 - p_k),
+      - S - sum of p_success over the attempts made,
+      - resets - sum of p_reset_base over the failed attempts.
+
+    The last two are martingales (each roll minus its probability), so
+    they stay mean zero at the random stopping time. The ratio's
+    influence E - R * S is regressed on them and the fitted part is
+    removed from the estimate.
+
+The achieved variance reduction factor is the plain (iid) variance of
+the estimate over the same trials divided by the reduced variance: a
+factor of 4 gives the same precision with a quarter of the trials.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from gaming_monte_carlo.simulation.analysis import run_success_probability
+from gaming_monte_carlo.simulation.distributions import OutcomeDistributions
+from gaming_monte_carlo.simulation.engine import run_trials_from_uniforms, uniform_row_width
+from gaming_monte_carlo.simulation.metrics import Interval, Summary, SummaryAccumulator
+from gaming_monte_carlo.simulation.results import TrialResults
+from gaming_monte_carlo.simulation.rules import ProbabilityTable, Rules
+from gaming_monte_carlo.simulation.state import TrialConfig
+from gaming_monte_carlo.simulation.streams import block_rng, iter_blocks, root_seed_sequence
+
+VARIANCE_REDUCTION_MODES = ("antithetic", "control", "both")
+
+# Columns per unit: energy, success, then the control variates.
+_N_CONTROLS = 3
+_WIDTH = 2 + _N_CONTROLS
+
+
+def control_variates(results: TrialResults, table: ProbabilityTable, initial_k: int) -> np.ndarray:
+    """Zero-mean control variates for every trial in a block.
+
+    Attempt j (1-based) is made at k = initial_k - j + 1, and its
+    failure decays k to initial_k - j before the reset roll, so the
+    probabilities of every roll a trial made follow from its attempts
+    and success columns alone.
+
+    Args:
+        results: Trials run from `config.with_initial_k(initial_k)`.
+        table: Probability table covering initial_k.
+        initial_k: Starting k of the trials.
+
+    Returns:
+        Array of shape (len(results), 3), one column per control.
+    """
+    k0 = int(initial_k)
+    # Rolls in attempt order: attempt j succeeds with success[k0 - j + 1]
+    # and, after failing, resets with reset_base[k0 - j].
+    success_p = np.concatenate([[0.0], np.cumsum(table.success[k0:0:-1])])
+    reset_p = np.concatenate([[0.0], np.cumsum(table.reset_base[:k0][::-1])])
+    run_p = run_success_probability(table.success, k0)
+
+    s = results.success.astype(float)
+    failed_attempts = results.attempts - results.success
+    return np.column_stack(
+        [
+            s - run_p,
+            s - success_p[results.attempts],
+            results.resets - reset_p[failed_attempts],
+        ]
+    )
+
+
+@dataclass(slots=True)
+class UnitMomentAccumulator:
+    """Running moments of (energy, success, controls) per sampling unit.
+
+    A unit is one trial, or one antithetic pair (its two trials summed).
+    Units are independent, so the delta-method variance of the ratio is
+    computed over units rather than trials.
+    """
+
+    n_units: int = 0
+    sums: np.ndarray = field(default_factory=lambda: np.zeros(_WIDTH))
+    cross: np.ndarray = field(default_factory=lambda: np.zeros((_WIDTH, _WIDTH)))
+
+    def update(self, units: np.ndarray) -> UnitMomentAccumulator:
+        """Add rows of (energy, success, control_1, control_2, control_3).
+
+        Returns:
+            self, for chaining.
+        """
+        self.n_units += int(units.shape[0])
+        self.sums += units.sum(axis=0)
+        self.cross += units.T @ units
+        return self
+
+    def merge(self, other: UnitMomentAccumulator) -> UnitMomentAccumulator:
+        """Add another accumulator's moments into this one.
+
+        Returns:
+            self, for chaining.
+        """
+        self.n_units += other.n_units
+        self.sums += other.sums
+        self.cross += other.cross
+        return self
+
+    def ratio_interval(self, *, controls: bool, confidence: float = 0.95) -> Interval:
+        """Interval for expected_energy_per_success.
+
+        The estimate is R = mean(E) / mean(S) over units and, with
+        psi = E - R * S, Var(R) ~= Var(psi) / (m * mean(S)^2).
+
+        With controls C, mean(E) and mean(S) are each replaced by their
+        regression-adjusted means mean(X) - beta_X . mean(C) before the
+        ratio is taken, and psi by its residual after regression on C.
+        Adjusting the two means separately keeps the estimate exact
+        when E and S are linear in the controls, which a single
+        adjustment of the ratio does not.
+
+        Args:
+            controls: Apply the control-variate adjustment.
+            confidence: Confidence level.
+
+        Returns:
+            Interval (infinite when there are no successes).
+        """
+        m = self.n_units
+        mean = self.sums / m if m else self.sums
+        if controls and m:
+            c_bar = mean[2:]
+            cov_c = self.cross[2:, 2:] / m - np.outer(c_bar, c_bar)
+            cov_xc = self.cross[:2, 2:] / m - np.outer(mean[:2], c_bar)
+            beta = np.linalg.lstsq(cov_c, cov_xc.T, rcond=None)[0].T
+            e_bar, s_bar = mean[:2] - beta @ c_bar
+        else:
+            e_bar, s_bar = mean[:2]
+        if m == 0 or s_bar <= 0.0:
+            inf = float("inf")
+            return Interval(
+                estimate=inf, std_error=inf, low=inf, high=inf, confidence=float(confidence)
+            )
+
+        r = float(e_bar / s_bar)
+        # psi = E - R * S, as a linear form on the unit columns.
+        weights = np.zeros(_WIDTH)
+        weights[0], weights[1] = 1.0, -r
+        if controls:
+            weights[2:] = -(beta[0] - r * beta[1])
+        centred = self.cross / m - np.outer(mean, mean)
+        var = max(0.0, float(weights @ centred @ weights)) * m / max(1, m - 1)
+        return Interval.normal(r, math.sqrt(var / m) / s_bar, confidence)
+
+
+@dataclass(frozen=True, slots=True)
+class VarianceReducedResult:
+    """Outcome of a variance-reduced simulation.
+
+    Attributes:
+        mode: "antithetic", "control" or "both".
+        summary: Plain Summary over every trial run.
+        interval: Variance-reduced interval for
+            expected_energy_per_success.
+        plain_std_error: Standard error of the plain estimate over the
+            same trials, treating them as independent.
+        n_trials: Trials run.
+        distributions: Per-run outcome histograms.
+    """
+
+    mode: str
+    summary: Summary
+    interval: Interval
+    plain_std_error: float
+    n_trials: int
+    distributions: OutcomeDistributions
+
+    @property
+    def variance_reduction(self) -> float:
+        """Plain variance divided by reduced variance."""
+        reduced = self.interval.std_error
+        if reduced == 0.0:
+            return float("inf")
+        return (self.plain_std_error / reduced) ** 2
+
+
+def run_simulation_variance_reduced(
+    *,
+    config: TrialConfig,
+    rules: Rules,
+    n_trials: int,
+    mode: str,
+    seed: int | None = None,
+    confidence: float = 0.95,
+) -> VarianceReducedResult:
+    """Simulate with antithetic pairs, control variates, or both.
+
+    Trials run from per-trial uniform rows (the stream of
+    `run_trials_from_uniforms`), one matrix per stream block. In the
+    antithetic modes n_trials is rounded up to an even number, so that
+    every block holds whole pairs.
+
+    Args:
+        config: Trial configuration.
+        rules: Rules.
+        n_trials: Number of trials.
+        mode: One of VARIANCE_REDUCTION_MODES.
+        seed: RNG seed. None uses fresh OS entropy.
+        confidence: Confidence level for intervals.
+
+    Returns:
+        VarianceReducedResult.
+    """
+    if mode not in VARIANCE_REDUCTION_MODES:
+        raise ValueError(
+            f"Unknown variance reduction mode {mode!r}; "
+            f"choose from {', '.join(VARIANCE_REDUCTION_MODES)}"
+        )
+    antithetic = mode in ("antithetic", "both")
+    n_trials = int(n_trials) + (int(n_trials) % 2 if antithetic else 0)
+
+    table = ProbabilityTable.build(config)
+    width = uniform_row_width(config.initial_k)
+    root = root_seed_sequence(seed)
+
+    plain = SummaryAccumulator()
+    units = UnitMomentAccumulator()
+    for block, size in iter_blocks(n_trials):
+        rng = block_rng(root, block)
+        if antithetic:
+            u = rng.random((size // 2, width))
+            uniforms = np.concatenate([u, 1.0 - u])
+        else:
+            uniforms = rng.random((size, width))
+        out = TrialResults.empty(size)
+        run_trials_from_uniforms(config=config, rules=rules, uniforms=uniforms, out=out)
+        plain.update(out)
+
+        x = np.column_stack(
+            [
+                out.energy_spent.astype(float),
+                out.success.astype(float),
+                control_variates(out, table, config.initial_k),
+            ]
+        )
+        if antithetic:
+            # Row i and row i + size // 2 are twins; a pair is one unit.
+            x = x[: size // 2] + x[size // 2 :]
+        units.update(x)
+
+    return VarianceReducedResult(
+        mode=mode,
+        summary=plain.to_summary(config, rules),
+        interval=units.ratio_interval(controls=mode != "antithetic", confidence=confidence),
+        plain_std_error=plain.energy_per_success_interval(confidence).std_error,
+        n_trials=n_trials,
+        distributions=plain.distributions,
+    )
@@ -0,0 +1,162 @@
+"""Per-phase wall/CPU timing for CLI runs.
+
+A `PhaseTimer` records one `PhaseRecord` per `with timer.phase(...)`
+block. A disabled timer hands out one shared no-op context, so leaving
+the instrumentation in the hot loops costs a method call and a
+throwaway record.
+
+CPU time includes reaped child processes (`os.times`), so a phase that
+runs and shuts down a process pool reports the pool's CPU too.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from collections.abc import Iterator
+from contextlib import AbstractContextManager, contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+
+@dataclass(slots=True)
+class PhaseRecord:
+    """Timing of one phase.
+
+    Attributes:
+        name: Phase name, e.g. "simulate".
+        k: initial_k the phase ran for, if any.
+        trials: Trials simulated in the phase (0 if none, e.g. a cache
+            hit).
+        start: Wall-clock start, seconds since the timer was created.
+        wall: Wall time in seconds.
+        cpu: CPU time in seconds (this process plus reaped children).
+    """
+
+    name: str
+    k: int | None = None
+    trials: int = 0
+    start: float = 0.0
+    wall: float = 0.0
+    cpu: float = 0.0
+
+    @property
+    def trials_per_second(self) -> float:
+        """Simulated trials per wall second (0 when not applicable)."""
+        if self.trials <= 0 or self.wall <= 0.0:
+            return 0.0
+        return self.trials / self.wall
+
+
+@dataclass(slots=True)
+class PhaseTimer:
+    """Collects PhaseRecords for a run.
+
+    Attributes:
+        enabled: When False, `phase` records nothing.
+        records: Finished phases, in completion order.
+    """
+
+    enabled: bool = True
+    records: list[PhaseRecord] = field(default_factory=list)
+    _origin: float = field(default_factory=time.perf_counter)
+
+    def phase(
+        self, name: str, *, k: int | None = None, trials: int = 0
+    ) -> AbstractContextManager[PhaseRecord]:
+        """Time a block. The yielded record's `trials` may be set in it.
+
+        Usage:
+            with timer.phase("simulate", k=k) as rec:
+                ...
+                rec.trials = n
+        """
+        if not self.enabled:
+            return _NULL_PHASE
+        return self._timed(PhaseRecord(name=name, k=k, trials=int(trials)))
+
+    @contextmanager
+    def _timed(self, record: PhaseRecord) -> Iterator[PhaseRecord]:
+        cpu0 = _cpu_seconds()
+        wall0 = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record.wall = time.perf_counter() - wall0
+            record.cpu = _cpu_seconds() - cpu0
+            record.start = wall0 - self._origin
+            self.records.append(record)
+
+    def report(self) -> str:
+        """Plain-text table of every phase plus a total row."""
+        lines = [
+            f"{'phase':<12} {'k':>4} {'trials':>12} {'wall_s':>10} {'cpu_s':>10} {'trials/s':>12}"
+        ]
+        for r in self.records:
+            k = "-" if r.k is None else str(r.k)
+            rate = f"{r.trials_per_second:12.0f}" if r.trials_per_second else f"{'-':>12}"
+            lines.append(
+                f"{r.name:<12} {k:>4} {r.trials:>12} {r.wall:>10.3f} {r.cpu:>10.3f} {rate}"
+            )
+        trials = sum(r.trials for r in self.records)
+        wall = sum(r.wall for r in self.records)
+        cpu = sum(r.cpu for r in self.records)
+        rate = f"{trials / wall:12.0f}" if trials and wall > 0.0 else f"{'-':>12}"
+        lines.append(f"{'total':<12} {'':>4} {trials:>12} {wall:>10.3f} {cpu:>10.3f} {rate}")
+        return "\n".join(lines)
+
+    def chrome_trace(self) -> dict[str, Any]:
+        """Phases as Chrome trace "complete" events.
+
+        Open the JSON in chrome://tracing or Perfetto.
+        """
+        pid = os.getpid()
+        events = []
+        for r in self.records:
+            args: dict[str, Any] = {"cpu_s": r.cpu, "trials": r.trials}
+            if r.k is not None:
+                args["k"] = r.k
+            events.append(
+                {
+                    "name": r.name if r.k is None else f"{r.name} k={r.k}",
+                    "cat": r.name,
+                    "ph": "X",
+                    "ts": r.start * 1e6,
+                    "dur": r.wall * 1e6,
+                    "pid": pid,
+                    "tid": 0,
+                    "args": args,
+                }
+            )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write_chrome_trace(self, path: Path) -> None:
+        """Write `chrome_trace()` as JSON."""
+        Path(path).write_text(json.dumps(self.chrome_trace()), encoding="utf-8")
+
+
+class _NullPhase:
+    """Reusable no-op context for disabled timers."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> PhaseRecord:
+        # A fresh record, so callers can set fields without sharing state.
+        return PhaseRecord(name="")
+
+    def __exit__(self, *exc: object) -> None:
+        return None
+
+
+_NULL_PHASE = _NullPhase()
+
+DISABLED = PhaseTimer(enabled=False)
+"""Shared timer that records nothing (the default everywhere)."""
+
+
+def _cpu_seconds() -> float:
+    """User + system CPU of this process and its reaped children."""
+    t = os.times()
+    return t.user + t.system + t.children_user + t.children_system
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from gaming_monte_carlo.simulation.adaptive import run_simulation_adaptive
+from gaming_monte_carlo.simulation.engine import run_simulation, run_trials_vectorized
+from gaming_monte_carlo.simulation.metrics import summarize_results
+from gaming_monte_carlo.simulation.rules import Rules
+from gaming_monte_carlo.simulation.state import TrialConfig
+
+
+def test_adaptive_stops_early_and_matches_fixed_prefix() -> None:
+    config = TrialConfig(snail_level=31, initial_k=10)
+    rules = Rules()
+
+    result = run_simulation_adaptive(
+        config=config,
+        rules=rules,
+        rel_tol=0.01,
+        max_trials=1_000_000,
+        seed=42,
+        runner=run_trials_vectorized,
+    )
+
+    assert result.converged
+    assert result.n_trials < 1_000_000
+    assert result.interval.relative_half_width <= 0.01
+    assert result.interval.low < result.summary.expected_energy_per_success < result.interval.high
+
+    fixed = run_simulation(
+        config=config,
+        rules=rules,
+        n_trials=result.n_trials,
+        seed=42,
+        runner=run_trials_vectorized,
+    )
+    assert summarize_results(fixed, config, rules) == result.summary
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import pytest
+from numpy.random import Generator
+
+from gaming_monte_carlo.simulation import backends
+from gaming_monte_carlo.simulation.backends import _chi2_sf, check_equivalence, register_engine
+from gaming_monte_carlo.simulation.engine import run_simulation, run_trials_vectorized
+from gaming_monte_carlo.simulation.results import TrialResults
+from gaming_monte_carlo.simulation.rules import Rules
+from gaming_monte_carlo.simulation.state import TrialConfig
+
+CONFIG = TrialConfig(snail_level=31, initial_k=8, hole_bonus=12.5)
+
+
+def _easier_vectorized(
+    *, config: TrialConfig, rules: Rules, rng: Generator, out: TrialResults
+) -> None:
+    """A subtly wrong engine: acts as if the snail were 3 levels lower."""
+    easier = TrialConfig(config.snail_level - 3, config.initial_k, config.hole_bonus)
+    run_trials_vectorized(config=easier, rules=rules, rng=rng, out=out)
+
+
+def test_chi2_sf_matches_known_quantiles() -> None:
+    assert _chi2_sf(3.841459, 1) == pytest.approx(0.05, abs=1e-6)
+    assert _chi2_sf(18.307038, 10) == pytest.approx(0.05, abs=1e-6)
+
+
+def test_engine_argument_selects_backend() -> None:
+    rules = Rules()
+    by_name = run_simulation(
+        config=CONFIG, rules=rules, n_trials=1_000, seed=4, engine="vectorized"
+    )
+    by_runner = run_simulation(
+        config=CONFIG, rules=rules, n_trials=1_000, seed=4, runner=run_trials_vectorized
+    )
+    assert by_name == by_runner
+    with pytest.raises(ValueError):
+        run_simulation(config=CONFIG, rules=rules, n_trials=10, engine="nope")
+
+
+def test_equivalence_harness(monkeypatch: pytest.MonkeyPatch) -> None:
+    rules = Rules()
+    exact = check_equivalence(
+        "reference", "fast", config=CONFIG, rules=rules, n_trials=20_000, seed=1
+    )
+    assert exact.exact and exact.passed
+
+    statistical = check_equivalence(
+        "fast", "vectorized", config=CONFIG, rules=rules, n_trials=50_000, seed=1
+    )
+    assert not statistical.exact and statistical.passed
+
+    monkeypatch.setattr(backends, "_REGISTRY", dict(backends._REGISTRY))
+    register_engine("easier", _easier_vectorized, stream="vectorized")
+    broken = check_equivalence(
+        "fast", "easier", config=CONFIG, rules=rules, n_trials=50_000, seed=1
+    )
+    assert not broken.passed
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from gaming_monte_carlo.simulation.cache import SimulationCache, cached_accumulator, simulation_key
+from gaming_monte_carlo.simulation.engine import (
+    run_simulation,
+    run_trials,
+    run_trials_vectorized,
+)
+from gaming_monte_carlo.simulation.metrics import SummaryAccumulator
+from gaming_monte_carlo.simulation.rules import Rules
+from gaming_monte_carlo.simulation.state import TrialConfig
+
+
+def test_cache_round_trip_and_key_changes(tmp_path: Path) -> None:
+    config = TrialConfig(snail_level=31, initial_k=4)
+    rules = Rules()
+    cache = SimulationCache(tmp_path)
+    key = simulation_key(config=config, rules=rules, n_trials=1_000, seed=1, runner=run_trials)
+
+    assert cache.get_accumulator(key) is None
+    trials = run_simulation(config=config, rules=rules, n_trials=1_000, seed=1)
+    cache.put_trials(key, trials)
+    assert cache.get_trials(key) == trials
+    assert cache.get_accumulator(key) == SummaryAccumulator().update(trials)
+
+    other = [
+        simulation_key(config=config, rules=Rules(7), n_trials=1_000, seed=1, runner=run_trials),
+        simulation_key(config=config, rules=rules, n_trials=1_000, seed=2, runner=run_trials),
+        simulation_key(
+            config=config, rules=rules, n_trials=1_000, seed=1, runner=run_trials_vectorized
+        ),
+    ]
+    assert key not in other
+
+    calls: list[int] = []
+
+    def compute() -> SummaryAccumulator:
+        calls.append(1)
+        return SummaryAccumulator()
+
+    cached_accumulator(
+        cache,
+        config=config,
+        rules=rules,
+        n_trials=1_000,
+        seed=1,
+        runner=run_trials,
+        compute=compute,
+    )
+    assert calls == []
+
+
+def test_cache_evicts_least_recently_used(tmp_path: Path) -> None:
+    acc = SummaryAccumulator(n_trials=10, n_success=3)
+    # Room for four entries.
+    entry_size = len(json.dumps(acc.to_dict(), separators=(",", ":")))
+    cache = SimulationCache(tmp_path, max_bytes=4 * entry_size)
+    for key in ("a", "b", "c"):
+        cache.put_accumulator(key, acc)
+    cache.get_accumulator("a")
+    for key in ("d", "e", "f"):
+        cache.put_accumulator(key, acc)
+
+    assert cache.size_bytes() <= 4 * entry_size
+    assert cache.get_accumulator("a") == acc
+    assert cache.get_accumulator("b") is None
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from numpy.random import Generator
+
+from gaming_monte_carlo.simulation.cache import SimulationCache, simulation_key
+from gaming_monte_carlo.simulation.checkpoint import (
+    Checkpoint,
+    extend_accumulator,
+    extend_cached_accumulator,
+    run_simulation_checkpointed,
+)
+from gaming_monte_carlo.simulation.engine import (
+    TrialRunner,
+    run_simulation_streaming,
+    run_trials_fast,
+    run_trials_vectorized,
+)
+from gaming_monte_carlo.simulation.metrics import SummaryAccumulator
+from gaming_monte_carlo.simulation.results import TrialResults
+from gaming_monte_carlo.simulation.rules import Rules
+from gaming_monte_carlo.simulation.state import TrialConfig
+
+CONFIG = TrialConfig(snail_level=20, initial_k=6)
+
+
+def _crash_after(blocks: int | None) -> TrialRunner:
+    """run_trials_fast that raises after `blocks` blocks (None: never)."""
+    left = blocks
+
+    def flaky_runner(
+        *, config: TrialConfig, rules: Rules, rng: Generator, out: TrialResults
+    ) -> None:
+        nonlocal left
+        if left is not None:
+            if left == 0:
+                raise KeyboardInterrupt
+            left -= 1
+        run_trials_fast(config=config, rules=rules, rng=rng, out=out)
+
+    return flaky_runner
+
+
+def _fresh(n_trials: int, runner: TrialRunner = run_trials_fast) -> SummaryAccumulator:
+    return SummaryAccumulator().consume(
+        run_simulation_streaming(
+            config=CONFIG, rules=Rules(), n_trials=n_trials, seed=4, runner=runner
+        )
+    )
+
+
+def test_resume_after_crash_matches_uninterrupted_run(tmp_path: Path) -> None:
+    path = tmp_path / "run.json"
+    kwargs = dict(config=CONFIG, rules=Rules(), n_trials=50_000, path=path, every_seconds=0.0)
+
+    with pytest.raises(KeyboardInterrupt):
+        run_simulation_checkpointed(seed=4, runner=_crash_after(3), **kwargs)
+    assert Checkpoint.load(path).next_block == 3
+
+    with pytest.raises(ValueError, match="different seed"):
+        run_simulation_checkpointed(seed=5, runner=_crash_after(None), resume=True, **kwargs)
+    acc = run_simulation_checkpointed(seed=None, runner=_crash_after(None), resume=True, **kwargs)
+    assert acc == _fresh(50_000, runner=run_trials_fast)
+    assert Checkpoint.load(path).done
+
+    with pytest.raises(ValueError):
+        run_simulation_checkpointed(runner=run_trials_fast, resume=True, **kwargs)
+
+
+@pytest.mark.parametrize("runner", [run_trials_fast, run_trials_vectorized])
+def test_extend_matches_a_fresh_larger_run(runner: TrialRunner) -> None:
+    small = _fresh(20_000, runner)
+    before = small.to_dict()
+    extended = extend_accumulator(
+        small, config=CONFIG, rules=Rules(), extra_trials=30_000, seed=4, runner=runner
+    )
+    assert extended == _fresh(50_000, runner)
+    assert small.to_dict() == before
+
+
+def test_extend_cached_result(tmp_path: Path) -> None:
+    cache = SimulationCache(tmp_path)
+    key = dict(config=CONFIG, rules=Rules(), seed=4, runner=run_trials_fast)
+    cache.put_accumulator(simulation_key(n_trials=20_000, **key), _fresh(20_000))
+
+    acc = extend_cached_accumulator(cache, from_trials=20_000, n_trials=50_000, **key)
+    assert acc == _fresh(50_000)
+    assert cache.get_accumulator(simulation_key(n_trials=50_000, **key)) == acc
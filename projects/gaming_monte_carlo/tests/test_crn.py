@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+from gaming_monte_carlo.simulation.crn import run_crn_sweep
+from gaming_monte_carlo.simulation.rules import Rules
+from gaming_monte_carlo.simulation.state import TrialConfig
+
+
+def test_crn_sweep_is_deterministic_and_pairs_reduce_error() -> None:
+    base = TrialConfig(snail_level=20, initial_k=1)
+    kwargs = dict(base_config=base, rules=Rules(), ks=[3, 4, 5], n_trials=20_000, seed=9)
+
+    sweep = run_crn_sweep(**kwargs)
+    assert run_crn_sweep(**kwargs) == sweep
+
+    assert [d.k_b for d in sweep.deltas] == [4, 5]
+    for d in sweep.deltas:
+        expected = (
+            sweep.summaries[d.k_b].expected_energy_per_success
+            - sweep.summaries[d.k_a].expected_energy_per_success
+        )
+        assert abs(d.interval.estimate - expected) < 1e-9
+        assert d.interval.std_error < d.independent_std_error
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import math
+
+from gaming_monte_carlo.simulation.engine import (
+    run_simulation,
+    run_simulation_vectorized,
+    run_trials_fast,
+)
+from gaming_monte_carlo.simulation.metrics import summarize_results
+from gaming_monte_carlo.simulation.results import TrialResults
+from gaming_monte_carlo.simulation.rules import Rules, snail_success_chance
+from gaming_monte_carlo.simulation.state import TrialConfig
+
+
+def _run_success_probability(config: TrialConfig) -> float:
+    fail = 1.0
+    for k in range(1, config.initial_k + 1):
+        fail *= 1.0 - snail_success_chance(config.snail_level, float(k), config.hole_bonus)
+    return 1.0 - fail
+
+
+def test_vectorized_matches_reference_statistics() -> None:
+    config = TrialConfig(snail_level=31, initial_k=8)
+    rules = Rules()
+    n = 20_000
+
+    p = _run_success_probability(config)
+    tol = 5.0 * math.sqrt(p * (1.0 - p) / n)
+
+    for run in (run_simulation, run_simulation_vectorized):
+        results = run(config=config, rules=rules, n_trials=n)
+        assert len(results) == n
+        rate = sum(r.success for r in results) / n
+        assert abs(rate - p) < tol
+
+        for r in results:
+            assert r.energy_spent == 30 * config.initial_k + rules.attempt_energy_cost * r.attempts
+            assert r.resets <= r.attempts
+            if not r.success:
+                assert r.attempts == config.initial_k
+                assert r.k_final == 0
+
+
+def test_trial_results_row_views_round_trip() -> None:
+    config = TrialConfig(snail_level=31, initial_k=5)
+    rules = Rules()
+    results = run_simulation(config=config, rules=rules, n_trials=500, seed=3)
+
+    rows = list(results)
+    assert TrialResults.from_rows(rows) == results
+    assert results[10] == rows[10]
+    assert list(results[5:8]) == rows[5:8]
+    assert summarize_results(rows, config, rules) == summarize_results(results, config, rules)
+
+
+def test_fast_engine_matches_reference_exactly() -> None:
+    rules = Rules(attempt_energy_cost=7)
+    for config in (
+        TrialConfig(snail_level=31, initial_k=8, hole_bonus=12.5),
+        TrialConfig(snail_level=20, initial_k=19),
+        TrialConfig(snail_level=31, initial_k=0),
+    ):
+        reference = run_simulation(config=config, rules=rules, n_trials=20_000, seed=9)
+        fast = run_simulation(
+            config=config, rules=rules, n_trials=20_000, seed=9, runner=run_trials_fast
+        )
+        assert fast == reference
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from gaming_monte_carlo.simulation.engine import run_simulation
+from gaming_monte_carlo.simulation.export import (
+    MANIFEST_NAME,
+    TrialColumnWriter,
+    export_simulation,
+    open_trials,
+)
+from gaming_monte_carlo.simulation.metrics import summarize_results
+from gaming_monte_carlo.simulation.rules import Rules
+from gaming_monte_carlo.simulation.state import TrialConfig
+
+
+def test_export_round_trips_as_memory_mapped_trial_results(tmp_path: Path) -> None:
+    config = TrialConfig(snail_level=20, initial_k=6)
+    rules = Rules(attempt_energy_cost=7)
+    manifest = export_simulation(
+        tmp_path, config=config, rules=rules, n_trials=20_000, seed=8, engine="fast"
+    )
+
+    stored = open_trials(tmp_path)
+    assert stored.manifest == manifest
+    assert stored.manifest.config == config and stored.manifest.rules == rules
+    assert isinstance(stored.results.energy_spent, np.memmap)
+    assert not stored.results.energy_spent.flags.writeable
+
+    expected = run_simulation(config=config, rules=rules, n_trials=20_000, seed=8, engine="fast")
+    assert stored.results == expected
+    assert summarize_results(stored.results, config, rules) == summarize_results(
+        expected, config, rules
+    )
+
+
+def test_unseeded_export_records_replayable_entropy(tmp_path: Path) -> None:
+    config = TrialConfig(snail_level=20, initial_k=4)
+    manifest = export_simulation(tmp_path, config=config, rules=Rules(), n_trials=2_000)
+
+    assert manifest.seed is None
+    replay = run_simulation(config=config, rules=Rules(), n_trials=2_000, seed=manifest.entropy)
+    assert open_trials(tmp_path).results == replay
+
+
+def test_unfinished_export_has_no_manifest(tmp_path: Path) -> None:
+    config = TrialConfig(snail_level=20, initial_k=3)
+    block = run_simulation(config=config, rules=Rules(), n_trials=10, seed=1)
+
+    with pytest.raises(ValueError):
+        with TrialColumnWriter(
+            tmp_path, config=config, rules=Rules(), n_trials=20, seed=1, engine="reference"
+        ) as writer:
+            writer.write(block)
+            writer.close()
+
+    assert not (tmp_path / MANIFEST_NAME).exists()
+    with pytest.raises(FileNotFoundError):
+        open_trials(tmp_path)
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import math
+from dataclasses import fields
+
+import numpy as np
+
+from gaming_monte_carlo.simulation.analysis import run_success_probability
+from gaming_monte_carlo.simulation.engine import run_simulation
+from gaming_monte_carlo.simulation.importance import (
+    choose_tilt,
+    run_simulation_importance,
+    tilt_success,
+)
+from gaming_monte_carlo.simulation.metrics import SummaryAccumulator, WeightedSummaryAccumulator
+from gaming_monte_carlo.simulation.rules import ProbabilityTable, Rules
+from gaming_monte_carlo.simulation.state import TrialConfig
+
+
+def test_unit_weights_reproduce_the_plain_summary() -> None:
+    config = TrialConfig(snail_level=20, initial_k=6)
+    rules = Rules()
+    results = run_simulation(config=config, rules=rules, n_trials=5_000, seed=2)
+
+    plain = SummaryAccumulator().update(results)
+    weighted = WeightedSummaryAccumulator().update(results, np.ones(len(results)))
+
+    expected, actual = plain.to_summary(config, rules), weighted.to_summary(config, rules)
+    for f in fields(expected):
+        assert math.isclose(getattr(actual, f.name), getattr(expected, f.name), rel_tol=1e-12)
+    assert weighted.effective_sample_size == len(results)
+
+
+def test_tilted_runs_estimate_rare_success_with_fewer_trials() -> None:
+    config = TrialConfig(snail_level=47, initial_k=3)
+    rules = Rules()
+    table = ProbabilityTable.build(config)
+    p_run = run_success_probability(table.success, config.initial_k)
+    assert p_run < 0.05
+
+    tilt = choose_tilt(table, config.initial_k, 0.5)
+    tilted = run_success_probability(tilt_success(table.success, tilt), config.initial_k)
+    assert abs(tilted - 0.5) < 1e-9
+
+    result = run_simulation_importance(config=config, rules=rules, n_trials=40_000, seed=5)
+    summary = result.summary
+    assert result.tilt == tilt
+    assert summary.n_trials == 40_000
+    assert 0.0 < result.effective_sample_size < 40_000
+
+    exact_runs = 1.0 / p_run
+    assert abs(summary.expected_runs_per_success - exact_runs) < 0.05 * exact_runs
+    assert abs(summary.expected_energy_per_success - result.interval.estimate) < 1e-6
+
+    plain = SummaryAccumulator().update(
+        run_simulation(config=config, rules=rules, n_trials=40_000, seed=5)
+    )
+    assert result.interval.std_error < plain.energy_per_success_interval().std_error / 2
+
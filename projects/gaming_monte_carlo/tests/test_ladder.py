@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from gaming_monte_carlo.simulation.analysis import run_success_probability
+from gaming_monte_carlo.simulation.engine import run_trials_from_uniforms, uniform_row_width
+from gaming_monte_carlo.simulation.ladder import run_ladder_from_uniforms, run_ladder_sweep
+from gaming_monte_carlo.simulation.results import TrialResults
+from gaming_monte_carlo.simulation.rules import ProbabilityTable, Rules
+from gaming_monte_carlo.simulation.state import TrialConfig
+
+
+def test_every_k_is_a_suffix_of_the_largest_path() -> None:
+    base = TrialConfig(snail_level=40, initial_k=1)
+    rules = Rules(attempt_energy_cost=7)
+    ks = [0, 1, 2, 5, 9, 12]
+    width = uniform_row_width(max(ks))
+    uniforms = np.random.default_rng(3).random((2_000, width))
+
+    ladder = run_ladder_from_uniforms(base_config=base, rules=rules, ks=ks, uniforms=uniforms)
+    for k, results in zip(ks, ladder):
+        expected = TrialResults.empty(len(uniforms))
+        run_trials_from_uniforms(
+            config=base.with_initial_k(k),
+            rules=rules,
+            uniforms=uniforms[:, width - uniform_row_width(k) :],
+            out=expected,
+        )
+        assert results == expected
+
+
+def test_ladder_sweep_matches_exact_success_rates() -> None:
+    base = TrialConfig(snail_level=45, initial_k=1)
+    kwargs = dict(base_config=base, rules=Rules(), ks=range(1, 20), n_trials=40_000, seed=2)
+    sweep = run_ladder_sweep(**kwargs)
+    assert run_ladder_sweep(**kwargs) == sweep
+
+    table = ProbabilityTable.build(base, max_k=19)
+    for k, summary in sweep.summaries.items():
+        p = run_success_probability(table.success, k)
+        se = np.sqrt(p * (1 - p) / summary.n_trials)
+        assert abs(summary.success_rate - p) < 5 * se + 1e-12
+    for d in sweep.deltas:
+        assert d.interval.std_error < d.independent_std_error
+
+
+def test_ladder_sweep_rejects_empty_or_non_positive_ks() -> None:
+    base = TrialConfig(snail_level=45, initial_k=1)
+    for ks in ((), (0, 1, 2), (-3,)):
+        with pytest.raises(ValueError):
+            run_ladder_sweep(base_config=base, rules=Rules(), ks=ks, n_trials=10, seed=1)
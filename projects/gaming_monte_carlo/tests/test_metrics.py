@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+from dataclasses import fields
+
+import numpy as np
+
+from gaming_monte_carlo.simulation.engine import (
+    run_simulation,
+    run_simulation_streaming,
+    run_trials_vectorized,
+)
+from gaming_monte_carlo.simulation.metrics import Summary, SummaryAccumulator, summarize_results
+from gaming_monte_carlo.simulation.rules import Rules
+from gaming_monte_carlo.simulation.state import TrialConfig
+from gaming_monte_carlo.simulation.streams import STREAM_BLOCK_SIZE
+
+
+def test_streaming_accumulator_matches_full_summary() -> None:
+    config = TrialConfig(snail_level=31, initial_k=7)
+    rules = Rules()
+    n = 3 * STREAM_BLOCK_SIZE + 17
+
+    results = run_simulation(
+        config=config, rules=rules, n_trials=n, seed=11, runner=run_trials_vectorized
+    )
+    expected = summarize_results(results, config, rules)
+
+    blocks = run_simulation_streaming(
+        config=config, rules=rules, n_trials=n, seed=11, runner=run_trials_vectorized
+    )
+    streamed = SummaryAccumulator().consume(blocks)
+    assert streamed.to_summary(config, rules) == expected
+
+    merged = SummaryAccumulator().update(results[:1000])
+    merged.merge(SummaryAccumulator().update(results[1000:]))
+    assert merged == streamed
+
+
+def test_outcome_distributions_are_mergeable_and_match_chained_runs() -> None:
+    config = TrialConfig(snail_level=40, initial_k=6)
+    rules = Rules()
+    results = run_simulation(
+        config=config, rules=rules, n_trials=200_000, seed=2, runner=run_trials_vectorized
+    )
+    whole = SummaryAccumulator().update(results)
+    halves = SummaryAccumulator().update(results[:70_001])
+    halves.merge(SummaryAccumulator().update(results[70_001:]))
+    assert halves == whole
+    assert SummaryAccumulator.from_dict(whole.to_dict()) == whole
+
+    dist = whole.distributions
+    assert dist.attempts_fail.quantile(0.5) == config.initial_k
+    assert dist.attempts_success.total == whole.n_success
+
+    # Energy until success, measured directly by chaining runs up to each success.
+    ends = np.flatnonzero(results.success)
+    chained = np.add.reduceat(results.energy_spent, np.r_[0, ends[:-1] + 1])
+    expected = np.quantile(chained, [0.5, 0.9, 0.99], method="inverted_cdf")
+    computed = dist.energy_until_success_quantiles((0.5, 0.9, 0.99))
+    for got, want in zip(computed, expected):
+        assert abs(got - want) <= 0.02 * want
+
+
+def test_bootstrap_intervals_cover_every_summary_field() -> None:
+    config = TrialConfig(snail_level=40, initial_k=6)
+    rules = Rules()
+    results = run_simulation(
+        config=config, rules=rules, n_trials=100_000, seed=5, runner=run_trials_vectorized
+    )
+    acc = SummaryAccumulator().update(results)
+    summary = acc.to_summary(config, rules)
+    intervals = acc.field_intervals(config)
+
+    assert list(intervals.intervals) == [f.name for f in fields(Summary)]
+    for f in fields(Summary):
+        interval = intervals[f.name]
+        assert interval.estimate == getattr(summary, f.name)
+        assert interval.low <= interval.estimate <= interval.high
+
+    # The bootstrap agrees with the delta-method error of the ratio estimate.
+    delta = acc.energy_per_success_interval()
+    boot = intervals["expected_energy_per_success"]
+    assert abs(boot.std_error / delta.std_error - 1.0) < 0.15
+    assert intervals["mean_attempts_fail"].std_error == 0.0
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import math
+
+import numpy as np
+import pytest
+
+from gaming_monte_carlo.simulation.distributions import Histogram, OutcomeDistributions
+from gaming_monte_carlo.simulation.engine import run_simulation, run_trials_vectorized
+from gaming_monte_carlo.simulation.metrics import SummaryAccumulator
+from gaming_monte_carlo.simulation.objectives import (
+    Objective,
+    evaluate_objectives,
+    parse_objectives,
+)
+from gaming_monte_carlo.simulation.rules import Rules
+from gaming_monte_carlo.simulation.state import TrialConfig
+
+
+def _runs(
+    success_energy: int, fail_energy: int, n_success: int, n_fail: int
+) -> OutcomeDistributions:
+    dist = OutcomeDistributions()
+    dist.energy_success = Histogram().add(np.full(n_success, success_energy))
+    dist.energy_fail = Histogram().add(np.full(n_fail, fail_energy))
+    return dist
+
+
+def test_energy_until_success_statistics_are_exact_for_a_geometric_total() -> None:
+    # Every run costs 10 and succeeds with p = 1/2: T = 10 * Geometric(1/2).
+    energy = _runs(10, 10, 500, 500).energy_until_success()
+    assert energy.mean == pytest.approx(20.0)
+    assert energy.std == pytest.approx(math.sqrt(200.0))
+    assert energy.quantile(0.5) == 10.0
+    assert energy.quantile(0.9) == 40.0
+    assert energy.cdf(25) == pytest.approx(0.75)
+    assert energy.cdf(5) == pytest.approx(0.0, abs=1e-12)
+
+
+def test_objectives_pick_k_per_column_from_simulated_histograms() -> None:
+    objectives = parse_objectives("mean, p90, mean+2sd, budget:60")
+    assert [o.label for o in objectives] == ["mean", "P90", "mean+2sd", "P(E<=60)"]
+    with pytest.raises(ValueError):
+        parse_objectives("median")
+
+    base = TrialConfig(snail_level=40, initial_k=1)
+    distributions = {}
+    for k in (2, 4, 6):
+        results = run_simulation(
+            config=base.with_initial_k(k),
+            rules=Rules(),
+            n_trials=50_000,
+            seed=k,
+            runner=run_trials_vectorized,
+        )
+        acc = SummaryAccumulator().update(results)
+        distributions[k] = acc.distributions
+        energy = acc.distributions.energy_until_success()
+        summary = acc.to_summary(base.with_initial_k(k), Rules())
+        assert energy.mean == pytest.approx(summary.expected_energy_per_success)
+
+    table = evaluate_objectives(distributions, objectives)
+    for i, objective in enumerate(objectives):
+        column = {k: row[i] for k, row in table.values.items()}
+        pick = max if objective.maximize else min
+        assert table.best_k[i] == pick(column, key=column.get)
+    assert "best_k" in str(table)
+    assert evaluate_objectives(distributions).objectives[0] == Objective("mean")
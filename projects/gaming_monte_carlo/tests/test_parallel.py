@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from numpy.random import SeedSequence
+
+from gaming_monte_carlo.simulation.engine import run_simulation, run_trials_vectorized
+from gaming_monte_carlo.simulation.rules import Rules
+from gaming_monte_carlo.simulation.state import TrialConfig
+from gaming_monte_carlo.simulation.streams import STREAM_BLOCK_SIZE, block_seed_sequence
+
+
+def test_block_seed_sequence_matches_spawn() -> None:
+    root = SeedSequence(2024)
+    children = SeedSequence(2024).spawn(4)
+    for block, child in enumerate(children):
+        expected = child.generate_state(4)
+        assert (block_seed_sequence(root, block).generate_state(4) == expected).all()
+
+
+def test_parallel_results_do_not_depend_on_workers_or_chunks() -> None:
+    config = TrialConfig(snail_level=31, initial_k=6)
+    rules = Rules()
+    n = 2 * STREAM_BLOCK_SIZE + 123
+
+    serial = run_simulation(
+        config=config, rules=rules, n_trials=n, seed=7, runner=run_trials_vectorized
+    )
+    pooled = run_simulation(
+        config=config,
+        rules=rules,
+        n_trials=n,
+        seed=7,
+        workers=2,
+        chunk_size=1,
+        runner=run_trials_vectorized,
+    )
+
+    assert len(serial) == n
+    assert serial == pooled
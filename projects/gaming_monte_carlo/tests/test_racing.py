@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import pytest
+
+from gaming_monte_carlo.simulation.racing import race_best_k
+from gaming_monte_carlo.simulation.rules import Rules
+from gaming_monte_carlo.simulation.state import TrialConfig
+
+
+def test_race_drops_clearly_worse_k_and_saves_trials() -> None:
+    ks = range(1, 20)
+    cap = 100_000
+    race = race_best_k(
+        base_config=TrialConfig(snail_level=31, initial_k=1),
+        rules=Rules(attempt_energy_cost=200),
+        ks=ks,
+        seed=3,
+        max_trials_per_k=cap,
+    )
+
+    assert race.best_k in (4, 5)
+    assert race.best_k not in race.eliminated
+    assert {1, 10, 19} <= set(race.eliminated)
+    assert race.total_trials == sum(race.trials_by_k.values())
+    assert race.total_trials < len(ks) * cap / 2
+
+
+def test_race_rejects_an_empty_trial_budget() -> None:
+    kwargs = dict(base_config=TrialConfig(snail_level=31, initial_k=1), rules=Rules(), ks=[1, 2])
+    with pytest.raises(ValueError, match="max_trials_per_k"):
+        race_best_k(max_trials_per_k=0, **kwargs)
+    with pytest.raises(ValueError, match="initial_trials"):
+        race_best_k(initial_trials=0, **kwargs)
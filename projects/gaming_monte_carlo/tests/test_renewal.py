@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from gaming_monte_carlo.simulation.renewal import run_renewal, simulate_days
+from gaming_monte_carlo.simulation.rules import ProbabilityTable, Rules
+from gaming_monte_carlo.simulation.state import TrialConfig
+
+
+def test_certain_success_spends_the_budget_run_by_run() -> None:
+    # Success is clamped to 1, so every run costs exactly 30 * k + 5.
+    config = TrialConfig(snail_level=1, initial_k=4, hole_bonus=100.0)
+    summary = run_renewal(config=config, rules=Rules(), budget=1_000, n_days=10_000, seed=0)
+    assert summary.successes.counts[-1] == 10_000
+    assert summary.mean_successes == 1_000 // 125
+    assert summary.mean_leftover == 1_000 % 125
+    assert summary.cut_runs_per_day == 0.0
+    assert summary.resets_per_day == 0.0
+
+    short = run_renewal(config=config, rules=Rules(), budget=124, n_days=100, seed=0)
+    assert short.p_no_success == 1.0 and short.mean_leftover == 124 and short.runs_per_day == 0
+
+
+def test_renewal_matches_chained_reference_runs() -> None:
+    config = TrialConfig(snail_level=45, initial_k=6)
+    table = ProbabilityTable.build(config)
+
+    # Reference: chain attempt-by-attempt runs until the budget is spent.
+    rng = np.random.default_rng(7)
+    budget, expected, expected_resets = 1_500, [], []
+    for _ in range(20_000):
+        remaining, successes, resets = budget, 0, 0
+        while remaining >= 185:
+            remaining -= 180
+            for k in range(6, 0, -1):
+                if remaining < 5:
+                    break
+                remaining -= 5
+                if rng.random() < table.success[k]:
+                    successes += 1
+                    break
+                resets += rng.random() < table.reset_base[k - 1]
+        expected.append(successes)
+        expected_resets.append(resets)
+
+    acc = simulate_days(
+        config=config, rules=Rules(), budget=budget, rng=np.random.default_rng(1), n_days=200_000
+    )
+    assert acc.n_days == acc.successes.total == acc.leftover.total == 200_000
+    se = np.std(expected) / np.sqrt(len(expected))
+    assert abs(acc.successes.mean() - np.mean(expected)) < 5 * se
+    assert np.sqrt(acc.successes.variance()) == pytest.approx(np.std(expected), rel=0.03)
+    se = np.std(expected_resets) / np.sqrt(len(expected_resets))
+    assert abs(acc.resets / acc.n_days - np.mean(expected_resets)) < 5 * se
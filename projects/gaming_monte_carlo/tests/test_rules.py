@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import pytest
+
+from gaming_monte_carlo.simulation.analysis import encouragement_needed_for_success_chance
+from gaming_monte_carlo.simulation.rules import (
+    ProbabilityTable,
+    real_reset_chance_per_attempt,
+    snail_reset_base_chance,
+    snail_success_chance,
+)
+from gaming_monte_carlo.simulation.state import TrialConfig
+
+
+@pytest.mark.parametrize("snail_level", [5, 24, 25, 31, 45])
+def test_probability_table_matches_scalar_rules(snail_level: int) -> None:
+    config = TrialConfig(snail_level=snail_level, initial_k=30, hole_bonus=12.5)
+    table = ProbabilityTable.build(config)
+
+    assert table.max_k == 30
+    for k in range(table.max_k + 1):
+        assert table.success[k] == snail_success_chance(snail_level, float(k), 12.5)
+        assert table.reset_base[k] == snail_reset_base_chance(snail_level, float(k))
+        assert table.real_reset[k] == real_reset_chance_per_attempt(
+            snail_level=snail_level, encouragement=float(k), hole_bonus=12.5
+        )
+
+
+@pytest.mark.parametrize("desired", [0.0, 0.2, 0.3, 0.99])
+def test_encouragement_search_uses_table(desired: float) -> None:
+    config = TrialConfig(snail_level=31, initial_k=10)
+    table = ProbabilityTable.build(config)
+
+    def p_success_fn(level: int, e: float, hole_bonus: float) -> float:
+        return snail_success_chance(level, e, hole_bonus)
+
+    kwargs = dict(snail_level=31, desired_success=desired, hole_bonus=0.0, high=50)
+    expected = encouragement_needed_for_success_chance(p_success_fn=p_success_fn, **kwargs)
+    assert encouragement_needed_for_success_chance(
+        p_success_fn=p_success_fn, table=table, **kwargs
+    ) == expected
+
+    other = ProbabilityTable.build(TrialConfig(snail_level=31, initial_k=10, hole_bonus=5.0))
+    with pytest.raises(ValueError, match="hole_bonus"):
+        encouragement_needed_for_success_chance(p_success_fn=p_success_fn, table=other, **kwargs)
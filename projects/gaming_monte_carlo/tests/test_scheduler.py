@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import threading
+from typing import Any
+
+import pytest
+
+from gaming_monte_carlo.simulation.engine import run_simulation
+from gaming_monte_carlo.simulation.metrics import SummaryAccumulator
+from gaming_monte_carlo.simulation.rules import Rules
+from gaming_monte_carlo.simulation import scheduler
+from gaming_monte_carlo.simulation.scheduler import iter_k_sweep
+from gaming_monte_carlo.simulation.state import TrialConfig
+from gaming_monte_carlo.simulation.streams import STREAM_BLOCK_SIZE
+
+
+def test_k_sweep_matches_single_k_runs() -> None:
+    base = TrialConfig(snail_level=31, initial_k=1)
+    rules = Rules()
+    n = 2 * STREAM_BLOCK_SIZE + 17
+
+    results = list(
+        iter_k_sweep(
+            base_config=base,
+            rules=rules,
+            ks=[3, 4],
+            n_trials=n,
+            seed=5,
+            workers=2,
+            chunk_size=STREAM_BLOCK_SIZE,
+        )
+    )
+
+    assert sorted(r.k for r in results) == [3, 4]
+    for r in results:
+        config = base.with_initial_k(r.k)
+        serial = run_simulation(config=config, rules=rules, n_trials=n, seed=5)
+        assert r.complete
+        assert r.summary == SummaryAccumulator().update(serial).to_summary(config, rules)
+
+
+def test_cancelled_sweep_yields_only_partial_results(monkeypatch: pytest.MonkeyPatch) -> None:
+    cancel = threading.Event()
+    real_wait = scheduler.wait
+
+    def wait_then_cancel(*args: Any, **kwargs: Any) -> Any:
+        # Cancel as soon as the first chunk comes back.
+        done, pending = real_wait(*args, **kwargs)
+        if done:
+            cancel.set()
+        return done, pending
+
+    monkeypatch.setattr(scheduler, "wait", wait_then_cancel)
+    results = list(
+        iter_k_sweep(
+            base_config=TrialConfig(snail_level=31, initial_k=1),
+            rules=Rules(),
+            ks=[3, 4, 5],
+            n_trials=8 * STREAM_BLOCK_SIZE,
+            seed=5,
+            workers=1,
+            chunk_size=STREAM_BLOCK_SIZE,
+            cancel=cancel,
+        )
+    )
+
+    assert results
+    assert all(not r.complete for r in results)
+    assert all(0 < r.summary.n_trials < 8 * STREAM_BLOCK_SIZE for r in results)
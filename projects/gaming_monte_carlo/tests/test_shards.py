@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
+
+from gaming_monte_carlo.simulation.engine import run_simulation_streaming
+from gaming_monte_carlo.simulation.metrics import SummaryAccumulator
+from gaming_monte_carlo.simulation.rules import Rules
+from gaming_monte_carlo.simulation.shards import (
+    ShardResult,
+    merge_shards,
+    run_shard,
+    run_shards_locally,
+    shard_block_ranges,
+)
+from gaming_monte_carlo.simulation.state import TrialConfig
+
+CONFIG = TrialConfig(snail_level=20, initial_k=6)
+
+
+def test_shard_block_ranges_cover_every_block_once() -> None:
+    assert shard_block_ranges(10 * 8_192 + 1, 4) == [(0, 3), (3, 6), (6, 9), (9, 11)]
+    assert shard_block_ranges(8_192, 3) == [(0, 1), (1, 1), (1, 1)]
+    with pytest.raises(ValueError):
+        shard_block_ranges(100, 0)
+
+
+def test_merged_shards_equal_a_single_machine_run(tmp_path: Path) -> None:
+    kwargs = dict(config=CONFIG, rules=Rules(), n_trials=60_000, seed=11, engine="fast")
+    paths = run_shards_locally(tmp_path, n_shards=3, workers=2, **kwargs)
+    # A shard run "elsewhere" later is identical to the one run here.
+    paths.append(tmp_path / "extra.json")
+    run_shard(n_shards=5, index=4, **kwargs).save(paths[-1])
+
+    shards = [ShardResult.load(p) for p in paths[:3]]
+    first, acc = merge_shards(shards[::-1])
+    expected = SummaryAccumulator().consume(run_simulation_streaming(**kwargs))
+    assert acc == expected
+    assert acc.to_summary(first.config, first.rules) == expected.to_summary(CONFIG, Rules())
+
+    with pytest.raises(ValueError, match="different run"):
+        merge_shards(shards[:2] + [ShardResult.load(paths[-1])])
+    with pytest.raises(ValueError, match="Missing"):
+        merge_shards(shards[:2])
+    with pytest.raises(ValueError, match="more than once"):
+        merge_shards(shards + shards[:1])
+    with pytest.raises(ValueError, match="covers blocks"):
+        merge_shards(shards[:2] + [replace(shards[2], start_block=0)])
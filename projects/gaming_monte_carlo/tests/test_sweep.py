@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from gaming_monte_carlo.simulation.engine import run_simulation, run_trials_fast
+from gaming_monte_carlo.simulation.metrics import SummaryAccumulator
+from gaming_monte_carlo.simulation.sweep import (
+    SweepGrid,
+    completed_cells,
+    parse_values,
+    read_sweep_table,
+    run_grid_sweep,
+    write_sweep_table,
+)
+
+
+def test_parse_values_ranges_and_lists() -> None:
+    assert parse_values("1:4,7") == (1, 2, 3, 4, 7)
+    assert parse_values("0:10:2.5", float) == (0.0, 2.5, 5.0, 7.5, 10.0)
+    with pytest.raises(ValueError):
+        parse_values("1:4:0")
+
+
+def test_grid_sweep_rows_match_single_runs_and_resume(tmp_path: Path) -> None:
+    grid = SweepGrid(
+        snail_levels=(25, 31),
+        hole_bonuses=(0.0, 12.5),
+        initial_ks=(2,),
+        attempt_energy_costs=(5, 7),
+    )
+    n = 3_000
+    rows = list(run_grid_sweep(grid=grid, n_trials=n, seed=11, workers=2))
+
+    assert sorted(r.cell for r in rows) == sorted(grid.cells())
+    for row in rows:
+        config, rules = row.cell.config(), row.cell.rules()
+        serial = run_simulation(config=config, rules=rules, n_trials=n, seed=11)
+        assert row.summary == SummaryAccumulator().update(serial).to_summary(config, rules)
+
+    for name in ("table.csv", "table.npz"):
+        path = tmp_path / name
+        write_sweep_table(path, [r.record() for r in rows])
+        records = read_sweep_table(path)
+        assert records == sorted((r.record() for r in rows), key=lambda r: tuple(r.values())[:4])
+        assert completed_cells(records, n_trials=n, seed=11) == set(grid.cells())
+        assert completed_cells(records, n_trials=n, seed=12) == set()
+        assert completed_cells(records, n_trials=n, seed=11, runner=run_trials_fast) == set()
+
+    rest = run_grid_sweep(grid=grid, n_trials=n, seed=11, workers=1, skip=grid.cells()[1:])
+    assert [r.cell for r in rest] == grid.cells()[:1]
@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from gaming_monte_carlo.timing import DISABLED, PhaseTimer
+
+
+def test_phase_timer_records_and_disabled_timer_does_not() -> None:
+    timer = PhaseTimer()
+    with timer.phase("profile"):
+        pass
+    with timer.phase("simulate", k=3) as phase:
+        phase.trials = 1_000
+
+    assert [(r.name, r.k, r.trials) for r in timer.records] == [
+        ("profile", None, 0),
+        ("simulate", 3, 1_000),
+    ]
+    assert all(r.wall >= 0.0 for r in timer.records)
+    assert "total" in timer.report()
+
+    events = timer.chrome_trace()["traceEvents"]
+    assert [e["name"] for e in events] == ["profile", "simulate k=3"]
+    assert all(e["ph"] == "X" for e in events)
+
+    with DISABLED.phase("simulate", k=1) as phase:
+        phase.trials = 5
+    assert DISABLED.records == []
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from gaming_monte_carlo.simulation.engine import run_simulation
+from gaming_monte_carlo.simulation.rules import ProbabilityTable, Rules
+from gaming_monte_carlo.simulation.state import TrialConfig
+from gaming_monte_carlo.simulation.variance import (
+    VARIANCE_REDUCTION_MODES,
+    control_variates,
+    run_simulation_variance_reduced,
+)
+
+
+def _exact_energy_per_success(config: TrialConfig, rules: Rules) -> float:
+    ps = ProbabilityTable.build(config).success
+    k0 = config.initial_k
+    reach, attempts = 1.0, 0.0
+    for j in range(1, k0 + 1):
+        attempts += reach
+        reach *= 1.0 - ps[k0 - j + 1]
+    return (30 * k0 + rules.attempt_energy_cost * attempts) / (1.0 - reach)
+
+
+def test_control_variates_have_zero_mean() -> None:
+    config = TrialConfig(snail_level=30, initial_k=8)
+    results = run_simulation(config=config, rules=Rules(), n_trials=100_000, seed=3)
+    controls = control_variates(results, ProbabilityTable.build(config), config.initial_k)
+
+    se = controls.std(axis=0) / np.sqrt(len(results))
+    assert np.all(np.abs(controls.mean(axis=0)) < 5 * se)
+
+
+@pytest.mark.parametrize("mode", VARIANCE_REDUCTION_MODES)
+def test_modes_reduce_variance_and_cover_the_exact_ratio(mode: str) -> None:
+    config = TrialConfig(snail_level=20, initial_k=5)
+    rules = Rules()
+    kwargs = dict(config=config, rules=rules, n_trials=20_001, mode=mode, seed=4)
+
+    result = run_simulation_variance_reduced(**kwargs)
+    assert run_simulation_variance_reduced(**kwargs) == result
+    assert result.n_trials == (20_002 if mode != "control" else 20_001)
+    assert result.summary.n_trials == result.n_trials
+
+    assert result.variance_reduction > 1.0
+    exact = _exact_energy_per_success(config, rules)
+    assert abs(result.interval.estimate - exact) < 4 * result.interval.std_error